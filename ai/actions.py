@@ -6,6 +6,7 @@ dealing damage, collecting drops, placing camps, and related helpers.
 import random
 from data import *
 from engine import *
+from world.zones import make_zone_key
 
 
 class NpcAiActionsMixin:
@@ -38,8 +39,8 @@ class NpcAiActionsMixin:
         if actor is None or actor == 'player':
             return
         # Only play if on same screen as player
-        px_screen = f"{self.player.get('screen_x', 0)},{self.player.get('screen_y', 0)}"
-        npc_screen = f"{getattr(actor, 'screen_x', -1)},{getattr(actor, 'screen_y', -1)}"
+        px_screen = make_zone_key(self.player.get('screen_x', 0), self.player.get('screen_y', 0))
+        npc_screen = make_zone_key(getattr(actor, 'screen_x', -1), getattr(actor, 'screen_y', -1))
         if px_screen != npc_screen:
             return
         dist = abs(actor.x - self.player['x']) + abs(actor.y - self.player['y'])
@@ -224,8 +225,7 @@ class NpcAiActionsMixin:
                 if consume_items:
                     for item_name in consume_items:
                         if is_player:
-                            if self.inventory.has_item(item_name):
-                                self.inventory.remove_item(item_name, 1)
+                            if self.inventory.remove_item(item_name, 1):
                                 break
                         else:
                             if actor.inventory.get(item_name, 0) > 0:
@@ -353,6 +353,7 @@ class NpcAiActionsMixin:
             for item, amount in cost.items():
                 entity.inventory[item] -= amount
             screen['grid'][by][bx] = structure
+            self.invalidate_heal_boost_field(screen)
             # Initialize full structure interior for enterable structures
             if structure in ('HOUSE', 'STONE_HOUSE') and hasattr(self, 'generate_structure_zone'):
                 try:
@@ -517,7 +518,7 @@ class NpcAiActionsMixin:
             wx = GRID_WIDTH  // 2 + random.randint(-4, 4)
             wy = GRID_HEIGHT // 2 + random.randint(-4, 4)
             if (2 <= wx < GRID_WIDTH - 2 and 2 <= wy < GRID_HEIGHT - 2
-                    and not CELL_TYPES.get(grid[wy][wx], {}).get('solid', False)):
+                    and grid[wy][wx] not in SOLID_CELLS):
                 grid[wy][wx] = 'WELL'
                 print(f"[Miner] Built a well at ({wx},{wy}) in zone {screen_key}")
                 return
@@ -672,6 +673,7 @@ class NpcAiActionsMixin:
                                 _tp = getattr(self, 'time_pass_speed', 1.0)
                                 if random.random() < min(1.0, LUMBERJACK_BUILD_SUCCESS * _tp):
                                     screen['grid'][check_y][check_x] = 'HOUSE'
+                                    self.invalidate_heal_boost_field(screen)
                                     entity.inventory['wood'] -= 10
                                     entity.level_up_from_activity('build', self)
                                 return
@@ -797,17 +799,7 @@ class NpcAiActionsMixin:
                 amount = drop['amount']
 
                 # Add to dropped items on the screen
-                if screen_key not in self.dropped_items:
-                    self.dropped_items[screen_key] = {}
-
-                drop_key = f"{drop_x},{drop_y}"
-                if drop_key not in self.dropped_items[screen_key]:
-                    self.dropped_items[screen_key][drop_key] = {}
-
-                if item_name in self.dropped_items[screen_key][drop_key]:
-                    self.dropped_items[screen_key][drop_key][item_name] += amount
-                else:
-                    self.dropped_items[screen_key][drop_key][item_name] = amount
+                self.add_dropped_item(screen_key, f"{drop_x},{drop_y}", item_name, amount)
 
     def npc_place_camp(self, entity):
         """NPC places a campsite if none exists in the zone"""
@@ -837,6 +829,7 @@ class NpcAiActionsMixin:
                     # If more than 5 houses, camps decay to dirt (settlement established)
                     if house_count > 5 and random.random() < 0.05:
                         screen['grid'][y][x] = 'DIRT'
+                        self.invalidate_heal_boost_field(screen)
                         if random.random() < 0.1:
                             print(f"Camp decayed at [{screen_key}] - settlement has {house_count} houses")
                         return
@@ -844,6 +837,7 @@ class NpcAiActionsMixin:
                     # Otherwise, chance to upgrade camp to house
                     elif random.random() < 0.02:  # 2% chance
                         screen['grid'][y][x] = 'HOUSE'
+                        self.invalidate_heal_boost_field(screen)
 
                         # Chance to level up from building
                         entity.level_up_from_activity('build', self)
@@ -861,6 +855,7 @@ class NpcAiActionsMixin:
                 cell = screen['grid'][place_y][place_x]
                 if cell in ['GRASS', 'DIRT', 'SAND']:
                     screen['grid'][place_y][place_x] = 'CAMP'
+                    self.invalidate_heal_boost_field(screen)
                     return
 
     def miner_place_cave(self, entity):
@@ -916,7 +911,7 @@ class NpcAiActionsMixin:
     def try_npc_trade(self, entity, screen_key):
         """NPC occasionally trades with nearby peaceful NPCs"""
         # Only peaceful NPCs trade
-        if entity.props.get('hostile', False):
+        if entity.is_hostile:
             return
 
         # Small chance to initiate trade (2% per update)
@@ -938,7 +933,7 @@ class NpcAiActionsMixin:
                 continue
 
             # Only trade with peaceful NPCs
-            if other.props.get('hostile', False):
+            if other.is_hostile:
                 continue
 
             # Check distance
@@ -1008,7 +1003,7 @@ class NpcAiActionsMixin:
             if total_gold >= gold_needed:
                 # Become follower
                 if entity_id not in self.followers:
-                    self.followers.append(entity_id)
+                    self.followers.add(entity_id)
                     entity.inventory['gold'] = 0  # Clear gold
                     name_str = entity.name if entity.name else entity_type
                     print(f"{name_str} is now following you!")
@@ -1066,7 +1061,7 @@ class NpcAiActionsMixin:
             return
 
         # No active trader display - check for adjacent Trader NPC
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         if screen_key in self.screen_entities:
             for entity_id in self.screen_entities[screen_key]:
                 if entity_id not in self.entities:
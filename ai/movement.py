@@ -6,6 +6,7 @@ and the memory-lane obstacle-avoidance system.
 import random
 from data import *
 from engine import *
+from world.zones import make_zone_key
 
 
 class NpcAiMovementMixin:
@@ -20,8 +21,8 @@ class NpcAiMovementMixin:
         if not hasattr(self, 'sound'):
             return
         # Same screen check
-        px_screen = f"{self.player.get('screen_x', 0)},{self.player.get('screen_y', 0)}"
-        npc_screen = f"{getattr(entity, 'screen_x', -1)},{getattr(entity, 'screen_y', -1)}"
+        px_screen = make_zone_key(self.player.get('screen_x', 0), self.player.get('screen_y', 0))
+        npc_screen = make_zone_key(getattr(entity, 'screen_x', -1), getattr(entity, 'screen_y', -1))
         if px_screen != npc_screen:
             return
         dist = abs(new_x - self.player['x']) + abs(new_y - self.player['y'])
@@ -55,7 +56,7 @@ class NpcAiMovementMixin:
         # All entities (overworld and structure) now use the same registry.
         # Entity screen_x/y is always the actual current zone key — virtual coords
         # for structure zones, real coords for overworld zones.
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
         screen = self.screens[screen_key]
@@ -93,9 +94,9 @@ class NpcAiMovementMixin:
                 in_structure = screen_key in self.structure_zones
                 if not in_structure:
                     # Overworld entity: attempt seamless zone crossing
-                    old_sk = f"{entity.screen_x},{entity.screen_y}"
+                    old_sk = make_zone_key(entity.screen_x, entity.screen_y)
                     self.try_entity_screen_crossing(entity, new_x, new_y)
-                    if f"{entity.screen_x},{entity.screen_y}" != old_sk:
+                    if make_zone_key(entity.screen_x, entity.screen_y) != old_sk:
                         entity.is_moving = True
                         entity.moved_this_update = True
                         return
@@ -108,7 +109,7 @@ class NpcAiMovementMixin:
 
             # Check walkable (flying entities bypass most solids)
             cell = screen['grid'][new_y][new_x]
-            if CELL_TYPES[cell].get('solid', False):
+            if cell in SOLID_CELLS:
                 if not is_flying or cell in fly_blocked:
                     continue
 
@@ -263,15 +264,15 @@ class NpcAiMovementMixin:
             if new_x < 0 or new_x >= GRID_WIDTH or new_y < 0 or new_y >= GRID_HEIGHT:
                 if not entity.in_structure:
                     # Overworld: try seamless zone crossing
-                    old_sk = f"{entity.screen_x},{entity.screen_y}"
+                    old_sk = make_zone_key(entity.screen_x, entity.screen_y)
                     self.try_entity_screen_crossing(entity, new_x, new_y)
-                    if f"{entity.screen_x},{entity.screen_y}" != old_sk:
+                    if make_zone_key(entity.screen_x, entity.screen_y) != old_sk:
                         entity.moved_this_update = True
                         return True
                 # In structure: edges are walls — treat as blocked
                 return False
             cell = screen['grid'][new_y][new_x]
-            if CELL_TYPES[cell].get('solid', False):
+            if cell in SOLID_CELLS:
                 if not is_flying or cell in fly_blocked:
                     return False
             if not skip_memory and (new_x, new_y) in recent_positions and (new_x, new_y) != (target_x, target_y):
@@ -371,16 +372,16 @@ class NpcAiMovementMixin:
             # Check cooldown
             ticks_since = self.tick - getattr(entity, 'last_zone_change_tick', -9999)
             if ticks_since >= ZONE_CHANGE_COOLDOWN:
-                old_zone = f"{entity.screen_x},{entity.screen_y}"
+                old_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 self.try_entity_zone_transition(entity_id, entity)
-                new_zone = f"{entity.screen_x},{entity.screen_y}"
+                new_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 if old_zone != new_zone:
                     entity.last_zone_change_tick = self.tick
                     entity.memory_lane = []  # Clear memory for fresh zone
 
     def try_entity_zone_transition(self, entity_id, entity):
         """Attempt to move entity to adjacent zone ONLY through actual entrances"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
 
         if screen_key not in self.screens:
             return
@@ -453,7 +454,7 @@ class NpcAiMovementMixin:
         if transition_target and new_position:
             new_screen_x, new_screen_y = transition_target
             new_x, new_y = new_position
-            new_screen_key = f"{new_screen_x},{new_screen_y}"
+            new_screen_key = make_zone_key(new_screen_x, new_screen_y)
 
             # Generate target screen if it doesn't exist
             if new_screen_key not in self.screens:
@@ -464,7 +465,7 @@ class NpcAiMovementMixin:
                 target_screen = self.screens[new_screen_key]
                 target_cell = target_screen['grid'][new_y][new_x]
 
-                if not CELL_TYPES[target_cell].get('solid', False):
+                if target_cell not in SOLID_CELLS:
                     # Remove from old screen
                     if screen_key in self.screen_entities:
                         if entity_id in self.screen_entities[screen_key]:
@@ -490,8 +491,8 @@ class NpcAiMovementMixin:
 
                     # Add to new screen
                     if new_screen_key not in self.screen_entities:
-                        self.screen_entities[new_screen_key] = []
-                    self.screen_entities[new_screen_key].append(entity_id)
+                        self.screen_entities[new_screen_key] = set()
+                    self.screen_entities[new_screen_key].add(entity_id)
 
     def try_entity_screen_crossing(self, entity, new_x, new_y):
         """Seamlessly transition entity to adjacent zone when they walk through an exit corridor.
@@ -512,7 +513,7 @@ class NpcAiMovementMixin:
         if self.tick - getattr(entity, 'last_zone_change_tick', -9999) < NPC_SEAMLESS_CROSS_COOLDOWN:
             return
 
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
 
@@ -558,19 +559,19 @@ class NpcAiMovementMixin:
             return
 
         # Generate target zone if not yet visited
-        new_screen_key = f"{new_screen_x},{new_screen_y}"
+        new_screen_key = make_zone_key(new_screen_x, new_screen_y)
         if new_screen_key not in self.screens:
             self.generate_screen(new_screen_x, new_screen_y)
         if new_screen_key not in self.screens:
             return
 
         # Destination must be walkable
-        if CELL_TYPES.get(self.screens[new_screen_key]['grid'][new_y][new_x], {}).get('solid', False):
+        if self.screens[new_screen_key]['grid'][new_y][new_x] in SOLID_CELLS:
             return
 
         # Population cap
         if new_screen_key not in self.screen_entities:
-            self.screen_entities[new_screen_key] = []
+            self.screen_entities[new_screen_key] = set()
         if len(self.screen_entities[new_screen_key]) > 15:
             if not self.try_merge_entity(entity, new_screen_key):
                 return
@@ -581,10 +582,10 @@ class NpcAiMovementMixin:
             return
 
         # Transfer between screen entity lists
-        old_sk = f"{entity.screen_x},{entity.screen_y}"
+        old_sk = make_zone_key(entity.screen_x, entity.screen_y)
         if old_sk in self.screen_entities and entity_id in self.screen_entities[old_sk]:
             self.screen_entities[old_sk].remove(entity_id)
-        self.screen_entities[new_screen_key].append(entity_id)
+        self.screen_entities[new_screen_key].add(entity_id)
 
         # Update entity state
         entity.x = new_x
@@ -603,7 +604,7 @@ class NpcAiMovementMixin:
 
     def move_entity_towards(self, entity, target_x, target_y):
         """Move entity one step towards target using memory_lane pathfinding"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
 
@@ -691,7 +692,7 @@ class NpcAiMovementMixin:
 
             # Check if walkable
             cell = screen['grid'][new_y][new_x]
-            if CELL_TYPES[cell]['solid']:
+            if cell in SOLID_CELLS:
                 continue
 
             # Check if player is there
@@ -726,7 +727,7 @@ class NpcAiMovementMixin:
 
                     if (0 <= new_x < GRID_WIDTH and 0 <= new_y < GRID_HEIGHT):
                         cell = screen['grid'][new_y][new_x]
-                        if not CELL_TYPES[cell]['solid']:
+                        if cell not in SOLID_CELLS:
                             # Valid move found - set as target for smooth movement
                             entity.target_x = new_x
                             entity.target_y = new_y
@@ -765,7 +766,7 @@ class NpcAiMovementMixin:
             if abs(dx) + abs(dy) == 1:  # Manhattan distance = 1 (cardinal move)
                 # FINAL SAFETY CHECK: Ensure destination is not solid
                 final_cell = screen['grid'][new_y][new_x]
-                if not CELL_TYPES[final_cell]['solid']:
+                if final_cell not in SOLID_CELLS:
                     # Set as target for smooth movement system
                     entity.target_x = new_x
                     entity.target_y = new_y
@@ -786,7 +787,7 @@ class NpcAiMovementMixin:
 
     def seek_zone_exit(self, entity, entity_id=None):
         """Make entity move towards nearest zone exit"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
 
         # Warriors with factions: check for coordinated expansion
         target_direction = None
@@ -871,9 +872,9 @@ class NpcAiMovementMixin:
             if entity.in_structure:
                 sub_data = self.structures.get(entity.structure_key, {})
                 parent = sub_data.get('parent_screen', (entity.screen_x, entity.screen_y))
-                zone_key = f"{parent[0]},{parent[1]}"
+                zone_key = make_zone_key(parent[0], parent[1])
             else:
-                zone_key = f"{entity.screen_x},{entity.screen_y}"
+                zone_key = make_zone_key(entity.screen_x, entity.screen_y)
             if zone_key in self.zone_cave_systems:
                 structure_key = self.zone_cave_systems[zone_key]
             else:
@@ -882,15 +883,9 @@ class NpcAiMovementMixin:
                 self.zone_cave_systems[zone_key] = structure_key
         else:
             # House interior - check if this specific house already has an interior
-            # Use metadata comparison (parent_screen + parent_cell) — old string key format is gone
-            parent_coords = (entity.screen_x, entity.screen_y)
-            structure_key = None
-            for key, sub in self.structures.items():
-                if (sub.get('parent_screen') == parent_coords and
-                        sub.get('parent_cell') == (entrance_x, entrance_y) and
-                        sub.get('type') == 'HOUSE_INTERIOR'):
-                    structure_key = key
-                    break
+            # Look up by metadata (parent_screen + parent_cell) — old string key format is gone
+            structure_key = self.find_structure((entity.screen_x, entity.screen_y),
+                                                (entrance_x, entrance_y), 'HOUSE_INTERIOR')
 
             if not structure_key:
                 # Create new house interior
@@ -901,9 +896,9 @@ class NpcAiMovementMixin:
             self.screen_entities[screen_key].remove(entity_id)
 
         if structure_key not in self.screen_entities:
-            self.screen_entities[structure_key] = []
+            self.screen_entities[structure_key] = set()
         if entity_id not in self.screen_entities[structure_key]:
-            self.screen_entities[structure_key].append(entity_id)
+            self.screen_entities[structure_key].add(entity_id)
 
         # Update entity location to the structure zone's virtual coordinates
         vx, vy = map(int, structure_key.split(','))
@@ -965,16 +960,16 @@ class NpcAiMovementMixin:
         if not parent_screen:
             return
 
-        parent_key = f"{parent_screen[0]},{parent_screen[1]}"
+        parent_key = make_zone_key(parent_screen[0], parent_screen[1])
 
         # Move entity from structure zone to parent overworld zone
         if structure_key in self.screen_entities and entity_id in self.screen_entities[structure_key]:
             self.screen_entities[structure_key].remove(entity_id)
 
         if parent_key not in self.screen_entities:
-            self.screen_entities[parent_key] = []
+            self.screen_entities[parent_key] = set()
         if entity_id not in self.screen_entities[parent_key]:
-            self.screen_entities[parent_key].append(entity_id)
+            self.screen_entities[parent_key].add(entity_id)
 
         # Restore entity location to parent overworld zone
         entity.screen_x = parent_screen[0]
@@ -993,7 +988,7 @@ class NpcAiMovementMixin:
                     check_y = door_y + dy
                     if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
                         cell = screen['grid'][check_y][check_x]
-                        if cell in ['GRASS', 'DIRT', 'SAND', 'STONE'] and not CELL_TYPES[cell].get('solid', False):
+                        if cell in ['GRASS', 'DIRT', 'SAND', 'STONE'] and cell not in SOLID_CELLS:
                             entity.x = check_x
                             entity.y = check_y
                             entity.world_x = float(check_x)
@@ -1086,7 +1081,7 @@ class NpcAiMovementMixin:
             new_y = entity.y + 1
             if 0 <= new_y < GRID_HEIGHT:
                 cell = structure['grid'][new_y][entity.x]
-                if not CELL_TYPES.get(cell, {}).get('solid', False):
+                if cell not in SOLID_CELLS:
                     entity.y = new_y
                     entity.world_y = float(new_y)
                     entity.facing = 'down'
@@ -1098,7 +1093,7 @@ class NpcAiMovementMixin:
             new_x = entity.x + step_x
             if 0 <= new_x < GRID_WIDTH:
                 cell = structure['grid'][entity.y][new_x]
-                if not CELL_TYPES.get(cell, {}).get('solid', False):
+                if cell not in SOLID_CELLS:
                     entity.x = new_x
                     entity.world_x = float(new_x)
                     entity.facing = 'right' if step_x > 0 else 'left'
@@ -1208,7 +1203,7 @@ class NpcAiMovementMixin:
         if entity.y < exit_y:
             new_y = entity.y + 1
             cell = structure['grid'][new_y][entity.x]
-            if not CELL_TYPES.get(cell, {}).get('solid', False):
+            if cell not in SOLID_CELLS:
                 entity.y = new_y
                 entity.facing = 'down'
                 return
@@ -1291,7 +1286,7 @@ class NpcAiMovementMixin:
         same_type_count = sum(
             1 for eid, e in self.entities.items()
             if e.type.replace('_double', '') == base_type
-            and f"{e.screen_x},{e.screen_y}" == screen_key
+            and make_zone_key(e.screen_x, e.screen_y) == screen_key
         )
         if same_type_count <= 3:
             return False  # Not overcrowded — no merge
@@ -1341,7 +1336,7 @@ class NpcAiMovementMixin:
             return False
 
         # Revert this entity to single type
-        entity.type = base_type
+        entity.set_type(base_type)
 
         # Spawn a second single entity nearby
         from entity import Entity as _Entity
@@ -1359,16 +1354,16 @@ class NpcAiMovementMixin:
         self.entities[new_id] = new_entity
 
         if screen_key not in self.screen_entities:
-            self.screen_entities[screen_key] = []
-        self.screen_entities[screen_key].append(new_id)
+            self.screen_entities[screen_key] = set()
+        self.screen_entities[screen_key].add(new_id)
 
         print(f"[Split] {base_type}_double split into two {base_type}s at zone {screen_key}")
         return True
 
     def teleport_follower_to_player(self, entity_id, entity):
         """Teleport a follower entity to the player's current screen"""
-        player_screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
-        old_screen_key = f"{entity.screen_x},{entity.screen_y}"
+        player_screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+        old_screen_key = make_zone_key(entity.screen_x, entity.screen_y)
 
         # Remove from old screen
         if old_screen_key in self.screen_entities and entity_id in self.screen_entities[old_screen_key]:
@@ -1376,9 +1371,9 @@ class NpcAiMovementMixin:
 
         # Add to player's screen
         if player_screen_key not in self.screen_entities:
-            self.screen_entities[player_screen_key] = []
+            self.screen_entities[player_screen_key] = set()
         if entity_id not in self.screen_entities[player_screen_key]:
-            self.screen_entities[player_screen_key].append(entity_id)
+            self.screen_entities[player_screen_key].add(entity_id)
 
         # Update entity position to near player
         entity.screen_x = self.player['screen_x']
@@ -1494,7 +1489,7 @@ class NpcAiMovementMixin:
         if screen_key not in self.screens:
             return None, float('inf'), None
 
-        entity_is_hostile = entity.props.get('hostile', False)
+        entity_is_hostile = entity.is_hostile
         screen = self.screens[screen_key]
 
         closest_id = None
@@ -1529,7 +1524,7 @@ class NpcAiMovementMixin:
                     if not other.is_alive():
                         continue
 
-                    other_is_hostile = other.props.get('hostile', False)
+                    other_is_hostile = other.is_hostile
                     is_enemy = False
                     if entity_is_hostile:
                         if not other_is_hostile or other.type != entity.type:
@@ -1556,14 +1551,14 @@ class NpcAiMovementMixin:
 
         debug = False
 
-        entity_is_hostile = entity.props.get('hostile', False)
+        entity_is_hostile = entity.is_hostile
 
         closest = None
         closest_dist = float('inf')
 
         # Check if the PLAYER is a valid target (hostile entities target player)
         if entity_is_hostile:
-            player_zone = f"{self.player['screen_x']},{self.player['screen_y']}"
+            player_zone = make_zone_key(self.player['screen_x'], self.player['screen_y'])
             if screen_key == player_zone:
                 player_dist = abs(entity.x - self.player['x']) + abs(entity.y - self.player['y'])
                 if player_dist < closest_dist:
@@ -1579,7 +1574,7 @@ class NpcAiMovementMixin:
             if other is entity or not other.is_alive():
                 continue
 
-            other_is_hostile = other.props.get('hostile', False)
+            other_is_hostile = other.is_hostile
 
             # Check if hostile to us
             is_enemy = False
@@ -1623,13 +1618,13 @@ class NpcAiMovementMixin:
     def _is_hostile_target(self, entity, target):
         """Check if a target (entity ID, 'player', or tuple) represents a hostile/enemy entity"""
         if target == 'player':
-            return entity.props.get('hostile', False)
+            return entity.is_hostile
         if isinstance(target, int) and target in self.entities:
             other = self.entities[target]
             if other is entity:
                 return False
-            entity_hostile = entity.props.get('hostile', False)
-            other_hostile = other.props.get('hostile', False)
+            entity_hostile = entity.is_hostile
+            other_hostile = other.is_hostile
             # Hostile vs non-hostile (either direction)
             if entity_hostile and not other_hostile:
                 return True
@@ -1651,8 +1646,8 @@ class NpcAiMovementMixin:
             return float('inf')
 
         if target == 'player':
-            player_zone = f"{self.player['screen_x']},{self.player['screen_y']}"
-            entity_zone = f"{entity.screen_x},{entity.screen_y}"
+            player_zone = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+            entity_zone = make_zone_key(entity.screen_x, entity.screen_y)
             if player_zone != entity_zone:
                 return float('inf')
             return abs(entity.x - self.player['x']) + abs(entity.y - self.player['y'])
@@ -1681,7 +1676,7 @@ class NpcAiMovementMixin:
             return
 
         # Get screen_key from entity
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
 
         # Check for food cells nearby
         if screen_key not in self.screens:
@@ -1754,7 +1749,7 @@ class NpcAiMovementMixin:
                     food_cell = food_identifier
 
                     # Different food values for different cell sources
-                    if food_cell.startswith('CARROT'):
+                    if food_cell in CARROT_CELLS:
                         food_value = 40  # Crops are nutritious
                     elif food_cell == 'GRASS':
                         food_value = 20  # Grass is less filling
@@ -1765,7 +1760,7 @@ class NpcAiMovementMixin:
 
                     # Consume the food cell (and not enchanted)
                     if not self.is_cell_enchanted(food_x, food_y, screen_key):
-                        if screen['grid'][food_y][food_x].startswith('CARROT'):
+                        if screen['grid'][food_y][food_x] in CARROT_CELLS:
                             # Carrots decay to DIRT when eaten
                             if random.random() < GRASS_DECAY_ON_EAT:  # Use same rate as grass
                                 screen['grid'][food_y][food_x] = 'DIRT'
@@ -1791,7 +1786,7 @@ class NpcAiMovementMixin:
 
     def find_and_move_to_water(self, entity):
         """Find water and move towards it"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
 
@@ -20,6 +20,7 @@ the character spends time working toward goals rather than wandering aimlessly.
 import random
 from constants import *
 from entity import Entity
+from world.zones import make_zone_key
 
 
 # ── Tuning constants ──────────────────────────────────────────────────────────
@@ -213,7 +214,7 @@ class AutopilotMixin:
         py = self.player['y']
         psx = self.player['screen_x']
         psy = self.player['screen_y']
-        screen_key = f"{psx},{psy}"
+        screen_key = make_zone_key(psx, psy)
 
         # Choose NPC type from active quest
         npc_type = QUEST_NPC_TYPE.get(self.active_quest, DEFAULT_NPC_TYPE)
@@ -224,7 +225,7 @@ class AutopilotMixin:
         # ── Props: deep-enough copy so originals are never mutated ────────
         proxy.props = dict(proxy.props)
         proxy.props['sprite_name'] = 'wizard'
-        proxy.props['hostile'] = False       # never a valid attack target
+        proxy.set_hostile(False)             # never a valid attack target
         proxy.props['drops'] = []            # dropping nothing on death/despawn
         proxy.props['edible'] = False        # wolves won't flag it as food
         proxy.props['is_autopilot_proxy'] = True  # invisible to inspection/idle/tree-clearing
@@ -259,8 +260,8 @@ class AutopilotMixin:
         self.entities[entity_id] = proxy
 
         if screen_key not in self.screen_entities:
-            self.screen_entities[screen_key] = []
-        self.screen_entities[screen_key].append(entity_id)
+            self.screen_entities[screen_key] = set()
+        self.screen_entities[screen_key].add(entity_id)
 
         self.autopilot_proxy_id = entity_id
         self.autopilot = True
@@ -296,7 +297,7 @@ class AutopilotMixin:
             self.player['world_y'] = float(proxy.y)
             self.player['facing'] = proxy.facing
             # Sync current_screen so move_player uses the correct zone grid
-            new_sk = f"{proxy.screen_x},{proxy.screen_y}"
+            new_sk = make_zone_key(proxy.screen_x, proxy.screen_y)
             if new_sk in self.screens:
                 self.current_screen = self.screens[new_sk]
             else:
@@ -325,7 +326,7 @@ class AutopilotMixin:
                     e.is_idle = False
 
             # Remove from entity registries
-            sk = f"{proxy.screen_x},{proxy.screen_y}"
+            sk = make_zone_key(proxy.screen_x, proxy.screen_y)
             if sk in self.screen_entities and proxy_id in self.screen_entities[sk]:
                 self.screen_entities[sk].remove(proxy_id)
             if proxy_id in self.entities:
@@ -388,7 +389,7 @@ class AutopilotMixin:
         self.player['screen_y'] = proxy.screen_y
 
         # Keep current_screen tracking the proxy's zone so rendering is correct
-        new_sk = f"{proxy.screen_x},{proxy.screen_y}"
+        new_sk = make_zone_key(proxy.screen_x, proxy.screen_y)
         if self.current_screen is not self.screens.get(new_sk):
             if new_sk in self.screens:
                 self.current_screen = self.screens[new_sk]
@@ -487,14 +488,14 @@ class AutopilotMixin:
         if quest.status != 'active':
             return
 
-        screen_key = f"{proxy.screen_x},{proxy.screen_y}"
+        screen_key = make_zone_key(proxy.screen_x, proxy.screen_y)
 
         # ── Combat quests always target entities ───────────────────────
         combat_quests = ('HUNT', 'SLAY', 'COMBAT_HOSTILE', 'COMBAT_ALL')
         if self.active_quest in combat_quests:
             if quest.target_entity_id and quest.target_entity_id in self.entities:
                 target_entity = self.entities[quest.target_entity_id]
-                target_sk = f"{target_entity.screen_x},{target_entity.screen_y}"
+                target_sk = make_zone_key(target_entity.screen_x, target_entity.screen_y)
                 if target_sk == screen_key:
                     proxy.current_target = quest.target_entity_id
                     proxy.target_type = 'hostile'
@@ -531,7 +532,7 @@ class AutopilotMixin:
         # ── 10% travel nudge: pick a target from a nearby zone ─────────
         if quest.target_cell:
             tsx, tsy, tx, ty = quest.target_cell
-            target_sk = f"{tsx},{tsy}"
+            target_sk = make_zone_key(tsx, tsy)
             if target_sk == screen_key:
                 # Already in the target zone — let natural behavior handle it
                 proxy.ai_state = 'wandering'
@@ -541,7 +542,7 @@ class AutopilotMixin:
                 self._nudge_toward_zone(proxy, tsx, tsy, screen_key)
         elif quest.target_entity_id and quest.target_entity_id in self.entities:
             target_entity = self.entities[quest.target_entity_id]
-            target_sk = f"{target_entity.screen_x},{target_entity.screen_y}"
+            target_sk = make_zone_key(target_entity.screen_x, target_entity.screen_y)
             if target_sk != screen_key:
                 self._nudge_toward_zone(proxy, target_entity.screen_x,
                                         target_entity.screen_y, screen_key)
@@ -808,7 +809,7 @@ class AutopilotMixin:
         Sets self.inspected_npc so the normal per-tick NPC inspection logic runs,
         exercising trade menus, dialogue, and relationship checks.
         """
-        screen_key = f"{proxy.screen_x},{proxy.screen_y}"
+        screen_key = make_zone_key(proxy.screen_x, proxy.screen_y)
         candidates = []
         for eid in self.screen_entities.get(screen_key, []):
             if eid == self.autopilot_proxy_id:
@@ -835,7 +836,7 @@ class AutopilotMixin:
         (drops are tool-gated; path clearing is not).  This surfaces pathfinding
         issues that would otherwise keep the proxy frozen indefinitely.
         """
-        screen_key = f"{proxy.screen_x},{proxy.screen_y}"
+        screen_key = make_zone_key(proxy.screen_x, proxy.screen_y)
         if screen_key not in self.screens:
             return
 
@@ -870,7 +871,7 @@ class AutopilotMixin:
         accumulates resources while traversing the world.  Trees take priority
         over rocks (lumberjacking yields more varied drops).
         """
-        screen_key = f"{proxy.screen_x},{proxy.screen_y}"
+        screen_key = make_zone_key(proxy.screen_x, proxy.screen_y)
         if screen_key not in self.screens:
             return
 
@@ -42,6 +42,7 @@ GRID_HEIGHT = 18
 SCREEN_WIDTH = GRID_WIDTH * CELL_SIZE
 SCREEN_HEIGHT = GRID_HEIGHT * CELL_SIZE + 80
 FPS = 60
+DEBUG_SPRITE_LOAD = False  # Print the per-sprite table and variant report at startup
 # Catch-up system constants
 MAX_CATCHUP_PER_FRAME = 2  # Max zones to catch up at once
 MAX_CYCLES_TO_SIMULATE = 100  # Cap at 100 cycles (6000 ticks ~= 100 seconds)
@@ -91,6 +92,7 @@ NIGHT_OVERLAY_ALPHA = 40  # Darkness overlay opacity (0-255, subtle at 40)
 
 # Quest System
 QUEST_COOLDOWN = 300      # Ticks before new quest target assigned after completion (5 seconds)
+QUEST_RETARGET_INTERVAL = 5  # Ticks between target searches for quests still lacking a target
 QUEST_XP_MULTIPLIER = 10  # XP reward = target_level × this value
 
 # Cell Growth & Decay Rates (probability per tick) - SLOWED for subtle changes
@@ -152,6 +154,7 @@ ADJACENT_DISTANCE = 1           # Distance considered adjacent for actions
 COMBAT_FLEE_CHANCE = 0.4        # 40% chance to flee when health critical
 COMBAT_DISENGAGE_CHANCE = 0.05  # 5% chance to disengage from combat
 HOSTILE_DETECTION_RANGE = 8     # Cells within which to detect hostiles (for fleeing)
+ATTACK_ANIMATION_LIMIT = 128    # Max attack swipe animations kept alive at once
 
 # NPC Structure Behavior
 NPC_STRUCTURE_EXIT_CHANCE = 0.60  # 60% chance per update to try exiting structure
@@ -417,6 +420,29 @@ CELL_TYPES = {
     },
 }
 
+# Cell types that block movement.  Movement and spawn checks test membership
+# here instead of going through CELL_TYPES[cell]['solid'].
+SOLID_CELLS = frozenset(cell for cell, info in CELL_TYPES.items() if info.get('solid', False))
+
+# Cell types the player can walk into (house, cave, mineshaft interiors)
+ENTERABLE_CELLS = frozenset(cell for cell, info in CELL_TYPES.items() if info.get('enterable', False))
+
+# Tree and carrot growth stages, tested by membership instead of startswith().
+# TREE3 is drawn and harvested but has no CELL_TYPES entry of its own
+TREE_CELLS = frozenset({'TREE3'} | {cell for cell in CELL_TYPES if cell.startswith('TREE')})
+CARROT_CELLS = frozenset(cell for cell in CELL_TYPES if cell.startswith('CARROT'))
+
+# Growth/decay transitions per cell type: (grows_to, growth_rate, degrades_to, degrade_rate).
+# Only cell types with at least one transition are listed, so the per-tick growth
+# passes can skip every other cell with a single dict miss.
+CELL_GROWTH_RULES = {
+    cell: (info.get('grows_to'), info.get('growth_rate', 0),
+           info.get('degrades_to'), info.get('degrade_rate', 0))
+    for cell, info in CELL_TYPES.items()
+    if 'grows_to' in info or 'degrades_to' in info
+}
+
+
 # Item definitions
 ITEMS = {
     # Basic resources
@@ -1284,6 +1310,11 @@ ITEMS.update({
     'magic_rune': {'color': (180, 120, 255), 'name': 'Magic Rune', 'magic_damage': 'arcane', 'damage': 5, 'sprite_name': 'magic_rune'},
 })
 
+# Items a dying entity never leaves behind: spells, plus wood/planks
+NON_DROPPABLE_ITEMS = frozenset(
+    name for name, info in ITEMS.items() if info.get('is_spell', False)
+) | {'wood', 'planks'}
+
 # Cell pickup requirements
 CELL_PICKUP = {
     'GRASS': {'tool': None, 'item': 'grass'},
@@ -155,6 +155,29 @@ CELL_TYPES = {
     },
 }
 
+# Cell types that block movement.  Movement and spawn checks test membership
+# here instead of going through CELL_TYPES[cell]['solid'].
+SOLID_CELLS = frozenset(cell for cell, info in CELL_TYPES.items() if info.get('solid', False))
+
+# Cell types the player can walk into (house, cave, mineshaft interiors)
+ENTERABLE_CELLS = frozenset(cell for cell, info in CELL_TYPES.items() if info.get('enterable', False))
+
+# Tree and carrot growth stages, tested by membership instead of startswith().
+# TREE3 is drawn and harvested but has no CELL_TYPES entry of its own
+TREE_CELLS = frozenset({'TREE3'} | {cell for cell in CELL_TYPES if cell.startswith('TREE')})
+CARROT_CELLS = frozenset(cell for cell in CELL_TYPES if cell.startswith('CARROT'))
+
+# Growth/decay transitions per cell type: (grows_to, growth_rate, degrades_to, degrade_rate).
+# Only cell types with at least one transition are listed, so the per-tick growth
+# passes can skip every other cell with a single dict miss.
+CELL_GROWTH_RULES = {
+    cell: (info.get('grows_to'), info.get('growth_rate', 0),
+           info.get('degrades_to'), info.get('degrade_rate', 0))
+    for cell, info in CELL_TYPES.items()
+    if 'grows_to' in info or 'degrades_to' in info
+}
+
+
 # Cell pickup requirements
 CELL_PICKUP = {
     'GRASS': {'tool': None, 'item': 'grass'},
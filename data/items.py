@@ -116,6 +116,11 @@ ITEMS.update({
     'magic_rune': {'color': (180, 120, 255), 'name': 'Magic Rune', 'magic_damage': 'arcane', 'damage': 5, 'sprite_name': 'magic_rune'},
 })
 
+# Items a dying entity never leaves behind: spells, plus wood/planks
+NON_DROPPABLE_ITEMS = frozenset(
+    name for name, info in ITEMS.items() if info.get('is_spell', False)
+) | {'wood', 'planks'}
+
 # Crafting recipes: (item1, item2) -> result
 # Recipe format: ('ingredient1', 'ingredient2'): 'result_item'
 # Order doesn't matter - ('wood', 'stone') == ('stone', 'wood')
@@ -10,6 +10,7 @@ GRID_HEIGHT = 18
 SCREEN_WIDTH = GRID_WIDTH * CELL_SIZE
 SCREEN_HEIGHT = GRID_HEIGHT * CELL_SIZE + 60
 FPS = 60
+DEBUG_SPRITE_LOAD = False  # Print the per-sprite table and variant report at startup
 # Catch-up system constants
 MAX_CATCHUP_PER_FRAME = 2  # Max zones to catch up at once
 MAX_CYCLES_TO_SIMULATE = 100  # Cap at 100 cycles (6000 ticks ~= 100 seconds)
@@ -51,6 +52,7 @@ NIGHT_OVERLAY_ALPHA = 40  # Darkness overlay opacity (0-255, subtle at 40)
 
 # Quest System
 QUEST_COOLDOWN = 300      # Ticks before new quest target assigned after completion (5 seconds)
+QUEST_RETARGET_INTERVAL = 5  # Ticks between target searches for quests still lacking a target
 QUEST_XP_MULTIPLIER = 10  # XP reward = target_level × this value
 
 # Cell Growth & Decay Rates (probability per tick) - SLOWED for subtle changes
@@ -107,6 +109,7 @@ ADJACENT_DISTANCE = 1           # Distance considered adjacent for actions
 COMBAT_FLEE_CHANCE = 0.4        # 40% chance to flee when health critical
 COMBAT_DISENGAGE_CHANCE = 0.05  # 5% chance to disengage from combat
 HOSTILE_DETECTION_RANGE = 8     # Cells within which to detect hostiles (for fleeing)
+ATTACK_ANIMATION_LIMIT = 128    # Max attack swipe animations kept alive at once
 
 # NPC Subscreen Behavior
 NPC_SUBSCREEN_EXIT_CHANCE = 0.60  # 60% chance per update to try exiting subscreen
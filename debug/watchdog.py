@@ -184,7 +184,7 @@ class Watchdog:
                 'exits': zone_data.get('exits'),
                 'has_chests': bool(zone_data.get('chests')),
                 'chest_count': len(zone_data.get('chests', {})),
-                'entity_ids': entity_ids,
+                'entity_ids': list(entity_ids),
                 'entity_types': entity_types,
             })
 
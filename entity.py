@@ -274,6 +274,9 @@ class Entity:
         # Handle _double types by using base type for props lookup
         base_type = entity_type.replace('_double', '')
         self.props = ENTITY_TYPES[base_type]
+        # Cached props['hostile']; whoever changes props must refresh it
+        # (set_type / set_hostile do)
+        self.is_hostile = self.props.get('hostile', False)
         self.level = level
         
         # Position - GRID coordinates (logical cell position)
@@ -500,6 +503,25 @@ class Entity:
             self.unlocked_quest_types = [default_focus]
         self.quest_target = None   # ('cell', x, y, cell_type) | entity_id | None
     
+    def set_type(self, entity_type):
+        """Change to entity_type, keeping props and is_hostile in step.
+        Merging into / splitting from a _double keeps the base type, so any
+        per-entity props override (see set_hostile) is left in place."""
+        base_type = entity_type.replace('_double', '')
+        same_base = base_type == self.type.replace('_double', '')
+        self.type = entity_type
+        if not same_base:
+            self.props = ENTITY_TYPES[base_type]
+            self.is_hostile = self.props.get('hostile', False)
+    
+    def set_hostile(self, hostile):
+        """Override hostility for this entity only (props are copied first,
+        since they are shared with every entity of the same type)"""
+        if self.props.get('hostile', False) != hostile:
+            self.props = dict(self.props)
+            self.props['hostile'] = hostile
+        self.is_hostile = hostile
+    
     def update_animation(self):
         """Update walk-cycle animation frames.
         
@@ -771,7 +793,7 @@ class Entity:
             # ── Quest-type unlock on level up ─────────────────────────────────
             # All peaceful types + combat_hostile: 10% chance each, equal weight.
             # combat_all: 3% chance for non-hostile NPCs (higher variability risk).
-            is_hostile_npc = self.props.get('hostile', False)
+            is_hostile_npc = self.is_hostile
             for qt in NPC_QUEST_TYPES_ALL:
                 if qt in self.unlocked_quest_types:
                     continue
@@ -812,8 +834,7 @@ class Entity:
         # Guard promotion: 30% chance to become Warrior on level up
         if self.type == 'GUARD' and random.random() < 0.30:
             old_name = self.name if self.name else "Guard"
-            self.type = 'WARRIOR'
-            self.props = ENTITY_TYPES['WARRIOR']
+            self.set_type('WARRIOR')
             print(f"{old_name} was promoted to WARRIOR after leveling up!")
         
         # Increase stats
@@ -834,7 +855,7 @@ class Entity:
         """Merge with another entity, taking their stats and becoming a _double type"""
         # Change to double type
         if not self.type.endswith('_double'):
-            self.type = self.type + '_double'
+            self.set_type(self.type + '_double')
         
         self.level_up()
         self.health = self.max_health
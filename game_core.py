@@ -6,23 +6,175 @@ import sys
 import os as _os
 import time as _time
 import datetime as _datetime
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from constants import *
 from entity import *
 from debug.bug_catcher import BugCatcher
 from debug.watchdog import Watchdog
 from systems.sound_manager import SoundManager
+from world.zones import make_zone_key, HEAL_BOOST_CELLS
 
 _SETTINGS_PATH = 'settings.json'
 _REAL_STDOUT = sys.stdout  # saved before any redirect
 
+# Miner corner targets, indexed by (right half << 1) | bottom half
+CORNER_TARGETS = (
+    (2, 2),                              # Top-left
+    (2, GRID_HEIGHT - 3),                # Bottom-left
+    (GRID_WIDTH - 3, 2),                 # Top-right
+    (GRID_WIDTH - 3, GRID_HEIGHT - 3),   # Bottom-right
+)
+# Most playing ticks Game.run simulates in one frame to catch up after a slow one
+MAX_TICKS_PER_FRAME = 4
+# Tags of ('tag', x, y, ...) current_target tuples that get_target_cell decodes
+TARGET_TAGS = frozenset(('cell', 'entity', 'structure'))
+# Cell offset in front of an entity, by facing
+FACING_OFFSETS = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
+# Player target offset and facing, indexed by target_direction (up, down, left, right)
+TARGET_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+TARGET_FACINGS = ('up', 'down', 'left', 'right')
+# Ground the player can dig a mineshaft into, and ground bones can be laid on
+MINABLE_GROUND_CELLS = frozenset(('DIRT', 'SAND', 'GRASS', 'CAVE_FLOOR'))
+BONES_GROUND_CELLS = frozenset(('GRASS', 'DIRT', 'SAND', 'STONE', 'FLOOR_WOOD', 'CAVE_FLOOR', 'COBBLESTONE'))
+# Cells counted as existing cave entrances when digging a new mineshaft
+CAVE_ENTRANCE_CELLS = frozenset(('CAVE', 'MINESHAFT', 'HIDDEN_CAVE'))
+
+# Base cell sprites, loaded from <cell type lowercased>.png
+CELL_SPRITE_TYPES = ('GRASS', 'DIRT', 'SAND', 'STONE', 'WATER', 'DEEP_WATER',
+                     'COBBLESTONE',
+                     'TREE1', 'TREE2', 'TREE3', 'FLOWER',
+                     'CARROT1', 'CARROT2', 'CARROT3',
+                     'CAMP', 'HOUSE', 'STONE_HOUSE', 'WOOD', 'PLANKS',
+                     'WALL', 'CAVE', 'MINESHAFT', 'SOIL', 'MEAT', 'FUR', 'BONES',
+                     'FLOOR_WOOD', 'CAVE_FLOOR', 'CAVE_WALL', 'CHEST',
+                     'STAIRS_DOWN', 'STAIRS_UP',
+                     'CACTUS', 'BARREL', 'RUINED_SANDSTONE_COLUMN')
+# Biome-specific wall variants
+WALL_VARIANT_SPRITES = ('wall_forest', 'wall_desert', 'wall_plains',
+                        'wall_mountains', 'wall_tundra', 'wall_swamp')
+# Dropped-item overlays: every item key, every item sprite_name, plus the
+# utility itembag sprite
+ITEM_SPRITE_NAMES = frozenset(
+    [item_key for item_key in ITEMS]
+    + [item_data['sprite_name'] for item_data in ITEMS.values() if 'sprite_name' in item_data]
+    + ['itembag']
+)
+# Sprites whose filenames don't match the standard key.lower()+".png" pattern,
+# or that need guaranteed convert_alpha() regardless of alpha-detection result
+EXPLICIT_SPRITE_FILES = {
+    'IRON_ORE':              'ironore.png',
+    'WELL':                  'well.png',
+    'iron_sword':            'sword.png',
+    'RUINED_SANDSTONE_COLUMN': 'ruined_sandstone_column.png',
+    'STONE_HOUSE':           'stone_house.png',
+    'CACTUS':                'cactus.png',
+    'BARREL':                'barrel.png',
+}
+# Entity animation sprites.  3-frame sets are 1, still, 2; older 2-frame
+# sets (1, 2) use the same names, so they resolve through the same table.
+ENTITY_SPRITE_TYPES = ('sheep', 'wolf', 'deer', 'farmer', 'guard', 'trader',
+                       'lumberjack', 'miner', 'blacksmith', 'bandit', 'goblin',
+                       'king', 'skeleton', 'warrior', 'commander', 'yellow termite', 'wizard',
+                       'black bat')
+ENTITY_SPRITE_DIRECTIONS = ('up', 'down', 'left', 'right')
+ENTITY_SPRITE_FRAMES = ('1', 'still', '2')
+# (normalized sprite name, candidate filenames in preference order)
+ENTITY_SPRITE_CANDIDATES = tuple(
+    (f"{entity_type}_{direction}_{frame}", (
+        f"{entity_type}_{direction}_{frame}.png",   # entity_direction_frame
+        f"{entity_type} {direction}_{frame}.png",   # "entity direction_frame"
+        f"{entity_type} {direction} {frame}.png",   # "entity direction frame"
+    ))
+    for entity_type in ENTITY_SPRITE_TYPES
+    for direction in ENTITY_SPRITE_DIRECTIONS
+    for frame in ENTITY_SPRITE_FRAMES
+)
+# Cell variant sprites (grass1, grass2, ...) other than the base type itself
+CELL_VARIANT_SPRITES = tuple(
+    variant_name
+    for cell_type, props in CELL_TYPES.items()
+    for variant_name in props.get('variants', {})
+    if variant_name != cell_type
+)
+
+# Threads used to decode sprite PNGs at startup
+SPRITE_DECODE_WORKERS = 8
+# Decoded sprite atlas reused across launches, kept next to this file
+SPRITE_CACHE_FILE = 'sprite_cache.pkl'
+# Cached "last push" timestamp for the pause screen, kept next to this file
+GIT_PUSH_CACHE_FILE = '.last_push_cache'
+
+
+def _decode_sprite_file(filename):
+    """Decode one image file off the main thread; returns the exception on failure."""
+    try:
+        return pygame.image.load(filename)
+    except Exception as e:
+        return e
+
+
+def _index_sprite_files(search_paths):
+    """Map each lowercased .png basename under search_paths to the first path
+    that has it, matching the case-insensitive lookups of a default macOS disk."""
+    available = {}
+    for search_path in search_paths:
+        try:
+            entries = os.scandir(search_path or '.')
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith('.png'):
+                    filename = os.path.join(search_path, entry.name) if search_path else entry.name
+                    available.setdefault(name, filename)
+    return available
+
+
+def _sprite_cache_signature(pending):
+    """Identify a sprite load by its resolved files, their mtimes and CELL_SIZE."""
+    try:
+        return (CELL_SIZE, tuple(
+            (sprite_key, filename, mode, os.stat(filename).st_mtime_ns)
+            for sprite_key, filename, mode in pending
+        ))
+    except OSError:
+        return None
+
+
+def _load_sprite_cache(cache_path, signature):
+    """Return {sprite_key: (size, format, pixels)} if the cache matches signature."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_signature, sprites = pickle.load(f)
+    except Exception:
+        return None
+    return sprites if cached_signature == signature else None
+
+
+def _save_sprite_cache(cache_path, signature, sprites):
+    """Write the converted sprites to cache_path; failures are ignored."""
+    atlas = {}
+    for sprite_key, sprite_img in sprites.items():
+        fmt = 'RGBA' if sprite_img.get_flags() & pygame.SRCALPHA else 'RGB'
+        atlas[sprite_key] = (sprite_img.get_size(), fmt, pygame.image.tostring(sprite_img, fmt))
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump((signature, atlas), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
 class GameCoreMixin:
     """Core game systems. Mixed into Game via multiple inheritance."""
     """First half of game logic - world generation, spawning, AI"""
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Procedural Adventure")
-        self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
         self.tiny_font = pygame.font.Font(None, 14)
@@ -71,7 +223,8 @@ class GameCoreMixin:
         
         # Structure system
         self.structures = {}  # {structure_key: structure_data}
-        self.opened_chests = set()  # Track which chests have been looted
+        self.structure_index = {}  # {(parent_screen, parent_cell): [structure_key, ...]}
+        self.opened_chests = set()  # (zone_key, x, y) of every chest already looted
         self.next_structure_id = 0  # For generating unique structure IDs
         self.zone_cave_systems = {}  # {screen_key: cave_structure_key} - one cave system per zone
         
@@ -90,7 +243,7 @@ class GameCoreMixin:
         
         # Catch-up system
         self.last_input_tick = 0
-        self.catchup_queue = []  # [(priority, screen_x, screen_y, cycles), ...]
+        self.catchup_queue = []  # heap of (priority, screen_x, screen_y, cycles)
         self.init_autopilot()  # Initialize autopilot state (from AutopilotMixin)
         
         # Weather system
@@ -131,8 +284,8 @@ class GameCoreMixin:
         # Load sprites
         self.load_sprites()
 
-        # Attack animations
-        self.attack_animations = []
+        # Attack animations (oldest drop off once the cap is reached)
+        self.attack_animations = deque(maxlen=ATTACK_ANIMATION_LIMIT)
        
         # Give starting tools
         self.inventory.add_item('axe', 1)
@@ -149,8 +302,8 @@ class GameCoreMixin:
         self.entities = {}
         self.next_entity_id = 0
         
-        # Follower tracking: [entity_ids] - list of entity IDs that are followers
-        self.followers = []
+        # Follower tracking: {entity_ids} - set of entity IDs that are followers
+        self.followers = set()
         # Maps entity_id → inventory item name used to summon that follower
         self.follower_items = {}  # {entity_id: item_name}
         
@@ -186,6 +339,14 @@ class GameCoreMixin:
         self.inspected_npc = None  # Entity being inspected
         self.inspected_npc_tick = 0  # When inspection started  # When to hide display
 
+        # Input: held keys sampled once per frame by handle_input, and the
+        # playing-state KEYDOWN handlers keyed by pygame key code
+        self._keys_this_tick = pygame.key.get_pressed()
+        self._playing_keydown = self._build_playing_keydown()
+        # Space-bar cell interactions, see _build_interact_dispatch
+        (self._interact_cell_actions, self._interact_tool_actions,
+         self._interact_fallback_actions) = self._build_interact_dispatch()
+
         # Debug / bug-tracking
         self.bug_catcher = BugCatcher()
         self.watchdog = Watchdog(self.bug_catcher)
@@ -194,10 +355,37 @@ class GameCoreMixin:
         self.sound = SoundManager()
         self._apply_settings()  # apply after SoundManager exists
 
-        # Last git push timestamp (shown on pause screen)
+        # Last git push timestamp (shown on pause screen).  Resolved on a
+        # background thread so a slow git never delays the first frame.
+        self.last_push_time = 'Loading...'
+        threading.Thread(target=self._fetch_git_push_time, daemon=True).start()
+
+    def _fetch_git_push_time(self):
+        """Set last_push_time from origin/main's commit date.
+
+        The formatted result is cached in GIT_PUSH_CACHE_FILE keyed by the
+        mtimes of .git/HEAD and .git/FETCH_HEAD, so git only runs again after
+        a checkout or fetch.
+        """
+        _script_dir = os.path.dirname(os.path.abspath(__file__))
+        cache_path = os.path.join(_script_dir, GIT_PUSH_CACHE_FILE)
+        git_dir = os.path.join(_script_dir, '.git')
+        cache_key = '|'.join(
+            str(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+            if os.path.exists(os.path.join(git_dir, name)) else '-'
+            for name in ('HEAD', 'FETCH_HEAD')
+        )
+        try:
+            with open(cache_path) as f:
+                cached_key, cached_value = f.read().split('\n', 1)
+            if cached_key == cache_key and cached_value:
+                self.last_push_time = cached_value
+                return
+        except (OSError, ValueError):
+            pass
+
         try:
             import subprocess as _sp
-            _script_dir = os.path.dirname(os.path.abspath(__file__))
             _res = _sp.run(
                 ['git', 'log', '-1', '--format=%ci', 'origin/main'],
                 capture_output=True, text=True, cwd=_script_dir, timeout=3
@@ -208,8 +396,16 @@ class GameCoreMixin:
                 self.last_push_time = ' '.join(_raw.split()[:2])[:16]
             else:
                 self.last_push_time = 'Unknown'
+                return
         except Exception:
             self.last_push_time = 'Unknown'
+            return
+
+        try:
+            with open(cache_path, 'w') as f:
+                f.write(f"{cache_key}\n{self.last_push_time}")
+        except OSError:
+            pass
 
     def load_sprites(self):
         """Load sprite images from individual PNG files"""
@@ -240,253 +436,140 @@ class GameCoreMixin:
             os.path.join(script_dir, "sprites", "grass_sprites") + os.sep,
         ]
         
-        for cell_type in ['GRASS', 'DIRT', 'SAND', 'STONE', 'WATER', 'DEEP_WATER',
-                          'COBBLESTONE',
-                          'TREE1', 'TREE2', 'TREE3', 'FLOWER',
-                          'CARROT1', 'CARROT2', 'CARROT3',
-                          'CAMP', 'HOUSE', 'STONE_HOUSE', 'WOOD', 'PLANKS',
-                          'WALL', 'CAVE', 'MINESHAFT', 'SOIL', 'MEAT', 'FUR', 'BONES',
-                          'FLOOR_WOOD', 'CAVE_FLOOR', 'CAVE_WALL', 'CHEST',
-                          'STAIRS_DOWN', 'STAIRS_UP',
-                          'CACTUS', 'BARREL', 'RUINED_SANDSTONE_COLUMN']:
-            
-            # Skip if already loaded
-            if cell_type in self.sprite_manager.sprites:
-                continue
-            
-            # Try lowercase filename in each search path
-            filename_base = f"{cell_type.lower()}.png"
-            
-            for search_path in search_paths:
-                filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                
-                if os.path.exists(filename):
-                    try:
-                        # Load image - works with both PNG and JPEG
-                        sprite_img = pygame.image.load(filename)
-                        
-                        # Check if image has transparency (RGBA)
-                        if sprite_img.get_alpha() is not None or sprite_img.get_colorkey() is not None:
-                            # Has transparency - convert to RGBA (for objects like trees)
-                            sprite_img = sprite_img.convert_alpha()
-                        else:
-                            # No transparency - convert to RGB (for base terrain)
-                            sprite_img = sprite_img.convert()
-                        
-                        # Scale to game cell size
-                        sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                        self.sprite_manager.sprites[cell_type] = sprite_img
-                        sprite_files_loaded += 1
-                        break  # Found it, stop searching paths for this cell type
-                    except Exception as e:
-                        print(f"Failed to load {filename}: {e}")
+        # Loading happens in three passes: resolve every sprite key to the
+        # first matching file on disk, decode all of them on a thread pool
+        # (PNG decode is I/O + libpng work and doesn't need the display),
+        # then convert and scale on the main thread, which owns the display.
+        # pending: [(sprite_key, filename, mode)]; mode is 'auto' (detect
+        # transparency), 'alpha' (convert_alpha) or 'opaque' (convert)
+        pending = []
+        planned = set()
+
+        # One directory read per search path instead of an exists() call per
+        # candidate name; earlier search paths win, as before
+        available_files = _index_sprite_files(search_paths)
+
+        def queue_sprite(sprite_key, filename_base, mode):
+            """Queue sprite_key from filename_base if it exists; True if queued."""
+            filename = available_files.get(filename_base.lower())
+            if not filename:
+                return False
+            pending.append((sprite_key, filename, mode))
+            planned.add(sprite_key)
+            return True
+
+        # Base cells: terrain is opaque, objects like trees carry alpha
+        for cell_type in CELL_SPRITE_TYPES:
+            if cell_type not in planned:
+                queue_sprite(cell_type, f"{cell_type}.png", 'auto')
         
         # Load cell variant sprites (grass1, grass2, etc.)
         variant_search_count = 0
-        variant_loaded_count = 0
+        variant_keys = set()
         variant_missing = []
-        for cell_type, props in CELL_TYPES.items():
-            variants = props.get('variants', {})
-            for variant_name in variants:
-                if variant_name == cell_type:
-                    continue  # Skip base type — already loaded above
-                if variant_name in self.sprite_manager.sprites:
-                    continue  # Already loaded
-                
-                variant_search_count += 1
+        for variant_name in CELL_VARIANT_SPRITES:
+            if variant_name in planned:
+                continue  # Already queued
+            
+            variant_search_count += 1
+            if queue_sprite(variant_name, f"{variant_name}.png", 'auto'):
+                variant_keys.add(variant_name)
+            else:
                 filename_base = f"{variant_name.lower()}.png"
-                found = False
-                for search_path in search_paths:
-                    filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                    if os.path.exists(filename):
-                        try:
-                            sprite_img = pygame.image.load(filename)
-                            if sprite_img.get_alpha() is not None or sprite_img.get_colorkey() is not None:
-                                sprite_img = sprite_img.convert_alpha()
-                            else:
-                                sprite_img = sprite_img.convert()
-                            sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                            self.sprite_manager.sprites[variant_name] = sprite_img
-                            sprite_files_loaded += 1
-                            variant_loaded_count += 1
-                            found = True
-                            break
-                        except Exception as e:
-                            variant_missing.append(f"{variant_name}: load error - {e}")
-                if not found:
-                    checked = [os.path.join(sp, filename_base) if sp else filename_base for sp in search_paths]
-                    variant_missing.append(f"{variant_name}: not found at {checked}")
-        
-        # Load entity animation sprites
-        # Support both 2-frame and 3-frame animations
-        # 2-frame: entity_direction_1, entity_direction_2
-        # 3-frame: entity_direction_1, entity_direction_still, entity_direction_2
-        entity_types = ['sheep', 'wolf', 'deer', 'farmer', 'guard', 'trader', 
-                       'lumberjack', 'miner', 'blacksmith', 'bandit', 'goblin', 
-                       'king', 'skeleton', 'warrior', 'commander', 'yellow termite', 'wizard',
-                       'black bat']
-        directions = ['up', 'down', 'left', 'right']
-        
-        for entity_type in entity_types:
-            for direction in directions:
-                # Try to load 3-frame animation: 1, still, 2
-                for frame_name in ['1', 'still', '2']:
-                    # Try multiple naming formats
-                    naming_formats = [
-                        f"{entity_type}_{direction}_{frame_name}",  # entity_direction_frame
-                        f"{entity_type} {direction}_{frame_name}",  # "entity direction_frame"
-                        f"{entity_type} {direction} {frame_name}",  # "entity direction frame"
-                    ]
-                    
-                    for sprite_name_format in naming_formats:
-                        filename_base = f"{sprite_name_format}.png"
-                        found = False
-                        
-                        for search_path in search_paths:
-                            filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                            
-                            if os.path.exists(filename):
-                                try:
-                                    sprite_img = pygame.image.load(filename).convert_alpha()
-                                    sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                                    
-                                    # Store with normalized name (underscores only)
-                                    normalized_name = f"{entity_type}_{direction}_{frame_name}"
-                                    self.sprite_manager.sprites[normalized_name] = sprite_img
-                                    sprite_files_loaded += 1
-                                    found = True
-                                    break
-                                except Exception as e:
-                                    print(f"Failed to load {filename}: {e}")
-                        
-                        if found:
-                            break  # Found with this format, stop trying other formats
-                
-                # Also try old 2-frame format (backward compatibility)
-                for frame in [1, 2]:
-                    sprite_name = f"{entity_type}_{direction}_{frame}"
-                    
-                    # Only load if not already loaded by 4-frame system
-                    if sprite_name in self.sprite_manager.sprites:
-                        continue
-                    
-                    filename_base = f"{sprite_name}.png"
-                    
-                    for search_path in search_paths:
-                        filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                        
-                        if os.path.exists(filename):
-                            try:
-                                sprite_img = pygame.image.load(filename).convert_alpha()
-                                sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                                self.sprite_manager.sprites[sprite_name] = sprite_img
-                                sprite_files_loaded += 1
-                                break
-                            except Exception as e:
-                                print(f"Failed to load {filename}: {e}")
+                checked = [os.path.join(sp, filename_base) if sp else filename_base for sp in search_paths]
+                variant_missing.append(f"{variant_name}: not found at {checked}")
         
-        # Load biome-specific wall variants
-        wall_variants = ['wall_forest', 'wall_desert', 'wall_plains', 
-                        'wall_mountains', 'wall_tundra', 'wall_swamp']
+        # Load entity animation sprites: first naming format found wins
+        for sprite_name, candidates in ENTITY_SPRITE_CANDIDATES:
+            for filename_base in candidates:
+                if queue_sprite(sprite_name, filename_base, 'alpha'):
+                    break
         
-        for wall_variant in wall_variants:
-            filename_base = f"{wall_variant}.png"
-            
-            for search_path in search_paths:
-                filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                
-                if os.path.exists(filename):
-                    try:
-                        sprite_img = pygame.image.load(filename).convert()
-                        sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                        self.sprite_manager.sprites[wall_variant] = sprite_img
-                        sprite_files_loaded += 1
-                        break
-                    except Exception as e:
-                        print(f"Failed to load {filename}: {e}")
-        
-        # Load item sprites (for dropped item overlays)
-        # Collect unique sprite_name values from ITEMS definitions
-        item_sprite_names = set()
-        for item_key, item_data in ITEMS.items():
-            if 'sprite_name' in item_data:
-                item_sprite_names.add(item_data['sprite_name'])
-            # Also try loading by item key name directly
-            item_sprite_names.add(item_key)
-        
-        # Also load utility sprites (itembag, etc.)
-        item_sprite_names.add('itembag')
-        
-        for sprite_name in item_sprite_names:
-            if sprite_name in self.sprite_manager.sprites:
-                continue  # Already loaded (e.g. same as a cell sprite)
-            filename_base = f"{sprite_name}.png"
-            for search_path in search_paths:
-                filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                if os.path.exists(filename):
-                    try:
-                        sprite_img = pygame.image.load(filename).convert_alpha()
-                        sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                        self.sprite_manager.sprites[sprite_name] = sprite_img
-                        sprite_files_loaded += 1
-                        break
-                    except Exception as e:
-                        print(f"Failed to load item sprite {filename}: {e}")
-        
-        # Load sprites whose filenames don't match the standard key.lower()+".png" pattern,
-        # or that need guaranteed convert_alpha() regardless of alpha-detection result.
-        _explicit_sprites = {
-            'IRON_ORE':              'ironore.png',
-            'WELL':                  'well.png',
-            'iron_sword':            'sword.png',
-            'RUINED_SANDSTONE_COLUMN': 'ruined_sandstone_column.png',
-            'STONE_HOUSE':           'stone_house.png',
-            'CACTUS':                'cactus.png',
-            'BARREL':                'barrel.png',
-        }
-        for sprite_key, filename_base in _explicit_sprites.items():
-            if sprite_key in self.sprite_manager.sprites:
-                continue
-            for search_path in search_paths:
-                filename = os.path.join(search_path, filename_base) if search_path else filename_base
-                if os.path.exists(filename):
-                    try:
-                        sprite_img = pygame.image.load(filename).convert_alpha()
-                        sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
-                        self.sprite_manager.sprites[sprite_key] = sprite_img
-                        sprite_files_loaded += 1
-                        break
-                    except Exception as e:
-                        print(f"Failed to load {filename}: {e}")
+        # Load biome-specific wall variants
+        for wall_variant in WALL_VARIANT_SPRITES:
+            queue_sprite(wall_variant, f"{wall_variant}.png", 'opaque')
+        
+        # Load item sprites (for dropped item overlays), unless already
+        # queued (e.g. same as a cell sprite)
+        for sprite_name in ITEM_SPRITE_NAMES:
+            if sprite_name not in planned:
+                queue_sprite(sprite_name, f"{sprite_name}.png", 'alpha')
+        
+        # Load sprites whose filenames don't match the standard pattern
+        for sprite_key, filename_base in EXPLICIT_SPRITE_FILES.items():
+            if sprite_key not in planned:
+                queue_sprite(sprite_key, filename_base, 'alpha')
+
+        # Reuse the decoded+scaled atlas from the last launch when none of
+        # the resolved files have changed since it was written
+        cache_path = os.path.join(script_dir, SPRITE_CACHE_FILE)
+        signature = _sprite_cache_signature(pending)
+        cached = _load_sprite_cache(cache_path, signature) if signature else None
+        if cached is not None:
+            for sprite_key, (size, fmt, data) in cached.items():
+                sprite_img = pygame.image.frombuffer(data, size, fmt)
+                sprite_img = sprite_img.convert_alpha() if fmt == 'RGBA' else sprite_img.convert()
+                self.sprite_manager.sprites[sprite_key] = sprite_img
+                sprite_files_loaded += 1
+        else:
+            # Decode every queued file in parallel
+            with ThreadPoolExecutor(max_workers=SPRITE_DECODE_WORKERS) as pool:
+                decoded = list(pool.map(_decode_sprite_file, [filename for _, filename, _ in pending]))
+
+            # Convert and scale on the display thread
+            load_failed = False
+            for (sprite_key, filename, mode), sprite_img in zip(pending, decoded):
+                if isinstance(sprite_img, Exception):
+                    load_failed = True
+                    if sprite_key in variant_keys:
+                        variant_missing.append(f"{sprite_key}: load error - {sprite_img}")
+                    else:
+                        print(f"Failed to load {filename}: {sprite_img}")
+                    continue
+                if mode == 'alpha' or (mode == 'auto' and (
+                        sprite_img.get_alpha() is not None or sprite_img.get_colorkey() is not None)):
+                    sprite_img = sprite_img.convert_alpha()
+                else:
+                    sprite_img = sprite_img.convert()
+                sprite_img = pygame.transform.scale(sprite_img, (CELL_SIZE, CELL_SIZE))
+                self.sprite_manager.sprites[sprite_key] = sprite_img
+                sprite_files_loaded += 1
+
+            # Only cache a clean load so broken files keep reporting errors
+            if signature and not load_failed:
+                _save_sprite_cache(cache_path, signature, self.sprite_manager.sprites)
+        variant_loaded_count = sum(1 for key in variant_keys if key in self.sprite_manager.sprites)
 
         # If individual files were loaded, use them
         if sprite_files_loaded > 0:
-            print("\n" + "=" * 60)
-            print("LOADING SPRITE SYSTEM...")
-            print("=" * 60)
             print(f"✓ Loaded {sprite_files_loaded} individual sprite files")
             
-            # Debug: Show what was loaded
-            print("\nLoaded sprites:")
-            for sprite_name in sorted(self.sprite_manager.sprites.keys()):
-                sprite = self.sprite_manager.sprites[sprite_name]
-                has_alpha = sprite.get_flags() & pygame.SRCALPHA
-                print(f"  - {sprite_name}: {sprite.get_size()}, alpha={'YES' if has_alpha else 'NO'}")
-            
             # Don't generate structure sprites - only use actual sprite files
             # This ensures cells without sprites show as colored rectangles with labels
             
-            loaded_sprites = self.sprite_manager.get_all_sprite_names()
-            print(f"✓ Total sprites available: {len(loaded_sprites)}")
-            
-            # Variant sprite report
-            if variant_search_count > 0:
-                print(f"\nCell variants: {variant_loaded_count}/{variant_search_count} loaded")
-                if variant_missing:
-                    for msg in variant_missing[:5]:  # Show first 5 missing
-                        print(f"  ✗ {msg}")
-            
-            print("=" * 60 + "\n")
+            if DEBUG_SPRITE_LOAD:
+                print("\n" + "=" * 60)
+                print("LOADING SPRITE SYSTEM...")
+                print("=" * 60)
+                
+                # Debug: Show what was loaded
+                print("\nLoaded sprites:")
+                for sprite_name in sorted(self.sprite_manager.sprites.keys()):
+                    sprite = self.sprite_manager.sprites[sprite_name]
+                    has_alpha = sprite.get_flags() & pygame.SRCALPHA
+                    print(f"  - {sprite_name}: {sprite.get_size()}, alpha={'YES' if has_alpha else 'NO'}")
+                
+                loaded_sprites = self.sprite_manager.get_all_sprite_names()
+                print(f"✓ Total sprites available: {len(loaded_sprites)}")
+                
+                # Variant sprite report
+                if variant_search_count > 0:
+                    print(f"\nCell variants: {variant_loaded_count}/{variant_search_count} loaded")
+                    if variant_missing:
+                        for msg in variant_missing[:5]:  # Show first 5 missing
+                            print(f"  ✗ {msg}")
+                
+                print("=" * 60 + "\n")
             self.use_sprites = True
         else:
             # No sprites found, use color fallback
@@ -517,136 +600,16 @@ class GameCoreMixin:
         """Check if player has been idle for catch-up window"""
         return self.tick - self.last_input_tick > 60  # 1 second idle
     
-    def update_cells(self):
-        """Update cell growth and changes for all screens based on distance"""
-        # Update current screen more frequently
-        if self.tick % 60 == 0:
-            # Current zone full update
-            screen_x = self.player['screen_x']
-            screen_y = self.player['screen_y']
-            screen_key = f"{screen_x},{screen_y}"
-            
-            if screen_key in self.screens:
-                self.bug_catcher.log_zone_cells(self.tick, screen_key, self.screens[screen_key]['grid'])
-                self.apply_cellular_automata(screen_x, screen_y)
-                self.decay_dropped_items(screen_x, screen_y)
-
-        # Update nearby screens less frequently
-        if self.tick % 180 == 0:  # Every 3 seconds
-            # Update adjacent screens (distance 1)
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue  # Skip current screen
-                    screen_x = self.player['screen_x'] + dx
-                    screen_y = self.player['screen_y'] + dy
-                    screen_key = f"{screen_x},{screen_y}"
-                    
-                    if screen_key in self.screens:
-                        self.apply_cellular_automata(screen_x, screen_y)
-                        self.decay_dropped_items(screen_x, screen_y)
-        
-        # Update distant screens even less frequently
-        if self.tick % 600 == 0:  # Every 10 seconds
-            # Update screens at distance 2
-            for dx in [-2, -1, 0, 1, 2]:
-                for dy in [-2, -1, 0, 1, 2]:
-                    distance = abs(dx) + abs(dy)  # Manhattan distance
-                    if distance <= 1 or distance > 2:
-                        continue
-                    screen_x = self.player['screen_x'] + dx
-                    screen_y = self.player['screen_y'] + dy
-                    screen_key = f"{screen_x},{screen_y}"
-
-                    if screen_key in self.screens:
-                        self.apply_cellular_automata(screen_x, screen_y)
-                        self.decay_dropped_items(screen_x, screen_y)
-            pass  # distance-2 update complete
-
-    def update_entities(self):
-        """Update all entities - AI, movement, stats.
-
-        On-screen entities (screen_distance == 0) get AI updated every game
-        tick so combat move_cooldown counts down at the correct 60-fps rate.
-        Stat decay/healing and off-screen AI are still throttled every 30 ticks
-        to keep performance reasonable.
-        """
-        do_slow_update = (self.tick % 30 == 0)
-
-        # Spawning check every 0.5 s
-        if do_slow_update:
-            self.check_zone_spawning()
-
-        entities_to_remove = []
-
-        player_screen_x = self.player['screen_x']
-        player_screen_y = self.player['screen_y']
-
-        for entity_id, entity in list(self.entities.items()):
-            screen_distance = abs(entity.screen_x - player_screen_x) + abs(entity.screen_y - player_screen_y)
-
-            # Remove dead entities FIRST (regardless of distance)
-            if not entity.is_alive():
-                entities_to_remove.append(entity_id)
-                continue
-
-            # Only update entities within 2 screens of player
-            if screen_distance > 2:
-                continue
-
-            # ── Slow path (every 30 ticks): stat decay, healing, split ────
-            if do_slow_update:
-                entity_screen_key = f"{entity.screen_x},{entity.screen_y}"
-                if entity.type.endswith('_double'):
-                    if self.try_split_double_entity(entity_id, entity, entity_screen_key):
-                        continue  # Entity was split — re-evaluate next tick
-
-                entity.decay_stats()
-
-                heal_boost = 1.0
-                if not entity.props.get('hostile', False):
-                    screen_key = f"{entity.screen_x},{entity.screen_y}"
-                    if screen_key in self.screens:
-                        screen = self.screens[screen_key]
-                        for dx in range(-3, 4):
-                            for dy in range(-3, 4):
-                                check_x = entity.x + dx
-                                check_y = entity.y + dy
-                                if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                                    cell = screen['grid'][check_y][check_x]
-                                    if cell == 'CAMP':
-                                        heal_boost = 2.0
-                                        break
-                                    elif cell == 'HOUSE':
-                                        heal_boost = 3.0
-                                        break
-                            if heal_boost > 1.0:
-                                break
-                entity.regenerate_health(heal_boost)
-
-            # ── AI update: on-screen every tick, off-screen throttled ──────
-            if screen_distance == 0:
-                self.update_entity_ai(entity_id, entity)
-                self.update_structure_npc_behavior(entity_id, entity)
-            elif screen_distance == 1:
-                if self.tick % 60 == 0:
-                    self.update_entity_ai(entity_id, entity)
-                    self.update_structure_npc_behavior(entity_id, entity)
-            else:
-                if self.tick % 90 == 0:
-                    self.update_entity_ai(entity_id, entity)
-                    self.update_structure_npc_behavior(entity_id, entity)
-
-        for entity_id in entities_to_remove:
-            self.remove_entity(entity_id)
-    
     def remove_entity(self, entity_id):
         """Remove an entity from the game"""
-        if entity_id not in self.entities:
+        # Unregister first so a second kill of the same entity, from this tick
+        # or from anything triggered during teardown, is a no-op rather than
+        # a second round of drops
+        entity = self.entities.pop(entity_id, None)
+        if entity is None:
             return
         
-        entity = self.entities[entity_id]
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         
         # Log death reason if not from combat
         if entity.health <= 0:
@@ -670,85 +633,71 @@ class GameCoreMixin:
         if entity_id in self.followers:
             self.followers.remove(entity_id)
             item_name = self.follower_items.pop(entity_id, None)
-            if item_name and self.inventory.has_item(item_name):
+            if item_name:
+                # remove_item checks and decrements in one pass; a missing item is a no-op
                 self.inventory.remove_item(item_name, 1)
             print(f"{entity.type} follower has died!")
 
         # Collect all item drops into a single dict before placing them
         all_item_drops = {}  # {item_name: count}
 
+        # Drops land on or around the death cell, clamped inside the zone walls
+        ex, ey = entity.x, entity.y
+        drop_x = max(1, min(GRID_WIDTH - 2, ex))
+        drop_y = max(1, min(GRID_HEIGHT - 2, ey))
+        rand = random.random
+
         # Cell-placement drops (not items — apply immediately)
         if 'drops' in entity.props:
             for drop in entity.props['drops']:
-                if random.random() < drop['chance']:
+                if rand() < drop['chance']:
                     if 'cell' in drop:
                         if screen_key in self.screens:
-                            cx = max(1, min(GRID_WIDTH - 2, entity.x))
-                            cy = max(1, min(GRID_HEIGHT - 2, entity.y))
-                            self.screens[screen_key]['grid'][cy][cx] = drop['cell']
+                            screen = self.screens[screen_key]
+                            if screen['grid'][drop_y][drop_x] in HEAL_BOOST_CELLS:
+                                self.invalidate_heal_boost_field(screen)
+                            screen['grid'][drop_y][drop_x] = drop['cell']
                     elif 'item' in drop:
                         item_name = drop['item']
                         all_item_drops[item_name] = all_item_drops.get(item_name, 0) + drop.get('amount', 1)
 
         # Magic rune chance
-        if random.random() < 0.15:
+        if rand() < 0.15:
             all_item_drops['magic_rune'] = all_item_drops.get('magic_rune', 0) + 1
 
         # Entity inventory drops (skip spells and wood/planks)
         for item_name, count in entity.inventory.items():
-            if item_name in ITEMS and ITEMS[item_name].get('is_spell', False):
-                continue
-            if item_name in ('wood', 'planks'):
+            if not count or item_name in NON_DROPPABLE_ITEMS:
                 continue
             all_item_drops[item_name] = all_item_drops.get(item_name, 0) + count
 
         if all_item_drops:
-            if screen_key not in self.dropped_items:
-                self.dropped_items[screen_key] = {}
-
             # Scatter 1-2 individual items nearby so they display as item sprites
             scatter_pool = [(k, v) for k, v in all_item_drops.items() if v >= 1]
             n_scatter = min(random.randint(1, 2), len(scatter_pool))
             scattered = random.sample(scatter_pool, n_scatter)
+            randint = random.randint
             for item_name, _ in scattered:
                 all_item_drops[item_name] -= 1
                 if all_item_drops[item_name] <= 0:
                     del all_item_drops[item_name]
-                sx = max(1, min(GRID_WIDTH - 2, entity.x + random.randint(-2, 2)))
-                sy = max(1, min(GRID_HEIGHT - 2, entity.y + random.randint(-2, 2)))
-                cell_key = (sx, sy)
-                if cell_key not in self.dropped_items[screen_key]:
-                    self.dropped_items[screen_key][cell_key] = {}
-                self.dropped_items[screen_key][cell_key][item_name] = \
-                    self.dropped_items[screen_key][cell_key].get(item_name, 0) + 1
+                sx = max(1, min(GRID_WIDTH - 2, ex + randint(-2, 2)))
+                sy = max(1, min(GRID_HEIGHT - 2, ey + randint(-2, 2)))
+                self.add_dropped_item(screen_key, (sx, sy), item_name)
 
             # Consolidate remaining items into one pile at entity position → shows as itembag
             if all_item_drops:
-                pile_x = max(1, min(GRID_WIDTH - 2, entity.x))
-                pile_y = max(1, min(GRID_HEIGHT - 2, entity.y))
-                pile_key = (pile_x, pile_y)
-                if pile_key not in self.dropped_items[screen_key]:
-                    self.dropped_items[screen_key][pile_key] = {}
                 for item_name, count in all_item_drops.items():
-                    self.dropped_items[screen_key][pile_key][item_name] = \
-                        self.dropped_items[screen_key][pile_key].get(item_name, 0) + count
+                    self.add_dropped_item(screen_key, (drop_x, drop_y), item_name, count)
         
-        # Remove from screen entities list
-        if screen_key in self.screen_entities:
-            if entity_id in self.screen_entities[screen_key]:
-                self.screen_entities[screen_key].remove(entity_id)
-
-        # Remove from any structure entities lists (catches entities that die inside structures)
-        for sub_list in self.screen_entities.values():
-            if entity_id in sub_list:
-                sub_list.remove(entity_id)
+        # Remove from every zone's entity set, including structure zones
+        # (catches entities that die inside structures)
+        for zone_entity_ids in self.screen_entities.values():
+            zone_entity_ids.discard(entity_id)
         
         # Check if this was a hostile entity and zone is now clear
-        if entity.props.get('hostile', False):
+        if entity.is_hostile:
             self.check_zone_clear_hostiles(screen_key)
-        
-        # Remove from entities dict
-        del self.entities[entity_id]
 
     def check_follower_integrity(self):
         """Every-tick check: ensure followers are alive, non-hostile, not targeting player."""
@@ -764,13 +713,13 @@ class GameCoreMixin:
                 entity.current_target = None
                 entity.ai_state = 'idle'
             # Ensure hostile flag stays off
-            if entity.props.get('hostile', False):
-                entity.props['hostile'] = False
+            if entity.is_hostile:
+                entity.set_hostile(False)
 
         for entity_id in stale_ids:
             self.followers.remove(entity_id)
             item_name = self.follower_items.pop(entity_id, None)
-            if item_name and self.inventory.has_item(item_name):
+            if item_name:
                 self.inventory.remove_item(item_name, 1)
         # Clean up follower_items entries with no matching follower
         for entity_id in list(self.follower_items.keys()):
@@ -789,7 +738,7 @@ class GameCoreMixin:
             return
 
         # Inspection only triggers while Shift is held
-        keys = pygame.key.get_pressed()
+        keys = self._keys_this_tick
         if not (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]):
             self.inspected_npc = None
             return
@@ -802,13 +751,14 @@ class GameCoreMixin:
         check_x, check_y = target
 
         # Unified zone system: player screen coords reflect current zone (incl. structure virtual coords)
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         candidates = self.screen_entities.get(screen_key, [])
 
         # Find entity at target cell
+        entities_get = self.entities.get
         for entity_id in candidates:
-            if entity_id in self.entities:
-                entity = self.entities[entity_id]
+            entity = entities_get(entity_id)
+            if entity is not None:
                 if entity.x == check_x and entity.y == check_y:
                     # Never inspect the autopilot proxy — it renders as the player
                     if entity.props.get('is_autopilot_proxy', False):
@@ -834,147 +784,40 @@ class GameCoreMixin:
     
     def is_at_corner(self, x, y):
         """Check if position is near a zone corner"""
-        # Define corners as 3x3 areas in each corner
+        # Corners are the 3x3 areas where an edge column meets an edge row
         corner_size = 3
-        # Top-left corner
-        if x < corner_size and y < corner_size:
-            return True
-        # Top-right corner
-        if x >= GRID_WIDTH - corner_size and y < corner_size:
-            return True
-        # Bottom-left corner
-        if x < corner_size and y >= GRID_HEIGHT - corner_size:
-            return True
-        # Bottom-right corner
-        if x >= GRID_WIDTH - corner_size and y >= GRID_HEIGHT - corner_size:
-            return True
-        return False
+        return ((x < corner_size or x >= GRID_WIDTH - corner_size) and
+                (y < corner_size or y >= GRID_HEIGHT - corner_size))
     
     def get_nearest_corner_target(self, x, y):
         """Get the nearest corner position for miner to target"""
-        corners = [
-            (2, 2),  # Top-left
-            (GRID_WIDTH - 3, 2),  # Top-right
-            (2, GRID_HEIGHT - 3),  # Bottom-left
-            (GRID_WIDTH - 3, GRID_HEIGHT - 3)  # Bottom-right
-        ]
-        
-        # Find closest corner
-        closest = None
-        closest_dist = float('inf')
-        for corner_x, corner_y in corners:
-            dist = abs(x - corner_x) + abs(y - corner_y)
-            if dist < closest_dist:
-                closest_dist = dist
-                closest = (corner_x, corner_y)
-        
-        return closest
+        # Manhattan distance splits per axis, so the nearest corner is just the
+        # nearer column and the nearer row; ties go left/top as before
+        right = 2 * x > GRID_WIDTH - 1
+        bottom = 2 * y > GRID_HEIGHT - 1
+        return CORNER_TARGETS[(right << 1) | bottom]
     
     def is_entity_at_position(self, x, y, screen_key, exclude_entity=None):
         """Check if any entity is at the given position (for collision detection)"""
-        if screen_key not in self.screen_entities:
+        entity_ids = self.screen_entities.get(screen_key)
+        if not entity_ids:
             return False
-        
-        for entity_id in self.screen_entities[screen_key]:
-            if entity_id not in self.entities:
+
+        # Coordinates are mutated in dozens of places, so rather than keep a
+        # position index in sync we make the scan itself as cheap as possible:
+        # one dict lookup per id and the coordinate test before anything else.
+        entities_get = self.entities.get
+        for entity_id in entity_ids:
+            entity = entities_get(entity_id)
+            if entity is None or entity.x != x or entity.y != y:
                 continue
-            
-            entity = self.entities[entity_id]
-            
+
             # Skip the entity we're checking for (don't collide with self)
-            if exclude_entity and entity is exclude_entity:
-                continue
-            
-            # Check if entity is at this position
-            if entity.x == x and entity.y == y:
+            if entity is not exclude_entity:
                 return True
-        
+
         return False
     
-    def update_screen_cells(self, screen_x, screen_y):
-        """Update cells for a specific screen coordinate"""
-        key = f"{screen_x},{screen_y}"
-        
-        # Only update if screen exists (has been generated)
-        if key not in self.screens:
-            return
-        
-        screen = self.screens[key]
-        
-        # Apply rain effects to nearby screens
-        if self.is_raining:
-            distance = abs(screen_x - self.player['screen_x']) + abs(screen_y - self.player['screen_y'])
-            if distance <= 2:  # Rain affects nearby screens
-                self.apply_rain(screen_x, screen_y)
-        
-        # BugCatcher: snapshot HOUSE/STONE_HOUSE before cell updates (player zone only)
-        player_zone = f"{self.player['screen_x']},{self.player['screen_y']}"
-        if key == player_zone:
-            self.bug_catcher.log_zone_cells(self.tick, key, screen['grid'])
-
-        # Apply cellular automata rules first
-        self.apply_cellular_automata(screen_x, screen_y)
-
-        # Then apply normal growth/decay
-        for y in range(1, GRID_HEIGHT - 1):
-            for x in range(1, GRID_WIDTH - 1):
-                # Skip enchanted cells - they don't grow or decay
-                if self.is_cell_enchanted(x, y, key):
-                    continue
-                
-                cell = screen['grid'][y][x]
-                if cell in CELL_TYPES:
-                    cell_info = CELL_TYPES[cell]
-                    
-                    # Growth
-                    if 'grows_to' in cell_info and random.random() < cell_info.get('growth_rate', 0):
-                        self.set_grid_cell(screen, x, y, cell_info['grows_to'])
-                    
-                    # Degradation (for crops and cobblestone)
-                    elif 'degrades_to' in cell_info and random.random() < cell_info.get('degrade_rate', 0):
-                        # Special handling for cobblestone - only decay outside center lanes
-                        if cell == 'COBBLESTONE':
-                            center_x = GRID_WIDTH // 2
-                            center_y = GRID_HEIGHT // 2
-                            
-                            # Check if in center lanes (±2 cells)
-                            on_horizontal_center = abs(y - center_y) <= 2
-                            on_vertical_center = abs(x - center_x) <= 2
-                            
-                            # Don't decay if on main roads
-                            if on_horizontal_center or on_vertical_center:
-                                continue
-                            
-                            # Check if touching structures (house, camp, cave)
-                            has_structure_neighbor = False
-                            for nx, ny in [(x-1, y), (x+1, y), (x, y-1), (x, y+1)]:
-                                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-                                    neighbor_cell = screen['grid'][ny][nx]
-                                    if neighbor_cell in ['HOUSE', 'CAMP', 'CAVE', 'MINESHAFT']:
-                                        has_structure_neighbor = True
-                                        break
-                            
-                            # Don't decay if near structures
-                            if has_structure_neighbor:
-                                continue
-                        
-                        # Apply decay
-                        self.set_grid_cell(screen, x, y, cell_info['degrades_to'])
-
-        # Desert rock/ore formation — SAND slowly solidifies into STONE;
-        # existing STONE rarely yields IRON_ORE
-        if screen.get('biome') == 'DESERT':
-            for y in range(1, GRID_HEIGHT - 1):
-                for x in range(1, GRID_WIDTH - 1):
-                    cell = screen['grid'][y][x]
-                    if cell == 'SAND' and random.random() < DESERT_ROCK_FORMATION_RATE:
-                        self.set_grid_cell(screen, x, y, 'STONE')
-                    elif cell == 'STONE' and random.random() < DESERT_ORE_FORMATION_RATE:
-                        self.set_grid_cell(screen, x, y, 'IRON_ORE')
-
-        # Track last update
-        self.screen_last_update[key] = self.tick
-    
     def handle_input(self):
         """Handle keyboard and mouse input"""
         for event in pygame.event.get():
@@ -1005,121 +848,9 @@ class GameCoreMixin:
                         self.running = False
                 
                 elif self.state == 'playing':
-                    if event.key == pygame.K_ESCAPE:
-                        self.state = 'paused'
-                    elif event.key == pygame.K_SPACE:
-                        if 'crafting' in self.inventory.open_menus and self.inventory.selected.get('crafting'):
-                            self.attempt_craft_selected()
-                            continue
-                        if 'actions' in self.inventory.open_menus:
-                            selected_action = self.inventory.selected.get('actions')
-                            if selected_action:
-                                self.execute_action(selected_action)
-                                continue
-                        self.interact()
-                    elif event.key == pygame.K_l:
-                        selected = self.inventory.selected_magic
-                        if selected == 'rain_spell':
-                            self.cast_rain_spell()
-                        elif selected == 'day_spell':
-                            self.cast_day_spell()
-                        else:
-                            self.cast_star_spell()
-                    elif event.key == pygame.K_k:
-                        # Release all enchantments
-                        self.release_enchantments()
-                    elif event.key == pygame.K_j:
-                        # Release selected follower
-                        self.release_follower()
-                    elif event.key == pygame.K_b:
-                        # Toggle blocking
-                        self.player['blocking'] = not self.player['blocking']
-                        print(f"Blocking: {'ON' if self.player['blocking'] else 'OFF'}")
-                    elif event.key == pygame.K_v:
-                        # Toggle friendly fire (allow/deny damage to peaceful entities)
-                        self.player['friendly_fire'] = not self.player.get('friendly_fire', False)
-                        state = 'ON — can attack anyone' if self.player['friendly_fire'] else 'OFF — peaceful entities protected'
-                        print(f"Friendly Fire: {state}")
-                    elif event.key == pygame.K_c:
-                        # Toggle crafting screen
-                        _was_open = 'crafting' in self.inventory.open_menus
-                        self.inventory.toggle_menu('crafting')
-                        if not _was_open:
-                            # Auto-open ingredient panels so items are visible
-                            for _panel in ('items', 'tools', 'magic'):
-                                self.inventory.open_menus.add(_panel)
-                            # Pre-select first craftable recipe
-                            _craftable = self.inventory.get_craftable_recipes()
-                            if _craftable and not self.inventory.selected.get('crafting'):
-                                self.inventory.selected['crafting'] = _craftable[0][0]
-                            self.sound.on_inventory_open()
-                    elif event.key == pygame.K_x:
-                        # Attempt to craft with selected items
-                        self.attempt_craft()
-                    elif event.key == pygame.K_i:
-                        _was_open = 'items' in self.inventory.open_menus
-                        self.inventory.toggle_menu('items')
-                        if not _was_open:
-                            self.sound.on_inventory_open()
-                    elif event.key == pygame.K_t:
-                        _was_open = 'tools' in self.inventory.open_menus
-                        self.inventory.toggle_menu('tools')
-                        if not _was_open:
-                            self.sound.on_inventory_open()
-                    elif event.key == pygame.K_m:
-                        _was_open = 'magic' in self.inventory.open_menus
-                        self.inventory.toggle_menu('magic')
-                        if not _was_open:
-                            self.sound.on_inventory_open()
-                    elif event.key == pygame.K_r:
-                        _was_open = 'actions' in self.inventory.open_menus
-                        self.inventory.toggle_menu('actions')
-                        if not _was_open:
-                            self.sound.on_inventory_open()
-                    elif event.key == pygame.K_f:
-                        if pygame.key.get_mods() & pygame.KMOD_SHIFT:
-                            if self.inspected_npc:
-                                self.handle_npc_follow_interaction()
-                        else:
-                            _was_open = 'followers' in self.inventory.open_menus
-                            self.inventory.toggle_menu('followers')
-                            if not _was_open:
-                                self.sound.on_inventory_open()
-                    elif event.key == pygame.K_e:
-                        # Pick up cell or items from target
-                        self.pickup_cell_or_items()
-                    elif event.key == pygame.K_n:
-                        # NPC trade interaction
-                        self.npc_trade_interaction()
-                    elif event.key == pygame.K_p:
-                        # Place selected item as cell
-                        self.place_selected_item()
-                    elif event.key == pygame.K_q:
-                        mods = pygame.key.get_mods()
-                        if (mods & pygame.KMOD_SHIFT) and self.inspected_npc:
-                            self.handle_npc_quest_interaction()
-                        else:
-                            # Toggle quest UI
-                            self.quest_ui_open = not self.quest_ui_open
-                    elif event.key == pygame.K_d:
-                        # Drop selected item
-                        self.drop_selected_item()
-                    elif event.key == pygame.K_LEFT and (pygame.key.get_mods() & pygame.KMOD_SHIFT):
-                        self.cycle_inventory_slot(-1)
-                    elif event.key == pygame.K_RIGHT and (pygame.key.get_mods() & pygame.KMOD_SHIFT):
-                        self.cycle_inventory_slot(1)
-                    elif event.key == pygame.K_a and (pygame.key.get_mods() & pygame.KMOD_SHIFT):
-                        self.toggle_autopilot()
-                    elif event.key == pygame.K_g:
-                        # Toggle debug memory lanes visualization
-                        self.debug_memory_lanes = not self.debug_memory_lanes
-                        print(f"Debug Memory Lanes: {'ON' if self.debug_memory_lanes else 'OFF'}")
-                    # Number keys to select inventory slots
-                    elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, 
-                                      pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, 
-                                      pygame.K_9, pygame.K_0]:
-                        slot = (event.key - pygame.K_1) if event.key != pygame.K_0 else 9
-                        self.select_inventory_slot(slot)
+                    handler = self._playing_keydown.get(event.key)
+                    if handler is not None:
+                        handler()
                 
                 elif self.state == 'paused':
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
@@ -1129,9 +860,13 @@ class GameCoreMixin:
                     elif event.key == pygame.K_m:
                         self.state = 'menu'
         
+        # Sample held keys once per frame; move_player, NPC inspection and the
+        # HUD all read this snapshot instead of calling get_pressed() again
+        self._keys_this_tick = pygame.key.get_pressed()
+
         # Handle direction changes and close inventory on movement
         if self.state == 'playing':
-            keys = pygame.key.get_pressed()
+            keys = self._keys_this_tick
             moved = False
             if keys[pygame.K_UP] or keys[pygame.K_w]:
                 self.target_direction = 0
@@ -1151,6 +886,116 @@ class GameCoreMixin:
                 self.inventory.close_all_menus()
                 self.quest_ui_open = False
     
+    def _build_playing_keydown(self):
+        """Map pygame key codes to their KEYDOWN handlers while playing."""
+        table = {
+            pygame.K_ESCAPE: self._key_pause,
+            pygame.K_SPACE: self._key_interact,
+            pygame.K_l: self._key_cast_selected_spell,
+            pygame.K_k: self.release_enchantments,  # Release all enchantments
+            pygame.K_j: self.release_follower,  # Release selected follower
+            pygame.K_b: self._key_toggle_blocking,
+            pygame.K_v: self._key_toggle_friendly_fire,
+            pygame.K_c: self._key_toggle_crafting,
+            pygame.K_x: self.attempt_craft,  # Attempt to craft with selected items
+            pygame.K_i: lambda: self._key_toggle_panel('items'),
+            pygame.K_t: lambda: self._key_toggle_panel('tools'),
+            pygame.K_m: lambda: self._key_toggle_panel('magic'),
+            pygame.K_r: lambda: self._key_toggle_panel('actions'),
+            pygame.K_f: self._key_followers,
+            pygame.K_e: self.pickup_cell_or_items,  # Pick up cell or items from target
+            pygame.K_n: self.npc_trade_interaction,  # NPC trade interaction
+            pygame.K_p: self.place_selected_item,  # Place selected item as cell
+            pygame.K_q: self._key_quests,
+            pygame.K_d: self.drop_selected_item,  # Drop selected item
+            pygame.K_LEFT: lambda: self._key_shift_only(self.cycle_inventory_slot, -1),
+            pygame.K_RIGHT: lambda: self._key_shift_only(self.cycle_inventory_slot, 1),
+            pygame.K_a: lambda: self._key_shift_only(self.toggle_autopilot),
+            pygame.K_g: self._key_toggle_memory_lanes,
+        }
+        # Number keys to select inventory slots (1-9, then 0 for the tenth)
+        number_keys = [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+                       pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9, pygame.K_0]
+        for slot, key in enumerate(number_keys):
+            table[key] = lambda slot=slot: self.select_inventory_slot(slot)
+        return table
+
+    def _key_pause(self):
+        self.state = 'paused'
+
+    def _key_interact(self):
+        if 'crafting' in self.inventory.open_menus and self.inventory.selected.get('crafting'):
+            self.attempt_craft_selected()
+            return
+        if 'actions' in self.inventory.open_menus:
+            selected_action = self.inventory.selected.get('actions')
+            if selected_action:
+                self.execute_action(selected_action)
+                return
+        self.interact()
+
+    def _key_cast_selected_spell(self):
+        selected = self.inventory.selected_magic
+        if selected == 'rain_spell':
+            self.cast_rain_spell()
+        elif selected == 'day_spell':
+            self.cast_day_spell()
+        else:
+            self.cast_star_spell()
+
+    def _key_toggle_blocking(self):
+        self.player['blocking'] = not self.player['blocking']
+        print(f"Blocking: {'ON' if self.player['blocking'] else 'OFF'}")
+
+    def _key_toggle_friendly_fire(self):
+        # Toggle friendly fire (allow/deny damage to peaceful entities)
+        self.player['friendly_fire'] = not self.player.get('friendly_fire', False)
+        state = 'ON — can attack anyone' if self.player['friendly_fire'] else 'OFF — peaceful entities protected'
+        print(f"Friendly Fire: {state}")
+
+    def _key_toggle_crafting(self):
+        _was_open = 'crafting' in self.inventory.open_menus
+        self.inventory.toggle_menu('crafting')
+        if not _was_open:
+            # Auto-open ingredient panels so items are visible
+            for _panel in ('items', 'tools', 'magic'):
+                self.inventory.open_menus.add(_panel)
+            # Pre-select first craftable recipe
+            _craftable = self.inventory.get_craftable_recipes()
+            if _craftable and not self.inventory.selected.get('crafting'):
+                self.inventory.selected['crafting'] = _craftable[0][0]
+            self.sound.on_inventory_open()
+
+    def _key_toggle_panel(self, category):
+        _was_open = category in self.inventory.open_menus
+        self.inventory.toggle_menu(category)
+        if not _was_open:
+            self.sound.on_inventory_open()
+
+    def _key_followers(self):
+        if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+            if self.inspected_npc:
+                self.handle_npc_follow_interaction()
+        else:
+            self._key_toggle_panel('followers')
+
+    def _key_quests(self):
+        mods = pygame.key.get_mods()
+        if (mods & pygame.KMOD_SHIFT) and self.inspected_npc:
+            self.handle_npc_quest_interaction()
+        else:
+            # Toggle quest UI
+            self.quest_ui_open = not self.quest_ui_open
+
+    def _key_shift_only(self, action, *args):
+        if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+            action(*args)
+
+    def _key_toggle_memory_lanes(self):
+        # Toggle debug memory lanes visualization
+        self.debug_memory_lanes = not self.debug_memory_lanes
+        print(f"Debug Memory Lanes: {'ON' if self.debug_memory_lanes else 'OFF'}")
+
     def handle_inventory_click(self, pos):
         """Handle clicking on inventory items"""
         if not self.inventory.open_menus:
@@ -1364,7 +1209,7 @@ class GameCoreMixin:
         facing = self.player.get('facing', 'down')
         dx, dy = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}[facing]
         tx, ty = px + dx, py + dy
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         for eid in list(self.screen_entities.get(screen_key, [])):
             e = self.entities.get(eid)
             if e and int(e.x) == tx and int(e.y) == ty and not getattr(e, 'in_subscreen', False):
@@ -1388,7 +1233,7 @@ class GameCoreMixin:
             return
 
         if random.random() < 0.5:
-            self.followers.append(npc_id)
+            self.followers.add(npc_id)
             follower_name = f"{entity.type.lower()}_{npc_id}"
             entry = {
                 'color': entity.props.get('color', (180, 180, 180)),
@@ -1412,7 +1257,7 @@ class GameCoreMixin:
             entity.current_target = None
             entity.ai_state = 'idle'
             entity.idle_timer = 0
-            entity.props['hostile'] = False
+            entity.set_hostile(False)
             print(f"{npc_name} has decided to follow you!")
         else:
             print(f"{npc_name} declined to follow.")
@@ -1514,7 +1359,7 @@ class GameCoreMixin:
         if self.state != 'playing' or self.inventory.open_menus:
             return
         
-        keys = pygame.key.get_pressed()
+        keys = self._keys_this_tick
         
         # Check for autopilot every tick (has its own cooldown)
         any_movement_key = (keys[pygame.K_UP] or keys[pygame.K_w] or
@@ -1548,7 +1393,7 @@ class GameCoreMixin:
                                         dy = 0
                                 new_x, new_y = px + dx, py + dy
                                 cell = self.current_screen['grid'][new_y][new_x]
-                                if not CELL_TYPES.get(cell, {}).get('solid', False):
+                                if cell not in SOLID_CELLS:
                                     self.player['x'] = new_x
                                     self.player['y'] = new_y
                                     facing_map = {(0,-1): 'up', (0,1): 'down', (-1,0): 'left', (1,0): 'right'}
@@ -1641,33 +1486,29 @@ class GameCoreMixin:
             self.on_zone_transition(new_screen_x, new_screen_y)
             return
         
-        # Normal movement - bounds and collision check
+        # Normal movement - bounds and collision check. The border is not a
+        # solid sentinel (exit gaps, structure doorways), so the bounds test
+        # stays; it also keeps negative indices from wrapping around the grid
         if 0 <= new_x < GRID_WIDTH and 0 <= new_y < GRID_HEIGHT:
             target_cell = self.current_screen['grid'][new_y][new_x]
-            if not CELL_TYPES[target_cell]['solid']:
+            if target_cell not in SOLID_CELLS:
                 # Entity collision — block movement if an NPC occupies the target cell
-                screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+                screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
                 proxy_id = getattr(self, 'autopilot_proxy_id', None)
-                entity_blocked = False
-                check_list = self.screen_entities.get(screen_key, [])
-                for eid in check_list:
+                get_entity = self.entities.get
+                for eid in self.screen_entities.get(screen_key, ()):
                     if eid == proxy_id:
                         continue  # autopilot proxy is not a physical obstacle
-                    if eid in self.entities:
-                        e = self.entities[eid]
-                        if e.x == new_x and e.y == new_y:
-                            entity_blocked = True
-                            break
-                if entity_blocked:
-                    return
+                    e = get_entity(eid)
+                    if e is not None and e.x == new_x and e.y == new_y:
+                        return
                 self.player['x'] = new_x
                 self.player['y'] = new_y
                 self.player['screen_x'] = new_screen_x
                 self.player['screen_y'] = new_screen_y
                 self.player['is_moving'] = True
                 # Footstep sound on successful grid move
-                _stepped_cell = self.current_screen['grid'][new_y][new_x]
-                self.sound.on_footstep(_stepped_cell)
+                self.sound.on_footstep(target_cell)
 
     def get_target_cell(self):
         """Get the cell coordinates the player is targeting.
@@ -1678,31 +1519,32 @@ class GameCoreMixin:
             proxy = self.entities.get(self.autopilot_proxy_id)
             if proxy is not None:
                 ct = proxy.current_target
-                if isinstance(ct, tuple):
+                ct_type = type(ct)
+                if ct_type is int:
+                    # Entity target — point at that entity's cell
+                    te = self.entities.get(ct)
+                    if te is not None:
+                        return te.x, te.y
+                elif ct_type is tuple:
                     # ('cell', x, y, ...) or plain (x, y)
-                    if len(ct) >= 3 and ct[0] in ('cell', 'entity', 'structure'):
+                    head = ct[0] if ct else None
+                    if head in TARGET_TAGS and len(ct) >= 3:
                         tx, ty = int(ct[1]), int(ct[2])
-                    elif len(ct) >= 2 and isinstance(ct[0], (int, float)):
+                    elif type(head) in (int, float) and len(ct) >= 2:
                         tx, ty = int(ct[0]), int(ct[1])
                     else:
-                        tx, ty = None, None
-                    if tx is not None and 0 <= tx < GRID_WIDTH and 0 <= ty < GRID_HEIGHT:
+                        tx = ty = -1
+                    if 0 <= tx < GRID_WIDTH and 0 <= ty < GRID_HEIGHT:
                         return tx, ty
-                elif isinstance(ct, int) and ct in self.entities:
-                    # Entity target — point at that entity's cell
-                    te = self.entities[ct]
-                    return te.x, te.y
                 # Fall through: proxy has no current target — aim at cell in front of proxy
-                facing_dirs = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
-                fdx, fdy = facing_dirs.get(proxy.facing, (0, 1))
+                fdx, fdy = FACING_OFFSETS.get(proxy.facing, (0, 1))
                 tx, ty = proxy.x + fdx, proxy.y + fdy
                 if 0 <= tx < GRID_WIDTH and 0 <= ty < GRID_HEIGHT:
                     return tx, ty
                 return None
 
         # ── Manual play: use target_direction as before ───────────────────
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        dx, dy = directions[self.target_direction]
+        dx, dy = TARGET_OFFSETS[self.target_direction]
         target_x = self.player['x'] + dx
         target_y = self.player['y'] + dy
         
@@ -1713,171 +1555,177 @@ class GameCoreMixin:
     def interact(self):
         """Handle space bar interactions - attack if weapon equipped, otherwise normal gameplay"""
         # Snap player facing to match target direction
-        facing_map = {0: 'up', 1: 'down', 2: 'left', 3: 'right'}
-        self.player['facing'] = facing_map.get(self.target_direction, self.player['facing'])
+        self.player['facing'] = TARGET_FACINGS[self.target_direction]
         
         # Try to attack first if weapon selected
         if self.player_attack():
             return  # Attack was performed
         
-        # Check for entity at target location FIRST (before cell interactions)
         target = self.get_target_cell()
-        if target:
-            check_x, check_y = target
-            screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
-            
-            # Check if there's an entity at this position
-            if screen_key in self.screen_entities:
-                for entity_id in self.screen_entities[screen_key]:
-                    if entity_id in self.entities:
-                        entity = self.entities[entity_id]
-                        if entity.x == check_x and entity.y == check_y:
-                            # Target this entity
-                            self.inspected_npc = entity_id
-                            print(f"Targeting: {entity.name if entity.name else entity.type}")
-                            return  # Entity targeting takes priority
-        
-        # Otherwise, normal interactions
         if not target:
             return
         
         check_x, check_y = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+        
+        # Check for entity at target location FIRST (before cell interactions)
+        entities_get = self.entities.get
+        for entity_id in self.screen_entities.get(screen_key, ()):
+            entity = entities_get(entity_id)
+            if entity is not None and entity.x == check_x and entity.y == check_y:
+                # Target this entity
+                self.inspected_npc = entity_id
+                print(f"Targeting: {entity.name if entity.name else entity.type}")
+                return  # Entity targeting takes priority
         
+        # Otherwise, normal interactions
         # Cannot interact with enchanted cells
         if self.is_cell_enchanted(check_x, check_y, screen_key):
             print("Cannot interact with enchanted cell!")
             return
         
         cell = self.current_screen['grid'][check_y][check_x]
-        
-        # Check for structure exit (STAIRS_UP)
-        if cell == 'STAIRS_UP':
-            # Check if in a deep cave level
-            if self.player.get('in_structure'):
-                current_structure = self.structures.get(self.player['structure_key'])
-                if current_structure and current_structure['type'] == 'CAVE' and current_structure['depth'] > 1:
-                    # Ascend to previous cave level
-                    self.ascend_cave()
-                    return
-            # Otherwise, exit structure completely
-            self.exit_structure()
-            return
-        
-        # Check for deeper cave level (STAIRS_DOWN)
-        if cell == 'STAIRS_DOWN':
-            self.descend_cave()
-            return
-        
-        # Check for chest interaction
-        if cell == 'CHEST':
-            self.interact_with_chest(check_x, check_y)
-            return
-        
-        # Check for enterable structure (HOUSE, CAVE)
-        if CELL_TYPES.get(cell, {}).get('enterable'):
-            self.enter_structure(check_x, check_y)
+
+        # Stairs, chests and enterable structures work whatever is held
+        handler = self._interact_cell_actions.get(cell)
+        if handler is not None:
+            handler(cell, check_x, check_y)
             return
-        
+
         # Weapon check — swords only attack and enter/exit; no world tool interactions
         selected_tool = self.inventory.selected_tool
         if selected_tool and ITEMS.get(selected_tool, {}).get('is_weapon', False):
             return
 
-        # Chop tree — axe must be selected tool
-        if cell.startswith('TREE') and self.inventory.selected_tool == 'axe':
-            self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
-            self.handle_drops(cell, check_x, check_y)
-            self.show_attack_animation(check_x, check_y)
-            self.gain_xp(1)
-            return
+        handler = (self._interact_tool_actions.get((cell, selected_tool))
+                   or self._interact_fallback_actions.get(cell))
+        if handler is not None:
+            handler(cell, check_x, check_y)
+
+    def _build_interact_dispatch(self):
+        """Build interact's cell handler tables.
+
+        Returns (cell_actions, tool_actions, fallback_actions): handlers keyed
+        by cell, by (cell, selected tool), and by cell for the tool-less
+        actions tried last. Every handler takes (cell, x, y)."""
+        cell_actions = {
+            'STAIRS_UP': self._interact_stairs_up,
+            'STAIRS_DOWN': lambda cell, x, y: self.descend_cave(),
+            'CHEST': lambda cell, x, y: self.interact_with_chest(x, y),
+        }
+        for cell in ENTERABLE_CELLS:
+            cell_actions[cell] = lambda cell, x, y: self.enter_structure(x, y)
 
-        # Mine iron ore — pickaxe must be selected tool
-        if cell == 'IRON_ORE' and self.inventory.selected_tool == 'pickaxe':
-            self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
-            self.inventory.add_item('iron_ore', 1)
-            self.current_screen['grid'][check_y][check_x] = self.get_biome_base_cell()
-            self.show_attack_animation(check_x, check_y)
-            self.gain_xp(1)
-            return
+        tool_actions = {
+            ('IRON_ORE', 'pickaxe'): self._interact_mine_iron_ore,
+            ('STONE', 'pickaxe'): self._interact_mine_stone,
+            ('DIRT', 'hoe'): self._interact_till,
+        }
+        for cell in MINABLE_GROUND_CELLS:
+            tool_actions[(cell, 'pickaxe')] = self._interact_dig_mineshaft
+        for cell in TREE_CELLS:
+            tool_actions[(cell, 'axe')] = self._interact_chop_tree
+
+        fallback_actions = {'SOIL': self._interact_plant_carrot}
+        for cell in BONES_GROUND_CELLS:
+            fallback_actions[cell] = self._interact_place_bones
+        for cell in CARROT_CELLS:
+            if 'harvest' in CELL_TYPES[cell]:
+                fallback_actions[cell] = self._interact_harvest_crop
+        return cell_actions, tool_actions, fallback_actions
+
+    def _interact_stairs_up(self, cell, x, y):
+        """Climb one cave level, or leave the structure from its first level"""
+        # Check if in a deep cave level
+        if self.player.get('in_structure'):
+            current_structure = self.structures.get(self.player['structure_key'])
+            if current_structure and current_structure['type'] == 'CAVE' and current_structure['depth'] > 1:
+                # Ascend to previous cave level
+                self.ascend_cave()
+                return
+        # Otherwise, exit structure completely
+        self.exit_structure()
 
-        # Mine stone — pickaxe must be selected tool
-        if cell == 'STONE' and self.inventory.selected_tool == 'pickaxe':
-            self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
-            self.inventory.add_item('stone', 1)
-            self.current_screen['grid'][check_y][check_x] = 'DIRT'
-            self.show_attack_animation(check_x, check_y)
-            return
+    def _interact_chop_tree(self, cell, x, y):
+        """Chop tree — axe must be selected tool"""
+        self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
+        self.handle_drops(cell, x, y)
+        self.show_attack_animation(x, y)
+        self.gain_xp(1)
+
+    def _interact_mine_iron_ore(self, cell, x, y):
+        """Mine iron ore — pickaxe must be selected tool"""
+        self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
+        self.inventory.add_item('iron_ore', 1)
+        self.current_screen['grid'][y][x] = self.get_biome_base_cell()
+        self.show_attack_animation(x, y)
+        self.gain_xp(1)
+
+    def _interact_mine_stone(self, cell, x, y):
+        """Mine stone — pickaxe must be selected tool"""
+        self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
+        self.inventory.add_item('stone', 1)
+        self.current_screen['grid'][y][x] = 'DIRT'
+        self.show_attack_animation(x, y)
+
+    def _interact_dig_mineshaft(self, cell, x, y):
+        """Dig mineshaft — pickaxe must be selected tool"""
+        self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
+        depth = 1
+        in_cave = False
+        if self.player.get('in_structure'):
+            structure = self.structures.get(self.player.get('structure_key'))
+            if structure and structure.get('type') == 'CAVE':
+                depth = structure.get('depth', 1)
+                in_cave = True
+
+        mineshaft_chance = PLAYER_MINESHAFT_BASE_CHANCE / (MINESHAFT_DEPTH_DIVISOR ** (depth - 1))
+
+        # In overland: divide chance by count of existing caves/mineshafts in this zone
+        if not in_cave:
+            grid = self.current_screen['grid']
+            cave_count = sum(1 for row in grid for c in row if c in CAVE_ENTRANCE_CELLS)
+            if cave_count > 0:
+                mineshaft_chance /= cave_count
+
+        self.show_attack_animation(x, y)
+
+        if random.random() < mineshaft_chance:
+            self.current_screen['grid'][y][x] = 'MINESHAFT'
+            if in_cave:
+                print(f"You dug a mineshaft to depth {depth + 1}!")
+            else:
+                print(f"You discovered an underground passage!")
 
-        # Dig mineshaft — pickaxe must be selected tool
-        minable_ground = {'DIRT', 'SAND', 'GRASS', 'CAVE_FLOOR'}
-        if cell in minable_ground and self.inventory.selected_tool == 'pickaxe':
-            self.player['energy'] = max(0, self.player.get('energy', 0) - 1)
-            depth = 1
-            in_cave = False
-            if self.player.get('in_structure'):
-                structure = self.structures.get(self.player.get('structure_key'))
-                if structure and structure.get('type') == 'CAVE':
-                    depth = structure.get('depth', 1)
-                    in_cave = True
-
-            mineshaft_chance = PLAYER_MINESHAFT_BASE_CHANCE / (MINESHAFT_DEPTH_DIVISOR ** (depth - 1))
-
-            # In overland: divide chance by count of existing caves/mineshafts in this zone
-            if not in_cave:
-                grid = self.current_screen['grid']
-                cave_count = sum(1 for row in grid for c in row if c in ('CAVE', 'MINESHAFT', 'HIDDEN_CAVE'))
-                if cave_count > 0:
-                    mineshaft_chance /= cave_count
-
-            self.show_attack_animation(check_x, check_y)
-
-            if random.random() < mineshaft_chance:
-                self.current_screen['grid'][check_y][check_x] = 'MINESHAFT'
-                if in_cave:
-                    print(f"You dug a mineshaft to depth {depth + 1}!")
-                else:
-                    print(f"You discovered an underground passage!")
-            return
+    def _interact_till(self, cell, x, y):
+        """Till dirt — hoe must be selected tool"""
+        self.current_screen['grid'][y][x] = 'SOIL'
 
-        # Till dirt — hoe must be selected tool
-        if cell == 'DIRT' and self.inventory.selected_tool == 'hoe':
-            self.current_screen['grid'][check_y][check_x] = 'SOIL'
-            return
-        
-        # Harvest crops - get food items
-        if cell.startswith('CARROT') and 'harvest' in CELL_TYPES[cell]:
-            harvest = CELL_TYPES[cell]['harvest']
-            self.inventory.add_item(harvest['item'], harvest['amount'])
-            self.current_screen['grid'][check_y][check_x] = 'SOIL'
-            return
-        
-        # Plant carrot on soil
-        if cell == 'SOIL' and self.inventory.has_item('carrot'):
+    def _interact_harvest_crop(self, cell, x, y):
+        """Harvest crops - get food items"""
+        harvest = CELL_TYPES[cell]['harvest']
+        self.inventory.add_item(harvest['item'], harvest['amount'])
+        self.current_screen['grid'][y][x] = 'SOIL'
+
+    def _interact_plant_carrot(self, cell, x, y):
+        """Plant carrot on soil"""
+        if self.inventory.has_item('carrot'):
             self.inventory.remove_item('carrot', 1)
-            self.current_screen['grid'][check_y][check_x] = 'CARROT1'
+            self.current_screen['grid'][y][x] = 'CARROT1'
             self.gain_xp(1)
+
+    def _interact_place_bones(self, cell, x, y):
+        """Place bones as decoration on ground cells"""
+        if not self.inventory.has_item('bones'):
             return
-        
-        # Place bones as decoration on ground cells
-        if cell in ['GRASS', 'DIRT', 'SAND', 'STONE', 'FLOOR_WOOD', 'CAVE_FLOOR', 'COBBLESTONE'] and self.inventory.has_item('bones'):
-            self.inventory.remove_item('bones', 1)
-            
-            # Add bones to dropped items (as overlay decoration)
-            screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
-            if self.player.get('in_structure'):
-                screen_key = self.player.get('structure_key', screen_key)
-            
-            if screen_key not in self.dropped_items:
-                self.dropped_items[screen_key] = {}
-            
-            cell_key = (check_x, check_y)
-            if cell_key not in self.dropped_items[screen_key]:
-                self.dropped_items[screen_key][cell_key] = {}
-            
-            self.dropped_items[screen_key][cell_key]['bones'] = \
-                self.dropped_items[screen_key][cell_key].get('bones', 0) + 1
-            return
+        self.inventory.remove_item('bones', 1)
+
+        # Add bones to dropped items (as overlay decoration)
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+        if self.player.get('in_structure'):
+            screen_key = self.player.get('structure_key', screen_key)
+
+        self.add_dropped_item(screen_key, (x, y), 'bones')
     
     def enter_structure(self, cell_x, cell_y):
         """Player enters a house, cave, or mineshaft"""
@@ -1910,16 +1758,11 @@ class GameCoreMixin:
                 came_from_pos = (cell_x, cell_y)
 
         # Look for existing structure at this location
-        existing_key = None
-        for key, structure in self.structures.items():
-            if (structure['parent_screen'] == (parent_screen_x, parent_screen_y) and
-                structure['parent_cell'] == (cell_x, cell_y)):
-                existing_key = key
-                break
+        existing_key = self.find_structure((parent_screen_x, parent_screen_y), (cell_x, cell_y))
 
         # For CAVE/MINESHAFT, also check zone cave system
         if not existing_key and structure_type == 'CAVE':
-            parent_key = f"{parent_screen_x},{parent_screen_y}"
+            parent_key = make_zone_key(parent_screen_x, parent_screen_y)
             if parent_key in self.zone_cave_systems:
                 existing_key = self.zone_cave_systems[parent_key]
                 # Add this entrance to the cave system's entrance list
@@ -1969,7 +1812,7 @@ class GameCoreMixin:
         """Teleport all followers to wherever the player currently is (overworld or structure)."""
         in_sub = self.player.get('in_structure', False)
         sub_key = self.player.get('structure_key')
-        player_screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        player_screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         for fid in list(self.followers):
             if fid not in self.entities:
@@ -1977,7 +1820,7 @@ class GameCoreMixin:
             f = self.entities[fid]
 
             # Remove from old location (unified registry — search all zone entity lists)
-            old_sk = f"{f.screen_x},{f.screen_y}"
+            old_sk = make_zone_key(f.screen_x, f.screen_y)
             for sk, lst in self.screen_entities.items():
                 if fid in lst:
                     lst.remove(fid)
@@ -1985,16 +1828,16 @@ class GameCoreMixin:
             # Place in new location (screen_entities is the unified registry)
             if in_sub and sub_key:
                 if sub_key not in self.screen_entities:
-                    self.screen_entities[sub_key] = []
+                    self.screen_entities[sub_key] = set()
                 if fid not in self.screen_entities[sub_key]:
-                    self.screen_entities[sub_key].append(fid)
+                    self.screen_entities[sub_key].add(fid)
                 f.in_structure = True
                 f.structure_key = sub_key
             else:
                 if player_screen_key not in self.screen_entities:
-                    self.screen_entities[player_screen_key] = []
+                    self.screen_entities[player_screen_key] = set()
                 if fid not in self.screen_entities[player_screen_key]:
-                    self.screen_entities[player_screen_key].append(fid)
+                    self.screen_entities[player_screen_key].add(fid)
                 f.in_structure = False
                 f.structure_key = None
 
@@ -2019,7 +1862,7 @@ class GameCoreMixin:
         parent_screen_x, parent_screen_y, parent_cell_x, parent_cell_y = parent_info
         
         # Switch back to parent screen
-        parent_key = f"{parent_screen_x},{parent_screen_y}"
+        parent_key = make_zone_key(parent_screen_x, parent_screen_y)
         if parent_key in self.screens:
             self.current_screen = self.screens[parent_key]
         else:
@@ -2056,14 +1899,8 @@ class GameCoreMixin:
         new_depth = current_structure['depth'] + 1
         
         # Look for existing deeper level first
-        deeper_key = None
-        for key, structure in self.structures.items():
-            if (structure['parent_screen'] == (parent_screen_x, parent_screen_y) and
-                structure['parent_cell'] == (parent_cell_x, parent_cell_y) and
-                structure['type'] == 'CAVE' and
-                structure['depth'] == new_depth):
-                deeper_key = key
-                break
+        deeper_key = self.find_structure((parent_screen_x, parent_screen_y),
+                                         (parent_cell_x, parent_cell_y), 'CAVE', new_depth)
         
         # If not found, generate new deeper level
         if not deeper_key:
@@ -2120,14 +1957,8 @@ class GameCoreMixin:
         
         # Find or generate the level above
         # Look for existing structure at this depth
-        upper_level_key = None
-        for key, structure in self.structures.items():
-            if (structure['parent_screen'] == (parent_screen_x, parent_screen_y) and
-                structure['parent_cell'] == (parent_cell_x, parent_cell_y) and
-                structure['type'] == 'CAVE' and
-                structure['depth'] == target_depth):
-                upper_level_key = key
-                break
+        upper_level_key = self.find_structure((parent_screen_x, parent_screen_y),
+                                              (parent_cell_x, parent_cell_y), 'CAVE', target_depth)
         
         # If not found, generate it (shouldn't normally happen, but just in case)
         if not upper_level_key:
@@ -2165,7 +1996,7 @@ class GameCoreMixin:
         """
         parent_info = self.player['structure_parent']
         psx, psy = parent_info[0], parent_info[1]
-        zone_key = f"{psx},{psy}"
+        zone_key = make_zone_key(psx, psy)
         via_key = self.player.get('cave_via_structure')
         via_pos = self.player.get('cave_via_pos')
 
@@ -2233,43 +2064,34 @@ class GameCoreMixin:
         num_enemies = random.randint(1 + depth, 3 + depth)
         enemy_types = ['GOBLIN', 'SKELETON', 'WOLF']
         
-        spawned = 0
-        attempts = 0
-        
-        while spawned < num_enemies and attempts < 100:
-            x = random.randint(2, GRID_WIDTH - 3)
-            y = random.randint(2, GRID_HEIGHT - 3)
-            
-            # Check if valid spawn location (cave floor, not near entrance)
-            if grid[y][x] == 'CAVE_FLOOR' and abs(y - GRID_HEIGHT + 2) > 3:
-                enemy_type = random.choice(enemy_types)
-                # Level scales with depth
-                level = random.randint(depth, depth + 1)
-                
-                vx, vy = map(int, structure_key.split(','))
-                entity = Entity(enemy_type, x, y, vx, vy, level)
-                entity.in_structure = True
-                entity.structure_key = structure_key
-                entity_id = self.next_entity_id
-                self.next_entity_id += 1
-                self.entities[entity_id] = entity
-
-                if structure_key not in self.screen_entities:
-                    self.screen_entities[structure_key] = []
-                self.screen_entities[structure_key].append(entity_id)
-
-                spawned += 1
-            
-            attempts += 1
+        # Valid spawn cells: cave floor away from the entrance at the bottom.
+        # Built per call since descending is rare and the grid keeps changing
+        spawn_cells = [(x, y)
+                       for y in range(2, GRID_HEIGHT - 2) if abs(y - GRID_HEIGHT + 2) > 3
+                       for x in range(2, GRID_WIDTH - 2) if grid[y][x] == 'CAVE_FLOOR']
+
+        vx, vy = map(int, structure_key.split(','))
+        zone_entity_ids = self.screen_entities.setdefault(structure_key, set())
+        for x, y in random.sample(spawn_cells, min(num_enemies, len(spawn_cells))):
+            enemy_type = random.choice(enemy_types)
+            # Level scales with depth
+            level = random.randint(depth, depth + 1)
+
+            entity = Entity(enemy_type, x, y, vx, vy, level)
+            entity.in_structure = True
+            entity.structure_key = structure_key
+            entity_id = self.next_entity_id
+            self.next_entity_id += 1
+            self.entities[entity_id] = entity
+            zone_entity_ids.add(entity_id)
     
     def interact_with_chest(self, chest_x, chest_y):
         """Open chest and give loot to player"""
-        # Create unique chest identifier
-        if self.player['in_structure']:
-            chest_id = f"{self.player['structure_key']}:{chest_x},{chest_y}"
-        else:
-            screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
-            chest_id = f"{screen_key}:{chest_x},{chest_y}"
+        # Unique chest identifier: (zone key, x, y). Inside a structure the
+        # player's screen coords are the structure zone's virtual coords, so
+        # the zone key is the structure key there
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+        chest_id = (screen_key, chest_x, chest_y)
         
         # Check if already opened
         if chest_id in self.opened_chests:
@@ -2351,19 +2173,20 @@ class GameCoreMixin:
         self.dropped_items = {}
         self.enchanted_cells = {}
         self.enchanted_entities = {}
-        self.followers = []
+        self.followers = set()
         self.follower_items = {}
         self.npc_quests = []
         self.active_npc_quest_npc_id = None
         self.zone_keepers = {}
         self.structures = {}
+        self.structure_index = {}
         self.opened_chests = set()
         self.next_structure_id = 0
         self.door_map = {}
         self.entities = {}
         self.next_entity_id = 0
         self.screen_entities = {}
-        self.attack_animations = []
+        self.attack_animations.clear()
         self.current_screen = self.generate_screen(0, 0)
 
         # Choose follower type now but defer actual spawning until after time pass.
@@ -2381,7 +2204,7 @@ class GameCoreMixin:
                 for dy in range(-3, 4):
                     zone_x = self.player['screen_x'] + dx
                     zone_y = self.player['screen_y'] + dy
-                    screen_key = f"{zone_x},{zone_y}"
+                    screen_key = make_zone_key(zone_x, zone_y)
                     if screen_key not in self.screens:
                         self.generate_screen(zone_x, zone_y)
             
@@ -2403,14 +2226,14 @@ class GameCoreMixin:
     
     def update_enchanted_cells(self):
         """Update and remove enchanted cells with small random chance"""
-        cells_to_remove = []
-        for cell_key in list(self.enchanted_cells.keys()):
-            # 1% chance per tick to release enchantment
-            if random.random() < 0.01:
-                cells_to_remove.append(cell_key)
-        
-        for cell_key in cells_to_remove:
-            del self.enchanted_cells[cell_key]
+        enchanted_cells = self.enchanted_cells
+        if not enchanted_cells:
+            return
+
+        # 1% chance per tick to release enchantment
+        rand = random.random
+        for cell_key in [k for k in enchanted_cells if rand() < 0.01]:
+            del enchanted_cells[cell_key]
     
     def _auto_debug_shutdown(self):
         """Save, flush logs, and quit cleanly at end of AUTO_DEBUG session."""
@@ -2426,7 +2249,7 @@ class GameCoreMixin:
             'zone_count': len(getattr(self, 'screens', {})),
             'structure_count': len(getattr(self, 'structures', {})),
             'follower_count': len(getattr(self, 'followers', [])),
-            'player_zone': f"{self.player.get('screen_x',0)},{self.player.get('screen_y',0)}",
+            'player_zone': make_zone_key(self.player.get('screen_x',0), self.player.get('screen_y',0)),
             'player_health': self.player.get('health'),
             'player_level': self.player.get('level'),
         })
@@ -2448,82 +2271,132 @@ class GameCoreMixin:
         pygame.quit()
         self.running = False
 
+    def update_playing_tick(self):
+        """Advance the game by one simulation tick while playing.
+
+        Returns False once the AUTO_DEBUG timer has shut the game down."""
+        self.move_player()
+        self.check_follower_integrity()
+
+        # Sound: update music context + ambient each tick
+        _in_struct = bool(self.player.get('in_structure', False))
+        _cell_at_player = self.current_screen['grid'][self.player['y']][self.player['x']] if self.current_screen else None
+        self.sound.update(self.tick, 'playing', self.is_night, _in_struct, _cell_at_player)
+
+        # Check if targeting peaceful NPC for inspection
+        self.check_npc_inspection()
+        
+        # Freeze detector — log if any entity in the player's zone has idle_timer.
+        # Its only output is a print, so skip the scan while debug prints are off
+        if self.tick % 300 == 0 and self.debug_prints_enabled:
+            _pk = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+            _frozen = []
+            for _eid in self.screen_entities.get(_pk, ()):
+                _e = self.entities.get(_eid)
+                if _e is not None and getattr(_e, 'idle_timer', 0) > 0:
+                    _frozen.append(f"{_e.type}(id={_eid},timer={_e.idle_timer})")
+            if _frozen:
+                print(f"[FREEZE-DETECT] tick={self.tick} autopilot={getattr(self, 'autopilot', False)} "
+                      f"inspected_npc={self.inspected_npc} frozen={_frozen}")
+        
+        # Very slow player health and energy regen (once per second)
+        if self.tick % 60 == 0:
+            if self.player['health'] < self.player['max_health']:
+                self.player['health'] = min(
+                    self.player['health'] + 0.3,
+                    self.player['max_health']
+                )
+            max_e = self.player.get('max_energy', 100)
+            cur_e = self.player.get('energy', max_e)
+            if cur_e < max_e:
+                self.player['energy'] = min(cur_e + 1, max_e)
+
+        # Update quest system
+        self.update_quests()
+        
+        # Update enchanted cells
+        self.update_enchanted_cells()
+        
+        # New probabilistic update system
+        self.probabilistic_zone_updates()
+        
+        # Process catch-up during idle
+        if self.catchup_queue and self.is_idle():
+            self.process_catchup_queue()
+
+        # Watchdog: periodic sample + integrity checks + flush
+        self.watchdog.update(self.tick, self)
+
+        # AUTO_DEBUG: hard-stop when wall-clock timer expires
+        if hasattr(self, '_auto_debug_end_time') and _time.time() >= self._auto_debug_end_time:
+            self._auto_debug_shutdown()
+            return False
+
+        self.tick += 1
+        return True
+
     def run(self):
-        """Main game loop"""
+        """Main game loop.
+
+        Simulation runs on a fixed timestep: every rendered frame adds the
+        real elapsed time to an accumulator and runs one playing tick per
+        1/FPS second in it, so game speed no longer drops with the frame
+        rate. Catch-up is capped at MAX_TICKS_PER_FRAME and the backlog
+        beyond that is dropped, since simulation (not drawing) is what
+        makes a frame slow here.
+
+        Frames are paced to 1/FPS on perf_counter. pygame's clock.tick
+        works in whole milliseconds and settles at 16 ms frames against a
+        16.67 ms tick, so every ~25th frame ran no tick at all. The
+        accumulator also starts half a tick in, which keeps ordinary sleep
+        jitter from leaving one frame with zero ticks and the next with two."""
+        tick_s = 1.0 / FPS
+        half_tick = tick_s / 2
+        accumulator = tick_s + half_tick  # the first frame runs its tick too
+        # Bound once: the loop below runs every frame for the whole session
+        handle_input = self.handle_input
+        update_playing_tick = self.update_playing_tick
+        draw_game = self.draw_game
+        flip = pygame.display.flip
+        perf_counter = _time.perf_counter
+        sleep = _time.sleep
+        last_time = perf_counter()
+        next_frame = last_time + tick_s
         while self.running:
-            self.handle_input()
+            handle_input()
             
-            if self.state == 'playing':
-                self.move_player()
-                self.check_follower_integrity()
-
-                # Sound: update music context + ambient each tick
-                _in_struct = bool(self.player.get('in_structure', False))
-                _cell_at_player = self.current_screen['grid'][self.player['y']][self.player['x']] if self.current_screen else None
-                self.sound.update(self.tick, 'playing', self.is_night, _in_struct, _cell_at_player)
-
-                # Check if targeting peaceful NPC for inspection
-                self.check_npc_inspection()
-                
-                # Freeze detector — log if any entity in the player's zone has idle_timer
-                if self.tick % 300 == 0:
-                    _pk = f"{self.player['screen_x']},{self.player['screen_y']}"
-                    _frozen = []
-                    for _eid in self.screen_entities.get(_pk, []):
-                        if _eid in self.entities:
-                            _e = self.entities[_eid]
-                            if getattr(_e, 'idle_timer', 0) > 0:
-                                _frozen.append(f"{_e.type}(id={_eid},timer={_e.idle_timer})")
-                    if _frozen:
-                        print(f"[FREEZE-DETECT] tick={self.tick} autopilot={getattr(self, 'autopilot', False)} "
-                              f"inspected_npc={self.inspected_npc} frozen={_frozen}")
-                
-                # Very slow player health and energy regen (once per second)
-                if self.tick % 60 == 0:
-                    if self.player['health'] < self.player['max_health']:
-                        self.player['health'] = min(
-                            self.player['health'] + 0.3,
-                            self.player['max_health']
-                        )
-                    max_e = self.player.get('max_energy', 100)
-                    cur_e = self.player.get('energy', max_e)
-                    if cur_e < max_e:
-                        self.player['energy'] = min(cur_e + 1, max_e)
-
-                # Update quest system
-                self.update_quests()
-                
-                # Update enchanted cells
-                self.update_enchanted_cells()
-                
-                # New probabilistic update system
-                self.probabilistic_zone_updates()
-                
-                # Process catch-up during idle
-                if self.is_idle() and self.catchup_queue:
-                    self.process_catchup_queue()
-
-                # Watchdog: periodic sample + integrity checks + flush
-                self.watchdog.update(self.tick, self)
-
-                # AUTO_DEBUG: hard-stop when wall-clock timer expires
-                if hasattr(self, '_auto_debug_end_time') and _time.time() >= self._auto_debug_end_time:
-                    self._auto_debug_shutdown()
-                    break
-
-                self.tick += 1
-                self.draw_game()
-            elif self.state == 'death':
-                self.update_death_screen()
-                self.draw_death_screen()
-            elif self.state == 'menu':
-                self.sound.update(self.tick, 'menu', False, False, None)
-                self.draw_menu()
-            elif self.state == 'paused':
-                self.draw_paused()
+            state = self.state
+            if state == 'playing':
+                ticks = 0
+                while (accumulator >= tick_s and ticks < MAX_TICKS_PER_FRAME
+                       and self.state == 'playing'):
+                    if not update_playing_tick():
+                        return
+                    accumulator -= tick_s
+                    ticks += 1
+                if ticks == MAX_TICKS_PER_FRAME:
+                    accumulator = min(accumulator, tick_s)
+                draw_game()
+            else:
+                accumulator = half_tick
+                if state == 'death':
+                    self.update_death_screen()
+                    self.draw_death_screen()
+                elif state == 'menu':
+                    self.sound.update(self.tick, 'menu', False, False, None)
+                    self.draw_menu()
+                elif state == 'paused':
+                    self.draw_paused()
             
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            flip()
+            delay = next_frame - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            now = perf_counter()
+            # A frame that overran starts a fresh 1/FPS window
+            next_frame = max(next_frame + tick_s, now)
+            accumulator += now - last_time
+            last_time = now
         
         pygame.quit()
 
@@ -9,31 +9,77 @@ Override the install location:
 """
 import os
 import sys
+import json
+import time
+import importlib.util
 import subprocess
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_URL  = "https://github.com/qcruz/starcell.git"
 GAME_DIR  = Path(os.environ.get("STARCELL_DIR", Path.home() / "StarCell"))
 
+# Make git give up on a stalled transfer (under 1 KB/s for 10 s) and never
+# block on a credential prompt nobody can see
+GIT_ENV   = {
+    **os.environ,
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "10",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+# Keep housekeeping off the launch path: no auto gc/maintenance or
+# commit-graph writes after a fetch. Protocol v2 only advertises the refs
+# asked for instead of every branch and tag.
+GIT_CMD   = [
+    "git",
+    "-c", "gc.auto=0",
+    "-c", "maintenance.auto=false",
+    "-c", "fetch.writeCommitGraph=false",
+    "-c", "protocol.version=2",
+]
+FETCH_TIMEOUT = 60
+CLONE_TIMEOUT = 300
+
+# Last remote check, kept inside .git so it never shows up in the game tree.
+# Relaunching within CHECK_TTL seconds of a check skips the network entirely.
+CHECK_CACHE   = GAME_DIR / ".git" / "starcell_launcher_check.json"
+CHECK_TTL     = 300
+
+# (import name, pip package) for everything the game needs at runtime
+REQUIRED  = [
+    ("pygame", "pygame-ce"),
+]
+
 # ── Terminal colour codes ────────────────────────────────────────────────────
-RESET  = "\033[0m"
-BOLD   = "\033[1m"
-GREEN  = "\033[32m"
-YELLOW = "\033[33m"
-RED    = "\033[31m"
-CYAN   = "\033[36m"
+# Plain text when output is redirected, so logs carry no escape codes
+_TTY   = sys.stdout.isatty()
+RESET  = "\033[0m"  if _TTY else ""
+BOLD   = "\033[1m"  if _TTY else ""
+GREEN  = "\033[32m" if _TTY else ""
+YELLOW = "\033[33m" if _TTY else ""
+RED    = "\033[31m" if _TTY else ""
+CYAN   = "\033[36m" if _TTY else ""
+
+_BAR   = f"{BOLD}{CYAN}{'─' * 52}{RESET}"
 
 def banner(msg):
-    bar = "─" * 52
-    print(f"\n{BOLD}{CYAN}{bar}{RESET}")
+    print(f"\n{_BAR}")
     print(f"{BOLD}{CYAN}  {msg}{RESET}")
-    print(f"{BOLD}{CYAN}{bar}{RESET}\n")
+    print(f"{_BAR}\n")
 
-def ok(msg):   print(f"  {GREEN}✓{RESET}  {msg}")
-def info(msg): print(f"     {msg}")
-def warn(msg): print(f"  {YELLOW}⚠{RESET}  {msg}")
-def err(msg):  print(f"  {RED}✗{RESET}  {msg}")
+# The git update and the dependency check run side by side; keep their lines whole
+_print_lock = threading.Lock()
+
+def _say(line):
+    with _print_lock:
+        print(line)
+
+def ok(msg):   _say(f"  {GREEN}✓{RESET}  {msg}")
+def info(msg): _say(f"     {msg}")
+def warn(msg): _say(f"  {YELLOW}⚠{RESET}  {msg}")
+def err(msg):  _say(f"  {RED}✗{RESET}  {msg}")
 
 
 def check_git():
@@ -69,13 +115,71 @@ def choose_branch():
     return "main"
 
 
+def _git(*args, timeout=None):
+    return subprocess.run(
+        [*GIT_CMD, "-C", str(GAME_DIR), *args],
+        capture_output=True, text=True, timeout=timeout, env=GIT_ENV,
+    )
+
+
+def read_check_cache(branch):
+    """SHA from the last remote check of branch, if made within CHECK_TTL."""
+    try:
+        cache = json.loads(CHECK_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(cache, dict) or cache.get("branch") != branch
+            or not isinstance(cache.get("time"), (int, float))
+            or time.time() - cache["time"] >= CHECK_TTL):
+        return None
+    return cache.get("sha")
+
+
+def write_check_cache(branch, sha):
+    try:
+        CHECK_CACHE.write_text(json.dumps(
+            {"time": time.time(), "branch": branch, "sha": sha}))
+    except OSError:
+        pass  # only costs a network check next launch
+
+
+def is_up_to_date(branch):
+    """True when the local checkout already matches origin's branch tip.
+
+    One ls-remote round trip replaces the fetch/checkout/reset on the common
+    relaunch, and a remote check made in the last CHECK_TTL seconds skips
+    even that. Any failure (offline, timeout, other branch checked out,
+    edited tracked files) returns False so the full update path runs."""
+    if _git("rev-parse", "--abbrev-ref", "HEAD").stdout.strip() != branch:
+        return False
+    # reset --hard would also have discarded local edits to tracked files
+    if _git("status", "--porcelain", "--untracked-files=no").stdout.strip():
+        return False
+    head_sha = _git("rev-parse", "HEAD").stdout.strip()
+    if head_sha and read_check_cache(branch) == head_sha:
+        return True
+
+    try:
+        remote = _git("ls-remote", "origin", f"refs/heads/{branch}", timeout=5)
+    except subprocess.TimeoutExpired:
+        return False
+    remote_sha = remote.stdout.split()[0] if remote.returncode == 0 and remote.stdout else None
+    if not remote_sha:
+        return False
+    write_check_cache(branch, remote_sha)
+    return head_sha == remote_sha
+
+
 def update_or_clone(branch="main"):
     """Pull latest changes for the given branch; clone if not present."""
     if (GAME_DIR / ".git").exists():
         info(f"Game directory: {GAME_DIR}")
+        if is_up_to_date(branch):
+            ok(f"Already up to date with {branch}.")
+            return True
         info(f"Fetching '{branch}' from GitHub…")
 
-        # Preserve save files before git reset — git reset --hard deletes files
+        # Preserve save files before the forced checkout — it deletes files
         # that were previously tracked and later removed from the repo.
         save_patterns = [
             "savegame.json",
@@ -89,63 +193,130 @@ def update_or_clone(branch="main"):
             if p.exists():
                 preserved[name] = p.read_bytes()
 
-        # Fetch all remote branches
-        subprocess.run(
-            ["git", "-C", str(GAME_DIR), "fetch", "--all", "--quiet"],
-            capture_output=True, text=True,
-        )
-        # Checkout the chosen branch, then hard reset to match remote exactly
-        subprocess.run(
-            ["git", "-C", str(GAME_DIR), "checkout", branch],
-            capture_output=True, text=True,
-        )
+        # Fetch just the chosen branch tip. The clone is shallow and
+        # single-branch, so name the branch explicitly (otherwise a switch to
+        # a branch never fetched before has no origin/<branch> to reset to)
+        # and keep --depth=1 so updates never pull in old history.
+        try:
+            subprocess.run(
+                [*GIT_CMD, "-C", str(GAME_DIR), "fetch", "--depth=1", "--quiet", "origin",
+                 f"+refs/heads/{branch}:refs/remotes/origin/{branch}"],
+                capture_output=True, text=True, timeout=FETCH_TIMEOUT, env=GIT_ENV,
+            )
+        except subprocess.TimeoutExpired:
+            # Nothing has been checked out yet, so the local files are intact
+            warn("Update timed out — using local files.")
+            return True
+        # Point the chosen branch at origin/<branch> and force the working
+        # tree to match it exactly — one step covering checkout + reset --hard.
+        # -B creates the branch when missing: a single-branch clone has no
+        # remote-tracking refspec for git to guess it from
         result = subprocess.run(
-            ["git", "-C", str(GAME_DIR), "reset", "--hard", f"origin/{branch}"],
+            [*GIT_CMD, "-C", str(GAME_DIR), "checkout", "--quiet", "--force",
+             "-B", branch, f"origin/{branch}"],
             capture_output=True, text=True,
         )
 
-        # Restore save files after reset
+        # Restore save files after the checkout
         for name, data in preserved.items():
             (GAME_DIR / name).write_bytes(data)
             ok(f"Save file preserved: {name}")
 
         if result.returncode == 0:
+            write_check_cache(branch, _git("rev-parse", "HEAD").stdout.strip())
             ok(f"Up to date with {branch}.")
         else:
-            warn("git reset failed — running with existing local files.")
+            warn("git checkout failed — running with existing local files.")
             info(result.stderr.strip())
     else:
         info(f"First launch — cloning StarCell to {GAME_DIR} …")
         GAME_DIR.parent.mkdir(parents=True, exist_ok=True)
-        result = subprocess.run(
-            ["git", "clone", "--branch", branch, REPO_URL, str(GAME_DIR)],
-            capture_output=True, text=True,
-        )
+        existed = GAME_DIR.exists()
+        # Shallow clone: the launcher only needs the current tree, not history
+        try:
+            result = subprocess.run(
+                [*GIT_CMD, "clone", "--depth=1", "--single-branch", "--branch", branch,
+                 REPO_URL, str(GAME_DIR)],
+                capture_output=True, text=True, timeout=CLONE_TIMEOUT, env=GIT_ENV,
+            )
+        except subprocess.TimeoutExpired:
+            # A killed clone can leave a half-written .git behind, which the
+            # next launch would mistake for a working checkout
+            if not existed:
+                shutil.rmtree(GAME_DIR, ignore_errors=True)
+            err("Clone timed out — check your connection and try again.")
+            return False
         if result.returncode != 0:
             err("Clone failed:")
             info(result.stderr.strip())
             return False
+        write_check_cache(branch, _git("rev-parse", "HEAD").stdout.strip())
         ok("Clone complete.")
     return True
 
 
-def ensure_pygame():
-    try:
-        import pygame  # noqa: F401 — just checking presence
-        ok("pygame-ce ready.")
+def prewarm_libraries(import_name="pygame"):
+    """Pull a package's native libraries into the OS page cache.
+
+    The game dlopens pygame's extension modules and bundled SDL libraries as
+    soon as it starts; reading them now, while git is busy on the network,
+    means those loads hit memory instead of disk. Best effort only."""
+    spec = importlib.util.find_spec(import_name)
+    if spec is None or not spec.submodule_search_locations:
+        return
+    pkg_dir = Path(spec.submodule_search_locations[0])
+    # Wheels bundle shared libraries inside the package (macOS .dylibs/) or
+    # in a sibling <name>*.libs directory (Linux)
+    roots = [pkg_dir, *pkg_dir.parent.glob(f"{import_name}*.libs")]
+    fadvise = getattr(os, "posix_fadvise", None)
+    for root in roots:
+        for path in root.rglob("*"):
+            if path.suffix not in (".so", ".dylib"):
+                continue
+            try:
+                with open(path, "rb") as f:
+                    if fadvise:
+                        fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                    else:
+                        while f.read(1 << 20):
+                            pass
+            except OSError:
+                pass
+
+
+def missing_deps():
+    """pip names of REQUIRED packages that are not installed.
+
+    find_spec only locates the module, so nothing (SDL included) is loaded
+    into the launcher, which execs the game right afterwards anyway."""
+    return [pip_name for import_name, pip_name in REQUIRED
+            if importlib.util.find_spec(import_name) is None]
+
+
+def ensure_deps(missing=None):
+    """Install every missing dependency with a single pip invocation."""
+    if missing is None:
+        missing = missing_deps()
+    if not missing:
+        ok("Dependencies ready.")
         return True
-    except ImportError:
-        info("pygame-ce not found — installing…")
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "--quiet", "pygame-ce"],
-            capture_output=True, text=True,
-        )
-        if result.returncode == 0:
-            ok("pygame-ce installed.")
-            return True
-        err("pip install failed:")
-        info(result.stderr.strip())
-        return False
+    names = ", ".join(missing)
+    info(f"Installing {names}…")
+    # Skip pip's PyPI self-update check and any prompts; wheels only, since
+    # a source build (pygame-ce needs SDL headers) takes minutes
+    env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_INPUT": "1"}
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--quiet",
+         "--disable-pip-version-check", "--no-input", "--only-binary=:all:",
+         *missing],
+        capture_output=True, text=True, env=env,
+    )
+    if result.returncode == 0:
+        ok(f"Installed {names}.")
+        return True
+    err("pip install failed:")
+    info(result.stderr.strip())
+    return False
 
 
 def launch():
@@ -155,8 +326,12 @@ def launch():
         return False
     ok(f"Starting StarCell…\n")
     os.chdir(GAME_DIR)
-    # Replace this process with the game — Terminal window stays open for logs
-    os.execv(sys.executable, [sys.executable, str(main_py)])
+    # Replace this process with the game — Terminal window stays open for logs.
+    # execv skips interpreter shutdown, but it also drops unflushed output.
+    # The game runs unbuffered so its logs show up as they happen.
+    sys.stdout.flush()
+    os.execve(sys.executable, [sys.executable, str(main_py)],
+              {**os.environ, "PYTHONUNBUFFERED": "1"})
 
 
 # ── Entry point ──────────────────────────────────────────────────────────────
@@ -171,11 +346,22 @@ if __name__ == "__main__":
     branch = choose_branch()
     info(f"Branch: {branch}")
 
-    if not update_or_clone(branch):
+    # Warm the game's native libraries in the background. Never joined: the
+    # exec into the game ends the thread wherever it has got to.
+    threading.Thread(target=prewarm_libraries, daemon=True).start()
+
+    # Check dependencies while git waits on the network
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        git_job = pool.submit(update_or_clone, branch)
+        deps_job = pool.submit(missing_deps)
+        updated = git_job.result()
+        missing = deps_job.result()
+
+    if not updated:
         input("Press Enter to close…")
         sys.exit(1)
 
-    if not ensure_pygame():
+    if not ensure_deps(missing):
         input("Press Enter to close…")
         sys.exit(1)
 
@@ -12,7 +12,77 @@ import random
 from constants import (
     QUEST_TYPES, ITEMS,
     GRID_WIDTH, GRID_HEIGHT,
+    QUEST_RETARGET_INTERVAL,
 )
+from world.zones import make_zone_key, zone_coords
+
+# Zone offsets within the 7×7 window around the player, at least 2 steps away.
+# Used when a quest has to spawn its own target somewhere "out there".
+DISTANT_OFFSETS = tuple(
+    (dx, dy)
+    for dx in range(-3, 4)
+    for dy in range(-3, 4)
+    if abs(dx) + abs(dy) >= 2
+)
+
+# Zone offsets within 3 steps (Manhattan) of the player, nearest first.
+# Cross-zone resource searches only look this far, so walk these directly
+# instead of scanning every generated screen.
+NEARBY_OFFSETS = tuple(sorted(
+    ((dx, dy)
+     for dx in range(-3, 4)
+     for dy in range(-3, 4)
+     if 0 < abs(dx) + abs(dy) <= 3),
+    key=lambda d: abs(d[0]) + abs(d[1]),
+))
+
+# Cell-type sets used by quest targeting and NPC quest progress checks
+TREE_TYPES = frozenset({'TREE1', 'TREE2'})
+STONE_TYPES = frozenset({'STONE'})
+FARM_CELLS = frozenset({'CARROT1', 'CARROT2', 'CARROT3', 'SOIL', 'DIRT', 'TREE1', 'TREE2'})
+MINE_ACTION_CELLS = frozenset({'STONE', 'IRON_ORE'})
+LUMBER_ACTION_CELLS = frozenset({'TREE1', 'TREE2', 'TREE3'})
+GATHER_ACTION_CELLS = frozenset({'STONE', 'IRON_ORE', 'TREE1', 'TREE2', 'TREE3',
+                                 'CARROT1', 'CARROT2', 'CARROT3'})
+QUEST_HOSTILE_TYPES = ('GOBLIN', 'BANDIT', 'WOLF', 'BAT')
+
+# Floors inside a house interior that can take a secret mine shaft
+SECRET_SHAFT_FLOORS = frozenset({'FLOOR_WOOD', 'CAVE_FLOOR', 'DIRT', 'PLANKS'})
+
+
+def _find_first_cell(grid, cell_types):
+    """Return (x, y, cell) for the first cell in grid whose type is in the
+    cell_types set, or None.  Each row is screened with a C-level set test,
+    so only the row that actually holds a match is walked in Python."""
+    for y, row in enumerate(grid):
+        if not cell_types.isdisjoint(row):
+            for x, cell in enumerate(row):
+                if cell in cell_types:
+                    return x, y, cell
+    return None
+
+
+def _find_nearest_cell(screens, cell_types, player_sx, player_sy, skip_key):
+    """Return (sx, sy, x, y) for a cell whose type is in cell_types, in the
+    overworld zone nearest the player (skip_key excluded), or None.
+
+    Zones are visited nearest first and the search stops at the first zone
+    holding a match, so distant zones are never scanned and no list of every
+    matching cell in the world is built.  Equal-distance zones keep their
+    generation order, and the cell is the first in row order — the same pick
+    as collecting every match and sorting by zone distance."""
+    candidates = []
+    for screen_key, screen_data in screens.items():
+        if screen_key == skip_key or not screen_data.get('is_overworld'):
+            continue
+        sx, sy = zone_coords(screen_key)
+        candidates.append((abs(sx - player_sx) + abs(sy - player_sy), sx, sy, screen_data))
+    candidates.sort(key=lambda c: c[0])
+    for _, sx, sy, screen_data in candidates:
+        hit = _find_first_cell(screen_data['grid'], cell_types)
+        if hit:
+            return sx, sy, hit[0], hit[1]
+    return None
 
 
 class LoreEngineMixin:
@@ -35,76 +105,67 @@ class LoreEngineMixin:
 
         player_sx = self.player['screen_x']
         player_sy = self.player['screen_y']
-        player_zone = f"{player_sx},{player_sy}"
+        player_zone = make_zone_key(player_sx, player_sy)
 
         # For HUNT quests - find hostile NPC near player level
         if quest_type == 'HUNT':
-            hostile_entities = []
+            # Single pass: collect level-matched hostiles and, as a fallback,
+            # every living hostile.  is_hostile / health are plain attributes,
+            # so this skips a props dict lookup and the is_dead property call
+            # per entity.
+            level_matched, any_level = [], []
             for entity_id, entity in self.entities.items():
-                if entity.props.get('hostile') and not entity.is_dead:
+                if entity.is_hostile and entity.health > 0:
+                    any_level.append(entity_id)
                     if min_level <= entity.level <= max_level:
-                        hostile_entities.append(entity_id)
-
-            # If no level-matched hostiles, accept any hostile
-            if not hostile_entities:
-                for entity_id, entity in self.entities.items():
-                    if entity.props.get('hostile') and not entity.is_dead:
-                        hostile_entities.append(entity_id)
+                        level_matched.append(entity_id)
+            hostile_entities = level_matched or any_level
 
             if hostile_entities:
                 # Prefer targets not in current zone
                 offscreen = [eid for eid in hostile_entities
-                            if f"{self.entities[eid].screen_x},{self.entities[eid].screen_y}" != player_zone]
+                            if self.entities[eid].screen_x != player_sx
+                            or self.entities[eid].screen_y != player_sy]
                 target_id = random.choice(offscreen if offscreen else hostile_entities)
                 entity = self.entities[target_id]
                 info = f"L{entity.level} {entity.type}"
                 if entity.name:
                     info = f"L{entity.level} {entity.name} ({entity.type})"
                 quest.set_target('entity', target_id, info)
-                quest.target_zone = f"{entity.screen_x},{entity.screen_y}"
+                quest.target_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 return True
             else:
                 # Spawn a hostile in a distant zone at player level
-                distant_zones = []
-                for dx in range(-3, 4):
-                    for dy in range(-3, 4):
-                        if abs(dx) + abs(dy) >= 2:
-                            distant_zones.append((player_sx + dx, player_sy + dy))
-
-                if distant_zones:
-                    target_sx, target_sy = random.choice(distant_zones)
-                    screen_key = f"{target_sx},{target_sy}"
-                    if screen_key not in self.screens:
-                        self.generate_screen(target_sx, target_sy)
-                    hostile_types = ['GOBLIN', 'BANDIT', 'WOLF', 'BAT']
-                    hostile_type = random.choice(hostile_types)
-                    entity_id = self.spawn_quest_entity(hostile_type, target_sx, target_sy,
-                                                        random.randint(5, GRID_WIDTH - 5),
-                                                        random.randint(5, GRID_HEIGHT - 5))
-                    if entity_id:
-                        self.entities[entity_id].level = random.randint(min_level, max_level)
-                        entity = self.entities[entity_id]
-                        info = f"L{entity.level} {entity.type}"
-                        quest.set_target('entity', entity_id, info)
-                        quest.target_zone = screen_key
-                        return True
+                dx, dy = random.choice(DISTANT_OFFSETS)
+                target_sx, target_sy = player_sx + dx, player_sy + dy
+                screen_key = make_zone_key(target_sx, target_sy)
+                if screen_key not in self.screens:
+                    self.generate_screen(target_sx, target_sy)
+                hostile_type = random.choice(QUEST_HOSTILE_TYPES)
+                entity_id = self.spawn_quest_entity(hostile_type, target_sx, target_sy,
+                                                    random.randint(5, GRID_WIDTH - 5),
+                                                    random.randint(5, GRID_HEIGHT - 5))
+                if entity_id:
+                    self.entities[entity_id].level = random.randint(min_level, max_level)
+                    entity = self.entities[entity_id]
+                    info = f"L{entity.level} {entity.type}"
+                    quest.set_target('entity', entity_id, info)
+                    quest.target_zone = screen_key
+                    return True
 
         # For SLAY quests - find specific enemy type near player level
         elif quest_type == 'SLAY':
             target_types = quest_info['target_types']
             target_entity_type = random.choice(target_types)
 
-            matching_entities = []
+            # Single pass: level-matched targets, falling back to any level
+            level_matched, any_level = [], []
             for entity_id, entity in self.entities.items():
-                if entity.type == target_entity_type and not entity.is_dead:
+                if entity.type == target_entity_type and entity.health > 0:
+                    any_level.append(entity_id)
                     if min_level <= entity.level <= max_level:
-                        matching_entities.append(entity_id)
-
-            # Fallback: any level
-            if not matching_entities:
-                for entity_id, entity in self.entities.items():
-                    if entity.type == target_entity_type and not entity.is_dead:
-                        matching_entities.append(entity_id)
+                        level_matched.append(entity_id)
+            matching_entities = level_matched or any_level
 
             if matching_entities:
                 target_id = random.choice(matching_entities)
@@ -113,55 +174,38 @@ class LoreEngineMixin:
                 if entity.name:
                     info = f"L{entity.level} {entity.name} ({entity.type})"
                 quest.set_target('entity', target_id, info)
-                quest.target_zone = f"{entity.screen_x},{entity.screen_y}"
+                quest.target_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 return True
             else:
-                distant_zones = []
-                for dx in range(-3, 4):
-                    for dy in range(-3, 4):
-                        if abs(dx) + abs(dy) >= 2:
-                            distant_zones.append((player_sx + dx, player_sy + dy))
-
-                if distant_zones:
-                    target_sx, target_sy = random.choice(distant_zones)
-                    screen_key = f"{target_sx},{target_sy}"
-                    if screen_key not in self.screens:
-                        self.generate_screen(target_sx, target_sy)
-                    entity_id = self.spawn_quest_entity(target_entity_type, target_sx, target_sy,
-                                                        random.randint(5, GRID_WIDTH - 5),
-                                                        random.randint(5, GRID_HEIGHT - 5))
-                    if entity_id:
-                        self.entities[entity_id].level = random.randint(min_level, max_level)
-                        entity = self.entities[entity_id]
-                        info = f"L{entity.level} {entity.type}"
-                        quest.set_target('entity', entity_id, info)
-                        quest.target_zone = screen_key
-                        return True
+                dx, dy = random.choice(DISTANT_OFFSETS)
+                target_sx, target_sy = player_sx + dx, player_sy + dy
+                screen_key = make_zone_key(target_sx, target_sy)
+                if screen_key not in self.screens:
+                    self.generate_screen(target_sx, target_sy)
+                entity_id = self.spawn_quest_entity(target_entity_type, target_sx, target_sy,
+                                                    random.randint(5, GRID_WIDTH - 5),
+                                                    random.randint(5, GRID_HEIGHT - 5))
+                if entity_id:
+                    self.entities[entity_id].level = random.randint(min_level, max_level)
+                    entity = self.entities[entity_id]
+                    info = f"L{entity.level} {entity.type}"
+                    quest.set_target('entity', entity_id, info)
+                    quest.target_zone = screen_key
+                    return True
 
         # For EXPLORE quests - find specific location
         elif quest_type == 'EXPLORE':
             target_types = quest_info['target_types']
             target_cell_type = random.choice(target_types)
+            search_types = {target_cell_type}
 
-            found_locations = []
-            for screen_key, screen_data in self.screens.items():
-                if not self.is_overworld_zone(screen_key):
-                    continue
-                if screen_key == player_zone:
-                    continue  # Skip current zone
-                sx, sy = map(int, screen_key.split(','))
-                for y, row in enumerate(screen_data['grid']):
-                    for x, cell in enumerate(row):
-                        if cell == target_cell_type:
-                            found_locations.append((sx, sy, x, y))
-
-            if found_locations:
-                # Pick closest
-                found_locations.sort(key=lambda loc: abs(loc[0] - player_sx) + abs(loc[1] - player_sy))
-                target_loc = found_locations[0]
+            # Closest match outside the current zone
+            target_loc = _find_nearest_cell(self.screens, search_types,
+                                            player_sx, player_sy, player_zone)
+            if target_loc:
                 info = f"{target_cell_type} at zone ({target_loc[0]},{target_loc[1]})"
                 quest.set_target('cell', target_loc, info)
-                quest.target_zone = f"{target_loc[0]},{target_loc[1]}"
+                quest.target_zone = make_zone_key(target_loc[0], target_loc[1])
                 return True
 
         # For GATHER quests - find resource location
@@ -170,28 +214,16 @@ class LoreEngineMixin:
             target_cell_type = random.choice(target_types)
 
             if target_cell_type == 'TREE':
-                search_types = ['TREE1', 'TREE2']
+                search_types = TREE_TYPES
             else:
-                search_types = [target_cell_type]
+                search_types = {target_cell_type}
 
-            found_resources = []
-            for screen_key, screen_data in self.screens.items():
-                if not self.is_overworld_zone(screen_key):
-                    continue
-                if screen_key == player_zone:
-                    continue
-                sx, sy = map(int, screen_key.split(','))
-                for y, row in enumerate(screen_data['grid']):
-                    for x, cell in enumerate(row):
-                        if cell in search_types:
-                            found_resources.append((sx, sy, x, y))
-
-            if found_resources:
-                found_resources.sort(key=lambda loc: abs(loc[0] - player_sx) + abs(loc[1] - player_sy))
-                target_loc = found_resources[0]
+            target_loc = _find_nearest_cell(self.screens, search_types,
+                                            player_sx, player_sy, player_zone)
+            if target_loc:
                 info = f"{target_cell_type} at zone ({target_loc[0]},{target_loc[1]})"
                 quest.set_target('cell', target_loc, info)
-                quest.target_zone = f"{target_loc[0]},{target_loc[1]}"
+                quest.target_zone = make_zone_key(target_loc[0], target_loc[1])
                 return True
 
         # For RESCUE quests - find friendly NPC
@@ -209,7 +241,7 @@ class LoreEngineMixin:
                 entity = self.entities[target_id]
                 info = f"{entity.name or entity.type} at ({entity.screen_x},{entity.screen_y})"
                 quest.set_target('entity', target_id, info)
-                quest.target_zone = f"{entity.screen_x},{entity.screen_y}"
+                quest.target_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 return True
 
         # For SEARCH quests - find any dropped items across zones
@@ -223,13 +255,13 @@ class LoreEngineMixin:
                 if not self.is_overworld_zone(screen_key):
                     continue
                 try:
-                    sx, sy = map(int, screen_key.split(','))
+                    sx, sy = zone_coords(screen_key)
                 except (ValueError, AttributeError):
                     continue
+                dist = abs(sx - player_sx) + abs(sy - player_sy)
                 for (cx, cy), item_bag in items_dict.items():
                     for item_name, count in item_bag.items():
                         if count > 0:
-                            dist = abs(sx - player_sx) + abs(sy - player_sy)
                             priority = 2
                             if selected_item and item_name == selected_item:
                                 priority = 0
@@ -241,12 +273,11 @@ class LoreEngineMixin:
             for entity_id, entity in self.entities.items():
                 if entity.is_dead:
                     continue
-                zone_key = f"{entity.screen_x},{entity.screen_y}"
-                if zone_key == player_zone:
+                if entity.screen_x == player_sx and entity.screen_y == player_sy:
                     continue
+                dist = abs(entity.screen_x - player_sx) + abs(entity.screen_y - player_sy)
                 for item_name, count in entity.inventory.items():
                     if count > 0:
-                        dist = abs(entity.screen_x - player_sx) + abs(entity.screen_y - player_sy)
                         priority = 2
                         if selected_item and item_name == selected_item:
                             priority = 0
@@ -254,17 +285,18 @@ class LoreEngineMixin:
                             priority = 1
                         found_items.append((priority, dist, entity.screen_x, entity.screen_y, entity.x, entity.y, item_name))
 
-            # Also search chests
+            # Also search chests (the chest's zone is parsed once, not per item)
             for chest_key, contents in self.chest_contents.items():
+                if not contents:
+                    continue
+                try:
+                    csx, csy = zone_coords(chest_key.split(':')[0])
+                    dist = abs(csx - player_sx) + abs(csy - player_sy)
+                except (ValueError, IndexError):
+                    dist = 10
+                    csx, csy = player_sx, player_sy
                 for item_name, count in contents.items():
                     if count > 0:
-                        try:
-                            zone_part = chest_key.split(':')[0]
-                            csx, csy = map(int, zone_part.split(','))
-                            dist = abs(csx - player_sx) + abs(csy - player_sy)
-                        except (ValueError, IndexError):
-                            dist = 10
-                            csx, csy = player_sx, player_sy
                         priority = 2
                         if selected_item and item_name == selected_item:
                             priority = 0
@@ -273,12 +305,14 @@ class LoreEngineMixin:
                         found_items.append((priority, dist, csx, csy, GRID_WIDTH // 2, GRID_HEIGHT // 2, item_name))
 
             if found_items:
-                found_items.sort(key=lambda x: (x[0], x[1]))
-                priority, dist, sx, sy, cx, cy, item_name = found_items[0]
+                # First of the best (priority, distance) — what a stable sort
+                # would put at [0], without sorting the whole list
+                priority, dist, sx, sy, cx, cy, item_name = min(
+                    found_items, key=lambda x: (x[0], x[1]))
                 display_name = ITEMS.get(item_name, {}).get('name', item_name)
                 info = f"Find {display_name} near ({sx},{sy})"
                 quest.set_target('cell', (sx, sy, cx, cy), info)
-                quest.target_zone = f"{sx},{sy}"
+                quest.target_zone = make_zone_key(sx, sy)
                 return True
             else:
                 info = "Searching for items..."
@@ -289,23 +323,17 @@ class LoreEngineMixin:
                     explore_dx = 1
                 tsx, tsy = player_sx + explore_dx, player_sy + explore_dy
                 quest.set_target('cell', (tsx, tsy, GRID_WIDTH // 2, GRID_HEIGHT // 2), info)
-                quest.target_zone = f"{tsx},{tsy}"
+                quest.target_zone = make_zone_key(tsx, tsy)
                 return True
 
         # For LUMBER quests — find trees to chop
         elif quest_type == 'LUMBER':
-            search_types = ['TREE1', 'TREE2']
-            pz_key = f"{player_sx},{player_sy}"
+            search_types = TREE_TYPES
+            pz_key = make_zone_key(player_sx, player_sy)
 
             has_local = False
             if pz_key in self.screens:
-                for row in self.screens[pz_key]['grid']:
-                    for cell in row:
-                        if cell in search_types:
-                            has_local = True
-                            break
-                    if has_local:
-                        break
+                has_local = _find_first_cell(self.screens[pz_key]['grid'], search_types) is not None
 
             if has_local and random.random() < 0.90:
                 quest.target_info = "Chopping trees nearby"
@@ -314,22 +342,20 @@ class LoreEngineMixin:
                 quest.status = 'active'
                 return True
 
-            for screen_key, screen_data in self.screens.items():
-                if not self.is_overworld_zone(screen_key):
-                    continue
-                if screen_key == pz_key:
+            for dx, dy in NEARBY_OFFSETS:
+                sx, sy = player_sx + dx, player_sy + dy
+                screen_key = make_zone_key(sx, sy)
+                screen_data = self.screens.get(screen_key)
+                if screen_data is None or not screen_data.get('is_overworld'):
                     continue
-                sx, sy = map(int, screen_key.split(','))
-                if abs(sx - player_sx) + abs(sy - player_sy) > 3:
-                    continue
-                for y, row in enumerate(screen_data['grid']):
-                    for x, cell in enumerate(row):
-                        if cell in search_types:
-                            info = f"Travel to chop trees at zone ({sx},{sy})"
-                            quest.set_target('cell', (sx, sy, x, y), info)
-                            quest._original_cell = cell
-                            quest.target_zone = screen_key
-                            return True
+                hit = _find_first_cell(screen_data['grid'], search_types)
+                if hit:
+                    x, y, cell = hit
+                    info = f"Travel to chop trees at zone ({sx},{sy})"
+                    quest.set_target('cell', (sx, sy, x, y), info)
+                    quest._original_cell = cell
+                    quest.target_zone = screen_key
+                    return True
             if has_local:
                 quest.target_info = "Chopping trees nearby"
                 quest.target_zone = pz_key
@@ -341,143 +367,121 @@ class LoreEngineMixin:
 
         # For MINE quests — find stone to mine
         elif quest_type == 'MINE':
-            pz_key = f"{player_sx},{player_sy}"
+            search_types = STONE_TYPES
+            pz_key = make_zone_key(player_sx, player_sy)
 
-            has_local = False
+            local_hit = None
             if pz_key in self.screens:
-                for row in self.screens[pz_key]['grid']:
-                    for cell in row:
-                        if cell == 'STONE':
-                            has_local = True
-                            break
-                    if has_local:
-                        break
+                local_hit = _find_first_cell(self.screens[pz_key]['grid'], search_types)
 
-            if has_local and random.random() < 0.90:
+            if local_hit and random.random() < 0.90:
                 quest.target_info = "Mining stone nearby"
                 quest.target_zone = pz_key
                 quest.target_cell = (player_sx, player_sy, GRID_WIDTH // 2, GRID_HEIGHT // 2)
                 quest.status = 'active'
                 return True
 
-            for screen_key, screen_data in self.screens.items():
-                if not self.is_overworld_zone(screen_key):
-                    continue
-                if screen_key == pz_key:
+            for dx, dy in NEARBY_OFFSETS:
+                sx, sy = player_sx + dx, player_sy + dy
+                screen_key = make_zone_key(sx, sy)
+                screen_data = self.screens.get(screen_key)
+                if screen_data is None or not screen_data.get('is_overworld'):
                     continue
-                sx, sy = map(int, screen_key.split(','))
-                if abs(sx - player_sx) + abs(sy - player_sy) > 3:
-                    continue
-                for y, row in enumerate(screen_data['grid']):
-                    for x, cell in enumerate(row):
-                        if cell == 'STONE':
-                            info = f"Travel to mine stone at zone ({sx},{sy})"
-                            quest.set_target('cell', (sx, sy, x, y), info)
-                            quest._original_cell = 'STONE'
-                            quest.target_zone = screen_key
-                            return True
-            if has_local:
-                mine_screen = self.screens.get(pz_key, {})
-                for my, mrow in enumerate(mine_screen.get('grid', [])):
-                    for mx, mcell in enumerate(mrow):
-                        if mcell == 'STONE':
-                            quest.target_info = "Mining stone nearby"
-                            quest.target_zone = pz_key
-                            quest.target_cell = (player_sx, player_sy, mx, my)
-                            quest._original_cell = 'STONE'
-                            quest.status = 'active'
-                            return True
+                hit = _find_first_cell(screen_data['grid'], search_types)
+                if hit:
+                    x, y, _ = hit
+                    info = f"Travel to mine stone at zone ({sx},{sy})"
+                    quest.set_target('cell', (sx, sy, x, y), info)
+                    quest._original_cell = 'STONE'
+                    quest.target_zone = screen_key
+                    return True
+            if local_hit:
+                mx, my, _ = local_hit
+                quest.target_info = "Mining stone nearby"
+                quest.target_zone = pz_key
+                quest.target_cell = (player_sx, player_sy, mx, my)
+                quest._original_cell = 'STONE'
+                quest.status = 'active'
+                return True
             quest.target_info = "Looking for stone..."
             return False
 
         # For FARM quests - farmer behavior (harvest, till, plant, build)
         elif quest_type == 'FARM':
-            player_zone = f"{player_sx},{player_sy}"
+            player_zone = make_zone_key(player_sx, player_sy)
             if player_zone not in self.screens:
                 return False
             screen = self.screens[player_zone]
 
-            farm_cells = {'CARROT1', 'CARROT2', 'CARROT3', 'SOIL', 'DIRT', 'TREE1', 'TREE2'}
-            has_local = False
-            for row in screen['grid']:
-                for cell in row:
-                    if cell in farm_cells:
-                        has_local = True
-                        break
-                if has_local:
-                    break
+            local_hit = _find_first_cell(screen['grid'], FARM_CELLS)
 
-            if has_local and random.random() < 0.90:
-                # Find an actual farm cell so completion check has a real target + original
-                for fy, frow in enumerate(screen['grid']):
-                    for fx, fcell in enumerate(frow):
-                        if fcell in farm_cells:
-                            quest.target_info = "Farming nearby"
-                            quest.target_zone = player_zone
-                            quest.target_cell = (player_sx, player_sy, fx, fy)
-                            quest._original_cell = fcell
-                            quest.status = 'active'
-                            return True
-
-            for screen_key, screen_data in self.screens.items():
-                if not self.is_overworld_zone(screen_key):
-                    continue
-                if screen_key == player_zone:
-                    continue
-                sx, sy = map(int, screen_key.split(','))
-                if abs(sx - player_sx) + abs(sy - player_sy) > 3:
+            if local_hit and random.random() < 0.90:
+                # Target an actual farm cell so completion check has a real target + original
+                fx, fy, fcell = local_hit
+                quest.target_info = "Farming nearby"
+                quest.target_zone = player_zone
+                quest.target_cell = (player_sx, player_sy, fx, fy)
+                quest._original_cell = fcell
+                quest.status = 'active'
+                return True
+
+            for dx, dy in NEARBY_OFFSETS:
+                sx, sy = player_sx + dx, player_sy + dy
+                screen_key = make_zone_key(sx, sy)
+                screen_data = self.screens.get(screen_key)
+                if screen_data is None or not screen_data.get('is_overworld'):
                     continue
-                for y, row in enumerate(screen_data['grid']):
-                    for x, cell in enumerate(row):
-                        if cell in farm_cells:
-                            info = f"Travel to farm at zone ({sx},{sy})"
-                            quest.set_target('cell', (sx, sy, x, y), info)
-                            quest._original_cell = cell
-                            quest.target_zone = screen_key
-                            return True
-            if has_local:
-                for fy, frow in enumerate(screen['grid']):
-                    for fx, fcell in enumerate(frow):
-                        if fcell in farm_cells:
-                            quest.target_info = "Farming nearby"
-                            quest.target_zone = player_zone
-                            quest.target_cell = (player_sx, player_sy, fx, fy)
-                            quest._original_cell = fcell
-                            quest.status = 'active'
-                            return True
+                hit = _find_first_cell(screen_data['grid'], FARM_CELLS)
+                if hit:
+                    x, y, cell = hit
+                    info = f"Travel to farm at zone ({sx},{sy})"
+                    quest.set_target('cell', (sx, sy, x, y), info)
+                    quest._original_cell = cell
+                    quest.target_zone = screen_key
+                    return True
+            if local_hit:
+                fx, fy, fcell = local_hit
+                quest.target_info = "Farming nearby"
+                quest.target_zone = player_zone
+                quest.target_cell = (player_sx, player_sy, fx, fy)
+                quest._original_cell = fcell
+                quest.status = 'active'
+                return True
             quest.target_info = "Looking for farm targets..."
             return False
 
         # For COMBAT_HOSTILE quests — target hostile entities (same as HUNT)
         elif quest_type == 'COMBAT_HOSTILE':
-            hostile_entities = [eid for eid, e in self.entities.items()
-                                if e.props.get('hostile') and not e.is_dead
-                                and min_level <= e.level <= max_level]
-            if not hostile_entities:
-                hostile_entities = [eid for eid, e in self.entities.items()
-                                    if e.props.get('hostile') and not e.is_dead]
+            level_matched, any_level = [], []
+            for eid, e in self.entities.items():
+                if e.is_hostile and e.health > 0:
+                    any_level.append(eid)
+                    if min_level <= e.level <= max_level:
+                        level_matched.append(eid)
+            hostile_entities = level_matched or any_level
             if hostile_entities:
                 target_id = random.choice(hostile_entities)
                 entity = self.entities[target_id]
                 info = f"L{entity.level} {entity.name or entity.type}"
                 quest.set_target('entity', target_id, info)
-                quest.target_zone = f"{entity.screen_x},{entity.screen_y}"
+                quest.target_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 return True
 
         # For COMBAT_ALL quests — target any entity, hostile or peaceful
         elif quest_type == 'COMBAT_ALL':
-            all_targets = [eid for eid, e in self.entities.items()
-                           if not e.is_dead and eid != 'player'
-                           and min_level <= e.level <= max_level]
-            if not all_targets:
-                all_targets = [eid for eid, e in self.entities.items()
-                               if not e.is_dead and eid != 'player']
+            level_matched, any_level = [], []
+            for eid, e in self.entities.items():
+                if eid != 'player' and e.health > 0:
+                    any_level.append(eid)
+                    if min_level <= e.level <= max_level:
+                        level_matched.append(eid)
+            all_targets = level_matched or any_level
             if all_targets:
                 target_id = random.choice(all_targets)
                 entity = self.entities[target_id]
                 info = f"L{entity.level} {entity.name or entity.type} ({entity.type})"
                 quest.set_target('entity', target_id, info)
-                quest.target_zone = f"{entity.screen_x},{entity.screen_y}"
+                quest.target_zone = make_zone_key(entity.screen_x, entity.screen_y)
                 return True
 
         return False
@@ -523,25 +527,30 @@ class LoreEngineMixin:
             player_sx, player_sy = self.player['screen_x'], self.player['screen_y']
             player_x, player_y = self.player['x'], self.player['y']
 
-            if sx == player_sx and sy == player_sy:
-                distance = abs(x - player_x) + abs(y - player_y)
-                quest_type = self.active_quest
-
-                if quest_type in ('FARM', 'GATHER', 'MINE', 'LUMBER'):
-                    original = getattr(quest, '_original_cell', None)
-                    if distance <= 2 and original is not None:
-                        screen_key = f"{sx},{sy}"
-                        if screen_key in self.screens:
-                            grid = self.screens[screen_key]['grid']
-                            if 0 <= y < len(grid) and 0 <= x < len(grid[0]):
-                                current_cell = grid[y][x]
-                                if current_cell != original:
-                                    completed = True
-                                    xp_reward = 1
-                elif quest_type in ('EXPLORE', 'RESCUE', 'SEARCH'):
-                    if distance <= 2:
-                        completed = True
-                        xp_reward = 1
+            if sx != player_sx or sy != player_sy:
+                return  # Not in the target zone yet — nothing can complete
+
+            # Box test rejects far targets before paying for the abs() calls
+            dx = x - player_x
+            dy = y - player_y
+            in_reach = -2 <= dx <= 2 and -2 <= dy <= 2 and abs(dx) + abs(dy) <= 2
+            quest_type = self.active_quest
+
+            if quest_type in ('FARM', 'GATHER', 'MINE', 'LUMBER'):
+                original = getattr(quest, '_original_cell', None)
+                if in_reach and original is not None:
+                    screen_key = make_zone_key(sx, sy)
+                    if screen_key in self.screens:
+                        grid = self.screens[screen_key]['grid']
+                        if 0 <= y < len(grid) and 0 <= x < len(grid[0]):
+                            current_cell = grid[y][x]
+                            if current_cell != original:
+                                completed = True
+                                xp_reward = 1
+            elif quest_type in ('EXPLORE', 'RESCUE', 'SEARCH'):
+                if in_reach:
+                    completed = True
+                    xp_reward = 1
 
         # Check location-based quests
         elif quest.target_location:
@@ -576,10 +585,13 @@ class LoreEngineMixin:
         # Check NPC quest completions
         self.check_npc_quest_completions()
 
-        # Assign targets to inactive quests that are off cooldown
-        for quest_type, quest in self.quests.items():
-            if quest.status == 'inactive' and quest.cooldown_remaining == 0:
-                self.loreEngine(quest)
+        # Assign targets to inactive quests that are off cooldown.  Targeting
+        # can scan the whole world, and a quest with nothing to target would
+        # otherwise retry every frame — so only retry every few ticks.
+        if self.tick % QUEST_RETARGET_INTERVAL == 0:
+            for quest in self.quests.values():
+                if quest.status == 'inactive' and quest.cooldown_remaining == 0:
+                    self.loreEngine(quest)
 
         # Run background lore events (throttled to once every ~10 s)
         self.update_lore()
@@ -608,7 +620,7 @@ class LoreEngineMixin:
                 continue
 
             try:
-                tzx, tzy = map(int, zone_key.split(','))
+                tzx, tzy = zone_coords(zone_key)
             except (ValueError, AttributeError):
                 continue
 
@@ -650,12 +662,12 @@ class LoreEngineMixin:
             return quest.target_zone
         if quest.target_cell:
             sx, sy = quest.target_cell[0], quest.target_cell[1]
-            return f"{sx},{sy}"
+            return make_zone_key(sx, sy)
         if quest.target_entity_id and quest.target_entity_id in self.entities:
             e = self.entities[quest.target_entity_id]
-            return f"{e.screen_x},{e.screen_y}"
+            return make_zone_key(e.screen_x, e.screen_y)
         if quest.target_location:
-            return f"{quest.target_location[0]},{quest.target_location[1]}"
+            return make_zone_key(quest.target_location[0], quest.target_location[1])
         return None
 
     def _npc_quest_action_gain(self, quest, zone_key):
@@ -668,22 +680,16 @@ class LoreEngineMixin:
             return random.uniform(0.45, 0.60)
 
         elif qt == 'MINE':
-            return self._detect_cell_decrease(quest, zone_key,
-                                              {'STONE', 'IRON_ORE'})
+            return self._detect_cell_decrease(quest, zone_key, MINE_ACTION_CELLS)
 
         elif qt == 'LUMBER':
-            return self._detect_cell_decrease(quest, zone_key,
-                                              {'TREE1', 'TREE2', 'TREE3'})
+            return self._detect_cell_decrease(quest, zone_key, LUMBER_ACTION_CELLS)
 
         elif qt == 'FARM':
-            return self._detect_cell_decrease(quest, zone_key,
-                                              {'CARROT1', 'CARROT2', 'CARROT3',
-                                               'SOIL', 'DIRT', 'TREE1', 'TREE2'})
+            return self._detect_cell_decrease(quest, zone_key, FARM_CELLS)
 
         elif qt == 'GATHER':
-            targets = {'STONE', 'IRON_ORE', 'TREE1', 'TREE2', 'TREE3',
-                       'CARROT1', 'CARROT2', 'CARROT3'}
-            return self._detect_cell_decrease(quest, zone_key, targets)
+            return self._detect_cell_decrease(quest, zone_key, GATHER_ACTION_CELLS)
 
         elif qt in ('HUNT', 'SLAY', 'COMBAT_HOSTILE', 'COMBAT_ALL'):
             return self._detect_kill_in_zone(quest, zone_key)
@@ -733,7 +739,7 @@ class LoreEngineMixin:
         px, py = self.player['screen_x'], self.player['screen_y']
         for dx in range(-2, 3):
             for dy in range(-2, 3):
-                key = f"{px + dx},{py + dy}"
+                key = make_zone_key(px + dx, py + dy)
                 if key in self.screens:
                     self.check_secret_entrances(key)
 
@@ -810,11 +816,10 @@ class LoreEngineMixin:
         # Keep only corners that are:
         #   • clearly away from the entrance (distance > 4)
         #   • currently walkable floor (FLOOR_WOOD or similar)
-        WALKABLE = {'FLOOR_WOOD', 'CAVE_FLOOR', 'DIRT', 'PLANKS'}
         candidates = [
             (cx, cy) for cx, cy in corners
             if (abs(cx - entrance_x) + abs(cy - entrance_y) > 4
-                and interior[cy][cx] in WALKABLE)
+                and interior[cy][cx] in SECRET_SHAFT_FLOORS)
         ]
 
         if not candidates:
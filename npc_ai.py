@@ -6,6 +6,7 @@ Includes reusable action primitives that both NPCs and autopilot can use.
 import random
 import math
 from constants import *
+from world.zones import make_zone_key
 
 class NpcAiMixin:
     """Mixin class for NPC AI. Mixed into Game via multiple inheritance."""
@@ -16,8 +17,8 @@ class NpcAiMixin:
         Unified zone system: player and entity screen_x/y both reflect virtual coords
         when inside structure zones, so a simple zone key comparison suffices.
         """
-        player_zone = f"{self.player['screen_x']},{self.player['screen_y']}"
-        entity_zone = f"{entity.screen_x},{entity.screen_y}"
+        player_zone = make_zone_key(self.player['screen_x'], self.player['screen_y'])
+        entity_zone = make_zone_key(entity.screen_x, entity.screen_y)
         return entity_zone == player_zone
 
     # ══════════════════════════════════════════════════════════════════════
@@ -72,7 +73,7 @@ class NpcAiMixin:
         
         # screen_key is always the entity's current zone — virtual coords for
         # structure zones, real coords for overworld zones.
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         
         # EXECUTE BEHAVIOR BASED ON STATE
         if hasattr(entity, 'ai_state'):
@@ -140,7 +141,7 @@ class NpcAiMixin:
                                         screen = self.screens[screen_key]
                                         if (0 <= new_x < GRID_WIDTH and 0 <= new_y < GRID_HEIGHT):
                                             cell = screen['grid'][new_y][new_x]
-                                            if not CELL_TYPES[cell].get('solid', False):
+                                            if cell not in SOLID_CELLS:
                                                 entity.x = new_x
                                                 entity.y = new_y
                                                 entity.world_x = float(new_x)
@@ -246,7 +247,7 @@ class NpcAiMixin:
                         # Entity target — check if in same zone
                         if entity.current_target in self.entities:
                             target = self.entities[entity.current_target]
-                            target_zone = f"{target.screen_x},{target.screen_y}"
+                            target_zone = make_zone_key(target.screen_x, target.screen_y)
 
                             if getattr(target, 'in_structure', False) and target_zone == screen_key:
                                 # Target is inside a structure (CAVE/MINESHAFT) — navigate to door
@@ -419,7 +420,7 @@ class NpcAiMixin:
             # Overcrowding: keepers never leave; everyone else may be pushed out
             # when the structure is too full. Chance = local_pop * 10% per update.
             if not getattr(entity, 'keeper', False):
-                zone_key = f"{entity.screen_x},{entity.screen_y}"
+                zone_key = make_zone_key(entity.screen_x, entity.screen_y)
                 local_pop = len([
                     eid for eid in self.screen_entities.get(zone_key, [])
                     if eid in self.entities and self.entities[eid].is_alive()
@@ -434,8 +435,8 @@ class NpcAiMixin:
                 parent_screen = sub.get('parent_screen')
                 parent_cell = sub.get('parent_cell', (GRID_WIDTH // 2, GRID_HEIGHT // 2))
                 entrance_x, entrance_y = parent_cell
-                overworld_key = (f"{parent_screen[0]},{parent_screen[1]}"
-                                 if parent_screen else f"{entity.screen_x},{entity.screen_y}")
+                overworld_key = (make_zone_key(parent_screen[0], parent_screen[1])
+                                 if parent_screen else make_zone_key(entity.screen_x, entity.screen_y))
                 for oid in self.screen_entities.get(overworld_key, []):
                     if oid in self.entities:
                         other = self.entities[oid]
@@ -462,7 +463,7 @@ class NpcAiMixin:
             # If still in structure after exit attempt, do structure behavior
             if entity.in_structure:
                 # Miners mine in caves, peaceful NPCs rest in houses
-                zone_biome = self.screens.get(f"{entity.screen_x},{entity.screen_y}", {}).get('biome', '')
+                zone_biome = self.screens.get(make_zone_key(entity.screen_x, entity.screen_y), {}).get('biome', '')
                 if entity.type == 'MINER' and zone_biome == 'CAVE':
                     behavior_config = entity.props.get('behavior_config')
                     if behavior_config:
@@ -487,7 +488,7 @@ class NpcAiMixin:
                 
                 # If not in home zone, nudge toward it via the AI state machine
                 if entity.home_zone:
-                    current_zone = f"{entity.screen_x},{entity.screen_y}"
+                    current_zone = make_zone_key(entity.screen_x, entity.screen_y)
                     if current_zone != entity.home_zone:
                         # Determine direction to home
                         home_x, home_y = map(int, entity.home_zone.split(','))
@@ -857,10 +858,10 @@ class NpcAiMixin:
             # Traders and Guards do this most of the time, others rarely
             if entity.type == 'GUARD':
                 # Guards patrol center lanes while heading to exits
-                self.try_patrol_behavior(entity, f"{entity.screen_x},{entity.screen_y}")
+                self.try_patrol_behavior(entity, make_zone_key(entity.screen_x, entity.screen_y))
             else:
                 # All others (including Traders) use travel behavior
-                self.try_travel_behavior(entity, f"{entity.screen_x},{entity.screen_y}")
+                self.try_travel_behavior(entity, make_zone_key(entity.screen_x, entity.screen_y))
         elif entity.target_priority == 'enemy':
             # Try to find and attack enemies
             self.find_and_attack_enemy(entity_id, entity)
@@ -907,9 +908,9 @@ class NpcAiMixin:
         else:
             # Wander or special behaviors
             if entity.type == 'TRADER':
-                self.try_travel_behavior(entity, f"{entity.screen_x},{entity.screen_y}")
+                self.try_travel_behavior(entity, make_zone_key(entity.screen_x, entity.screen_y))
             elif entity.type == 'GUARD':
-                self.try_patrol_behavior(entity, f"{entity.screen_x},{entity.screen_y}")
+                self.try_patrol_behavior(entity, make_zone_key(entity.screen_x, entity.screen_y))
             else:
                 self.wander_entity(entity)
         """
@@ -941,9 +942,9 @@ class NpcAiMixin:
                         travel_rate = 1.0
                     
                     if can_travel and random.random() < travel_rate:
-                        old_zone = f"{entity.screen_x},{entity.screen_y}"
+                        old_zone = make_zone_key(entity.screen_x, entity.screen_y)
                         self.try_entity_zone_transition(entity_id, entity)
-                        new_zone = f"{entity.screen_x},{entity.screen_y}"
+                        new_zone = make_zone_key(entity.screen_x, entity.screen_y)
                         
                         # If successfully traveled
                         if old_zone != new_zone:
@@ -960,7 +961,7 @@ class NpcAiMixin:
                             # Entity traveled to new zone (silent)
         
         # SAFETY CHECK: Validate entity position after all AI logic
-        player_zone = f"{self.player['screen_x']},{self.player['screen_y']}"
+        player_zone = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         debug = (screen_key == player_zone) and entity.type == 'WARRIOR'
         
         if screen_key in self.screens:
@@ -976,7 +977,7 @@ class NpcAiMixin:
             current_cell = self.screens[screen_key]['grid'][entity.y][entity.x]
             is_flying = entity.props.get('flying', False)
             fly_blocked = {'WALL', 'CAVE_WALL', 'DEEP_WATER'}
-            if CELL_TYPES[current_cell]['solid'] and (not is_flying or current_cell in fly_blocked):
+            if current_cell in SOLID_CELLS and (not is_flying or current_cell in fly_blocked):
                 if debug:
                     print(f"  [SAFETY] Warrior@({entity.x},{entity.y}) on SOLID cell {current_cell}, searching for safe cell...")
                 # Entity is on solid cell - find nearest walkable cell
@@ -987,7 +988,7 @@ class NpcAiMixin:
                         check_y = entity.y + dy
                         if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
                             check_cell = self.screens[screen_key]['grid'][check_y][check_x]
-                            if not CELL_TYPES[check_cell]['solid']:
+                            if check_cell not in SOLID_CELLS:
                                 entity.x = check_x
                                 entity.y = check_y
                                 entity.world_x = float(check_x)
@@ -1028,7 +1029,7 @@ class NpcAiMixin:
         flee_chance = getattr(entity, 'flee_chance', 0.50)
         combat_chance = getattr(entity, 'combat_chance', 0.50)
         
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         
         # === BAT / NOCTURNAL BEHAVIOR ===
         if entity.props.get('nocturnal', False):
@@ -1069,7 +1070,7 @@ class NpcAiMixin:
                         self.npc_exit_structure(entity)
         
         # DEBUG: Only for player's current zone
-        player_zone = f"{self.player['screen_x']},{self.player['screen_y']}"
+        player_zone = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         debug = (screen_key == player_zone)
         
         # Show all entities in player zone periodically (every 10 seconds, disabled by default)
@@ -1092,8 +1093,7 @@ class NpcAiMixin:
                     if random.random() < promotion_chance:
                         old_name = entity.name
                         old_type = entity.type
-                        entity.type = 'WARRIOR'
-                        entity.props = ENTITY_TYPES['WARRIOR']
+                        entity.set_type('WARRIOR')
                         entity.max_health = entity.props['max_health'] * entity.level
                         entity.health = entity.max_health
                         entity.strength = entity.props['strength'] * entity.level
@@ -1401,7 +1401,7 @@ class NpcAiMixin:
     
     def evaluate_entity_priorities(self, entity, entity_id):
         """Evaluate all possible actions and choose best based on weights and distance"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return 'wander', None
         
@@ -1640,7 +1640,7 @@ class NpcAiMixin:
             return  # Fleeing entities don't attack
         
         # Unified zone system: screen_x/y always reflects current zone (incl. structure virtual coords)
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         entity_lookup = self.screen_entities
 
         closest_enemy = None
@@ -1877,8 +1877,7 @@ class NpcAiMixin:
                             # Commander killing a king is promoted to king
                             if entity.type == 'COMMANDER' and closest_enemy.type == 'KING' and entity.faction:
                                 old_name = entity.name
-                                entity.type = 'KING'
-                                entity.props = ENTITY_TYPES['KING']
+                                entity.set_type('KING')
                                 entity.max_health = entity.props['max_health'] * entity.level
                                 entity.strength = entity.props['strength'] * entity.level
 
@@ -1919,7 +1918,7 @@ class NpcAiMixin:
             target = self._find_closest_crop(entity, screen_key)
             if target is None and entity.level >= 5:
                 for dsx, dsy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                    adj = f"{entity.screen_x + dsx},{entity.screen_y + dsy}"
+                    adj = make_zone_key(entity.screen_x + dsx, entity.screen_y + dsy)
                     target = self._find_closest_crop(entity, adj)
                     if target:
                         break
@@ -2003,7 +2002,7 @@ class NpcAiMixin:
         low_thirst = entity.thirst < entity.max_thirst * 0.3
         low_health = entity.health < entity.max_health * 0.5
         
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
 
         # ── Quest-focus system ────────────────────────────────────────────────
         # Two modes:
@@ -2096,7 +2095,7 @@ class NpcAiMixin:
     def execute_entity_behavior(self, entity, behavior_config):
         """Consolidated behavior system - executes actions based on behavior_config"""
         actions = behavior_config.get('actions', [])
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         
         if screen_key not in self.screens:
             return
@@ -2168,7 +2167,7 @@ class NpcAiMixin:
                 return
             screen = self.structures[screen_key]
         else:
-            screen_key = f"{entity.screen_x},{entity.screen_y}"
+            screen_key = make_zone_key(entity.screen_x, entity.screen_y)
             if screen_key not in self.screens:
                 return
             screen = self.screens[screen_key]
@@ -2205,11 +2204,13 @@ class NpcAiMixin:
                         self.show_attack_animation(check_x, check_y, entity=entity)
                         if cell == 'CAMP' and random.random() < 0.08:  # 8% chance
                             screen['grid'][check_y][check_x] = 'GRASS'
+                            self.invalidate_heal_boost_field(screen)
                             entity.hunger = min(entity.max_hunger, entity.hunger + 15)
                             if random.random() < 0.2:
                                 print(f"Termite destroyed a camp at [{screen_key}]")
                         elif cell == 'HOUSE' and random.random() < 0.03:  # 3% chance
                             screen['grid'][check_y][check_x] = 'GRASS'
+                            self.invalidate_heal_boost_field(screen)
                             entity.hunger = min(entity.max_hunger, entity.hunger + 20)
                             print(f"Termite destroyed a house at [{screen_key}]!")
                         elif cell == 'STONE_HOUSE' and random.random() < 0.00002:  # 0.002% — stone heavily resists termites (10x lower than HOUSE rate)
@@ -2351,6 +2352,7 @@ class NpcAiMixin:
                         entity.trigger_action_animation()
                         self.show_attack_animation(check_x, check_y, entity=entity)
                         screen['grid'][check_y][check_x] = 'GRASS'
+                        self.invalidate_heal_boost_field(screen)
                         if random.random() < 0.2:
                             name_str = entity.name if entity.name else entity.type
                             print(f"{name_str} destroyed a camp at [{screen_key}]")
@@ -2362,6 +2364,7 @@ class NpcAiMixin:
                         entity.trigger_action_animation()
                         self.show_attack_animation(check_x, check_y, entity=entity)
                         screen['grid'][check_y][check_x] = 'GRASS'
+                        self.invalidate_heal_boost_field(screen)
                         name_str = entity.name if entity.name else entity.type
                         print(f"{name_str} destroyed a house at [{screen_key}]!")
                         return
@@ -2401,7 +2404,7 @@ class NpcAiMixin:
     
     def farmer_behavior(self, entity):
         """Farmer AI: harvest crops, till soil, plant crops"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
         
@@ -2457,7 +2460,7 @@ class NpcAiMixin:
     
     def lumberjack_behavior(self, entity):
         """Lumberjack AI: chop trees, build houses"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
         
@@ -2470,7 +2473,7 @@ class NpcAiMixin:
                 check_x = entity.x + dx
                 check_y = entity.y + dy
                 if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                    if screen['grid'][check_y][check_x].startswith('TREE'):
+                    if screen['grid'][check_y][check_x] in TREE_CELLS:
                         nearby_trees += 1
         
         # Chopping probability scales with tree density
@@ -2488,7 +2491,7 @@ class NpcAiMixin:
                     cell = screen['grid'][check_y][check_x]
                     
                     # Chop trees with density-based probability
-                    if cell.startswith('TREE') and random.random() < chop_chance:
+                    if cell in TREE_CELLS and random.random() < chop_chance:
                         # Add wood to inventory
                         wood_amount = 2 if cell == 'TREE1' else 3
                         entity.inventory['wood'] = entity.inventory.get('wood', 0) + wood_amount
@@ -2536,6 +2539,7 @@ class NpcAiMixin:
                 if screen['grid'][build_y][build_x] in ['GRASS', 'DIRT']:
                     entity.inventory['wood'] -= 10
                     screen['grid'][build_y][build_x] = 'HOUSE'
+                    self.invalidate_heal_boost_field(screen)
                     
                     # Chance to level up from building
                     entity.level_up_from_activity('build', self)
@@ -2553,6 +2557,7 @@ class NpcAiMixin:
                 if cell in ['GRASS', 'DIRT']:
                     entity.inventory['wood'] -= 10
                     screen['grid'][build_y][build_x] = 'HOUSE'
+                    self.invalidate_heal_boost_field(screen)
                     
                     # Chance to level up from building
                     entity.level_up_from_activity('build', self)
@@ -2563,7 +2568,7 @@ class NpcAiMixin:
     
     def guard_behavior(self, entity):
         """Guard AI: Patrol center lanes, build cobblestone, hunt hostiles"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
         
@@ -2649,7 +2654,7 @@ class NpcAiMixin:
     
     def trader_behavior(self, entity):
         """Trader AI: Travel between zone exits, build paths (cellular automata)"""
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return
 
@@ -2726,7 +2731,7 @@ class NpcAiMixin:
         # Already inside a structure — don't scan overworld grid or re-enter
         if entity.in_structure:
             return False
-        screen_key = f"{entity.screen_x},{entity.screen_y}"
+        screen_key = make_zone_key(entity.screen_x, entity.screen_y)
         if screen_key not in self.screens:
             return False
         
@@ -2824,7 +2829,7 @@ class NpcAiMixin:
         
         if logic_type == 'settlement':
             # Settlement logic - transform based on zone needs
-            screen_key = f"{entity.screen_x},{entity.screen_y}"
+            screen_key = make_zone_key(entity.screen_x, entity.screen_y)
             if screen_key not in self.screen_entities:
                 return False
             
@@ -2869,8 +2874,7 @@ class NpcAiMixin:
             
             # Perform transformation
             old_name = entity.name if entity.name else entity_type
-            entity.type = new_type
-            entity.props = ENTITY_TYPES[new_type]
+            entity.set_type(new_type)
             
             # Reset AI state for new role
             entity.ai_state = 'wandering'
@@ -3,11 +3,12 @@ import random
 import pygame
 
 from constants import (
-    ITEMS, COLORS, CELL_TYPES,
+    ITEMS, COLORS, SOLID_CELLS,
     GRID_WIDTH, GRID_HEIGHT,
     SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE,
 )
 from entity import Entity
+from world.zones import make_zone_key
 
 
 class CombatMixin:
@@ -68,7 +69,7 @@ class CombatMixin:
             return False
 
         check_x, check_y = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         # Unified zone system: player screen coords reflect current zone (incl. structure virtual coords)
         entities_list = self.screen_entities.get(screen_key, [])
@@ -178,26 +179,19 @@ class CombatMixin:
         self.death_ticks_simulated = 0
 
         # Drop all items at death location
-        death_screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        death_screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         death_pos = (self.player['x'], self.player['y'])
 
-        if death_screen_key not in self.dropped_items:
-            self.dropped_items[death_screen_key] = {}
-        if death_pos not in self.dropped_items[death_screen_key]:
-            self.dropped_items[death_screen_key][death_pos] = {}
-
         # Drop all inventory items (except magic - spells are permanent)
         for category in ['items']:
             inv = getattr(self.inventory, category)
             for item_name, count in list(inv.items()):
-                self.dropped_items[death_screen_key][death_pos][item_name] = \
-                    self.dropped_items[death_screen_key][death_pos].get(item_name, 0) + count
+                self.add_dropped_item(death_screen_key, death_pos, item_name, count)
             inv.clear()
         # Drop tool slot items
         for slot_item in self.inventory.tool_slots:
             if slot_item is not None:
-                self.dropped_items[death_screen_key][death_pos][slot_item] = \
-                    self.dropped_items[death_screen_key][death_pos].get(slot_item, 0) + 1
+                self.add_dropped_item(death_screen_key, death_pos, slot_item)
         self.inventory.tool_slots = [None] * len(self.inventory.tool_slots)
         self.inventory.selected_tool_slot_idx = None
         self.inventory.selected['tools'] = None
@@ -258,7 +252,7 @@ class CombatMixin:
                 player_sy = self.player['screen_y']
                 for dx in range(-2, 3):
                     for dy in range(-2, 3):
-                        zk = f"{player_sx + dx},{player_sy + dy}"
+                        zk = make_zone_key(player_sx + dx, player_sy + dy)
                         if zk in self.screens:
                             zx, zy = player_sx + dx, player_sy + dy
                             biome = self.screens[zk].get('biome', 'FOREST')
@@ -279,7 +273,7 @@ class CombatMixin:
             self.is_initial_generation = False
 
         # Stay in same zone, find a safe spawn point
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         # Try to find a safe spawn location in current zone
         found_safe_spot = False
@@ -290,7 +284,7 @@ class CombatMixin:
             if screen_key in self.screens:
                 cell = self.screens[screen_key]['grid'][test_y][test_x]
                 # Check if cell is walkable (not solid, not water)
-                if not CELL_TYPES[cell].get('solid', False) and cell not in ['WATER', 'DEEP_WATER']:
+                if cell not in SOLID_CELLS and cell not in ['WATER', 'DEEP_WATER']:
                     self.player['x'] = test_x
                     self.player['y'] = test_y
                     found_safe_spot = True
@@ -325,9 +319,9 @@ class CombatMixin:
             self.next_entity_id += 1
             self.entities[follower_id] = follower_entity
             if screen_key not in self.screen_entities:
-                self.screen_entities[screen_key] = []
-            self.screen_entities[screen_key].append(follower_id)
-            self.followers.append(follower_id)
+                self.screen_entities[screen_key] = set()
+            self.screen_entities[screen_key].add(follower_id)
+            self.followers.add(follower_id)
             follower_item = f"{pending.lower()}_{follower_id}"
             self.follower_items[follower_id] = follower_item
             if follower_item not in ITEMS:
@@ -380,9 +374,9 @@ class CombatMixin:
 
         # Track which zone this animation belongs to (unified zone system)
         if entity:
-            location_key = f"{entity.screen_x},{entity.screen_y}"
+            location_key = make_zone_key(entity.screen_x, entity.screen_y)
         else:
-            location_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+            location_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         self.attack_animations.append({
             'x': display_x,  # Now using world coordinates
@@ -396,7 +390,7 @@ class CombatMixin:
     def draw_attack_animations(self):
         """Draw active attack animations only for current location"""
         # Unified zone system: player screen coords reflect current zone
-        current_location = f"{self.player['screen_x']},{self.player['screen_y']}"
+        current_location = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         # Magic type color mapping
         magic_colors = {
@@ -407,9 +401,14 @@ class CombatMixin:
             'shadow': (75, 0, 130)         # Indigo
         }
 
-        for anim in self.attack_animations[:]:
+        # Animations are appended in start order with a fixed duration, so
+        # expired ones are always at the front of the deque
+        animations = self.attack_animations
+        while animations and self.tick - animations[0]['start_tick'] > animations[0]['duration']:
+            animations.popleft()
+
+        for anim in animations:
             if self.tick - anim['start_tick'] > anim['duration']:
-                self.attack_animations.remove(anim)
                 continue
 
             # Only draw animations for current location
@@ -1,7 +1,11 @@
 import random
 
-from constants import CELL_TYPES, ITEM_DECAY_CONFIG, ITEM_TO_CELL, ITEMS, RECIPES
+from constants import CELL_TYPES, SOLID_CELLS, ITEM_DECAY_CONFIG, ITEM_TO_CELL, ITEMS, RECIPES
 from constants import GRID_WIDTH, GRID_HEIGHT
+from world.zones import make_zone_key, HEAL_BOOST_CELLS
+
+# Item names that have a decay rule; piles holding none of these never decay
+DECAYING_ITEMS = frozenset(ITEM_DECAY_CONFIG)
 
 
 class CraftingMixin:
@@ -60,7 +64,7 @@ class CraftingMixin:
         if result_item == 'skeleton_bones':
             skeleton_id = self.spawn_skeleton(self.player['x'], self.player['y'])
             if skeleton_id:
-                self.followers.append(skeleton_id)
+                self.followers.add(skeleton_id)
                 self.enchanted_entities[skeleton_id] = 1
                 follower_name = f"skeleton_{skeleton_id}"
                 skeleton = self.entities[skeleton_id]
@@ -147,7 +151,7 @@ class CraftingMixin:
             skeleton_id = self.spawn_skeleton(self.player['x'], self.player['y'])
             if skeleton_id:
                 # Add to followers list
-                self.followers.append(skeleton_id)
+                self.followers.add(skeleton_id)
                 # Enchant it (level 1)
                 self.enchanted_entities[skeleton_id] = 1
                 # Add to follower inventory
@@ -194,6 +198,11 @@ class CraftingMixin:
     # Item drops & decay
     # -------------------------------------------------------------------------
 
+    def add_dropped_item(self, screen_key, cell_key, item_name, count=1):
+        """Add count of item_name to the dropped-item pile at cell_key in screen_key"""
+        pile = self.dropped_items.setdefault(screen_key, {}).setdefault(cell_key, {})
+        pile[item_name] = pile.get(item_name, 0) + count
+
     def handle_drops(self, cell_type, x, y):
         """Handle cell drops based on probabilities"""
         if cell_type not in CELL_TYPES:
@@ -217,27 +226,32 @@ class CraftingMixin:
 
     def decay_dropped_items(self, screen_x, screen_y):
         """General function to decay dropped items based on item decay configuration"""
-        screen_key = f"{screen_x},{screen_y}"
+        screen_key = make_zone_key(screen_x, screen_y)
 
         if screen_key not in self.dropped_items or screen_key not in self.screens:
             return
 
         screen = self.screens[screen_key]
+        grid = screen['grid']
+        zone_items = self.dropped_items[screen_key]
         cells_to_update = []
 
         # Check each position with dropped items
-        for cell_pos, items in list(self.dropped_items[screen_key].items()):
+        for cell_pos, items in list(zone_items.items()):
+            # Most piles are tools, weapons, etc. with no decay rule
+            if DECAYING_ITEMS.isdisjoint(items):
+                continue
+
             x, y = cell_pos
-            current_cell = screen['grid'][y][x]
+            current_cell = grid[y][x]
 
             # Process each item type at this position
             for item_name, item_count in list(items.items()):
                 # Check if this item type has decay config
-                if item_name not in ITEM_DECAY_CONFIG:
+                config = ITEM_DECAY_CONFIG.get(item_name)
+                if config is None:
                     continue
 
-                config = ITEM_DECAY_CONFIG[item_name]
-
                 # Calculate decay chance (base rate * item count)
                 decay_chance = config['decay_rate'] * item_count
 
@@ -249,7 +263,7 @@ class CraftingMixin:
 
                     # Remove empty items dict
                     if not items:
-                        del self.dropped_items[screen_key][cell_pos]
+                        del zone_items[cell_pos]
 
                     # Determine decay result based on current cell type
                     decay_results = config['decay_results']
@@ -324,7 +338,7 @@ class CraftingMixin:
                         if (neighbor_count > best_count or
                                 (neighbor_count == best_count and dist < best_dist)):
                             cell = grid[ny][nx]
-                            if not CELL_TYPES.get(cell, {}).get('solid', False):
+                            if cell not in SOLID_CELLS:
                                 best_target = neighbor_key
                                 best_count = neighbor_count
                                 best_dist = dist
@@ -350,7 +364,7 @@ class CraftingMixin:
 
     def pickup_items(self, x, y):
         """Pick up dropped items from cell"""
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         if screen_key not in self.dropped_items:
             return
 
@@ -391,18 +405,10 @@ class CraftingMixin:
 
     def drop_item(self, item_name, x, y):
         """Drop item onto cell (works in both overworld and structures)"""
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         if self.player.get('in_structure') and self.player.get('structure_key'):
             screen_key = self.player['structure_key']
-        if screen_key not in self.dropped_items:
-            self.dropped_items[screen_key] = {}
-
-        cell_key = (x, y)
-        if cell_key not in self.dropped_items[screen_key]:
-            self.dropped_items[screen_key][cell_key] = {}
-
-        self.dropped_items[screen_key][cell_key][item_name] = \
-            self.dropped_items[screen_key][cell_key].get(item_name, 0) + 1
+        self.add_dropped_item(screen_key, (x, y), item_name)
 
     def pickup_cell_or_items(self):
         """Pick up cell EXACTLY as it is (creative/admin mode) or dropped items.
@@ -413,7 +419,7 @@ class CraftingMixin:
             return
 
         target_x, target_y = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         in_structure = self.player.get('in_structure', False)
         structure_key = self.player.get('structure_key')
 
@@ -497,6 +503,8 @@ class CraftingMixin:
                 self.current_screen['grid'][target_y][target_x] = 'SOIL'
             else:
                 self.current_screen['grid'][target_y][target_x] = base
+            if cell_type in HEAL_BOOST_CELLS:
+                self.invalidate_heal_boost_field(self.current_screen)
 
     def place_selected_item(self):
         """Place selected item as a cell in the world, or as an overlay if no cell mapping.
@@ -507,7 +515,7 @@ class CraftingMixin:
             return
 
         target_x, target_y = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
         in_structure = self.player.get('in_structure', False)
 
         # Cannot place on enchanted cells
@@ -532,18 +540,13 @@ class CraftingMixin:
                         sk = self.player['structure_key']
                     else:
                         sk = screen_key
-                    if sk not in self.dropped_items:
-                        self.dropped_items[sk] = {}
-                    cell_key = (target_x, target_y)
-                    if cell_key not in self.dropped_items[sk]:
-                        self.dropped_items[sk][cell_key] = {}
-                    self.dropped_items[sk][cell_key][selected] = \
-                        self.dropped_items[sk][cell_key].get(selected, 0) + 1
+                    self.add_dropped_item(sk, (target_x, target_y), selected)
                     return
                 elif selected in ITEM_TO_CELL:
                     # Overworld: place as a grid cell (replaces the cell)
                     cell_type = ITEM_TO_CELL[selected]
                     self.current_screen['grid'][target_y][target_x] = cell_type
+                    self.invalidate_heal_boost_field(self.current_screen)
                     self.inventory.remove_item(selected, 1)
                     return
                 else:
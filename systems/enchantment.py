@@ -1,6 +1,7 @@
 import random
 
 from constants import ITEMS
+from world.zones import make_zone_key
 
 
 class EnchantmentMixin:
@@ -37,9 +38,8 @@ class EnchantmentMixin:
 
     def is_cell_enchanted(self, x, y, screen_key):
         """Check if a cell is enchanted"""
-        if screen_key not in self.enchanted_cells:
-            return False
-        return (x, y) in self.enchanted_cells[screen_key]
+        cells = self.enchanted_cells.get(screen_key)
+        return cells is not None and (x, y) in cells
 
     def is_entity_enchanted(self, entity_id):
         """Check if an entity is enchanted"""
@@ -73,7 +73,7 @@ class EnchantmentMixin:
             return
 
         check_x, check_y = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         # Check if there's an entity at target
         entity_at_target = None
@@ -94,7 +94,7 @@ class EnchantmentMixin:
 
             # Add to followers list if not already a follower
             if entity_id not in self.followers:
-                self.followers.append(entity_id)
+                self.followers.add(entity_id)
                 # Add follower item to ITEMS dict dynamically
                 follower_name = f"{entity.type.lower()}_{entity_id}"
                 if follower_name not in ITEMS:
@@ -136,7 +136,7 @@ class EnchantmentMixin:
             return
 
         check_x, check_y = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         # Check if there's an entity at target
         entity_at_target = None
@@ -3,8 +3,8 @@ import random
 from constants import (
     FACTION_COLORS, FACTION_SYMBOLS,
     HOSTILE_FACTION_COLORS, HOSTILE_FACTION_SYMBOLS,
-    ENTITY_TYPES,
 )
+from world.zones import make_zone_key
 
 
 class FactionsMixin:
@@ -307,7 +307,7 @@ class FactionsMixin:
             old_faction = lowest_member.faction
 
             # Try to join nearest faction
-            screen_key = f"{lowest_member.screen_x},{lowest_member.screen_y}"
+            screen_key = make_zone_key(lowest_member.screen_x, lowest_member.screen_y)
             self.try_join_nearest_faction(lowest_member, lowest_member_id, screen_key, exclude_faction=old_faction)
 
             if lowest_member.faction != old_faction:
@@ -324,7 +324,7 @@ class FactionsMixin:
 
         for dx in range(-2, 3):
             for dy in range(-2, 3):
-                check_key = f"{entity.screen_x + dx},{entity.screen_y + dy}"
+                check_key = make_zone_key(entity.screen_x + dx, entity.screen_y + dy)
                 if check_key not in self.screen_entities:
                     continue
 
@@ -401,7 +401,7 @@ class FactionsMixin:
         # Find zones not controlled by this faction
         expansion_targets = []
         for zone_x, zone_y, direction in adjacent_zones:
-            target_key = f"{zone_x},{zone_y}"
+            target_key = make_zone_key(zone_x, zone_y)
             controlling_faction = self.get_zone_controlling_faction(target_key)
 
             # Target zones that aren't controlled by us
@@ -454,8 +454,7 @@ class FactionsMixin:
                     old_name = best_warrior.name
 
                     # Promote to commander
-                    best_warrior.type = 'COMMANDER'
-                    best_warrior.props = ENTITY_TYPES['COMMANDER']
+                    best_warrior.set_type('COMMANDER')
                     best_warrior.max_health = best_warrior.props['max_health'] * best_warrior.level
                     best_warrior.strength = best_warrior.props['strength'] * best_warrior.level
 
@@ -504,8 +503,7 @@ class FactionsMixin:
                     old_name = best_commander.name
 
                     # Promote to king
-                    best_commander.type = 'KING'
-                    best_commander.props = ENTITY_TYPES['KING']
+                    best_commander.set_type('KING')
                     best_commander.max_health = best_commander.props['max_health'] * best_commander.level
                     best_commander.strength = best_commander.props['strength'] * best_commander.level
 
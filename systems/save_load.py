@@ -1,6 +1,7 @@
 import json
 import os
 import random
+import sys
 
 from entity import Entity, Quest, NpcQuestSlot
 from constants import ITEMS, COLORS
@@ -68,6 +69,8 @@ class SaveLoadMixin:
                         chest_key_str = f"{chest_pos[0]},{chest_pos[1]}"
                         serialized_chests[chest_key_str] = loot_type
                     serialized_structure[key] = serialized_chests
+                elif key == 'heal_boost_field':
+                    continue  # cache, rebuilt on demand
                 else:
                     serialized_structure[key] = value
             structures_serializable[structure_key] = serialized_structure
@@ -86,6 +89,8 @@ class SaveLoadMixin:
                             chest_key_str = str(chest_pos)
                         serialized_chests[chest_key_str] = loot_type
                     serialized_screen[key] = serialized_chests
+                elif key == 'heal_boost_field':
+                    continue  # cache, rebuilt on demand
                 elif key == 'parent_screen' and isinstance(value, tuple):
                     serialized_screen[key] = list(value)
                 elif key == 'parent_cell' and isinstance(value, tuple):
@@ -128,14 +133,14 @@ class SaveLoadMixin:
             'screen_last_update': self.screen_last_update,
             'target_direction': self.target_direction,
             'entities': entities_data,
-            'screen_entities': self.screen_entities,
+            'screen_entities': {sk: list(ids) for sk, ids in self.screen_entities.items()},
             'next_entity_id': self.next_entity_id,
             'enchanted_cells': enchanted_cells_serializable,
             'enchanted_entities': self.enchanted_entities,
-            'followers': self.followers,
+            'followers': list(self.followers),
             'follower_items': {str(k): v for k, v in self.follower_items.items()},
             'structures': structures_serializable,
-            'opened_chests': list(self.opened_chests),  # Convert set to list for JSON
+            'opened_chests': list(self.opened_chests),  # Set of tuples -> list of lists for JSON
             'next_structure_id': self.next_structure_id,
             # Zone priority system
             'zone_connections': zone_connections_serializable,
@@ -251,7 +256,9 @@ class SaveLoadMixin:
 
             self.screen_last_update = save_data.get('screen_last_update', {})
             self.target_direction = save_data.get('target_direction', 0)
-            self.screen_entities = save_data.get('screen_entities', {})
+            self.screen_entities = {
+                sk: set(ids) for sk, ids in save_data.get('screen_entities', {}).items()
+            }
             self.next_entity_id = save_data.get('next_entity_id', 0)
 
             # Load enchantment data - convert string keys back to tuples
@@ -266,8 +273,8 @@ class SaveLoadMixin:
 
             self.enchanted_entities = save_data.get('enchanted_entities', {})
 
-            # Load followers list
-            self.followers = save_data.get('followers', [])
+            # Load followers set
+            self.followers = set(save_data.get('followers', []))
 
             # Load follower_items (JSON stores int keys as strings — convert back)
             raw_fi = save_data.get('follower_items', {})
@@ -332,6 +339,7 @@ class SaveLoadMixin:
             # Load structure data and convert string keys back to tuples
             structures_loaded = save_data.get('structures', save_data.get('subscreens', {}))
             self.structures = {}
+            self.structure_index = {}
             for structure_key, structure_data in structures_loaded.items():
                 deserialized_structure = {}
                 for key, value in structure_data.items():
@@ -351,8 +359,16 @@ class SaveLoadMixin:
                     else:
                         deserialized_structure[key] = value
                 self.structures[structure_key] = deserialized_structure
+                self.index_structure(structure_key, deserialized_structure)
 
-            self.opened_chests = set(save_data.get('opened_chests', []))
+            # JSON stores each (zone_key, x, y) as a list; older saves used "zone_key:x,y"
+            self.opened_chests = set()
+            for chest_id in save_data.get('opened_chests', []):
+                if isinstance(chest_id, str):
+                    zone_key, _, pos = chest_id.rpartition(':')
+                    x, y = map(int, pos.split(','))
+                    chest_id = (zone_key, x, y)
+                self.opened_chests.add(tuple(chest_id))
             self.next_structure_id = save_data.get('next_structure_id', save_data.get('next_subscreen_id', 0))
 
             # Load zone priority system data
@@ -373,7 +389,16 @@ class SaveLoadMixin:
             self.zone_cave_systems = save_data.get('zone_cave_systems', {})
 
             # Restore tuple keys in screen data (chests, parent_screen, etc.)
+            intern = sys.intern
             for screen_key, screen_data in self.screens.items():
+                # JSON gives every cell its own string; intern them so grids
+                # share the same objects as the cell-type literals in code and
+                # cell comparisons hit the identity fast path
+                if 'grid' in screen_data:
+                    screen_data['grid'] = [[intern(cell) for cell in row] for row in screen_data['grid']]
+                # Older saves predate the cached overworld flag
+                if 'is_overworld' not in screen_data:
+                    screen_data['is_overworld'] = self.is_overworld_zone(screen_key)
                 if 'chests' in screen_data and isinstance(screen_data['chests'], dict):
                     restored_chests = {}
                     for ck, loot in screen_data['chests'].items():
@@ -419,7 +444,7 @@ class SaveLoadMixin:
                     self.player['screen_x'],
                     self.player['screen_y']
                 )
-            self.attack_animations = []
+            self.attack_animations.clear()
             self.state = 'playing'
             # Restore active quest (default to FARM for older saves)
             self.active_quest = save_data.get('active_quest', 'FARM')
@@ -2,7 +2,7 @@ import random
 
 from constants import (
     GRID_WIDTH, GRID_HEIGHT,
-    CELL_TYPES, ENTITY_TYPES,
+    CELL_TYPES, SOLID_CELLS, ENTITY_TYPES,
     RAID_CHECK_INTERVAL, RAID_CHANCE_BASE, RAID_POPULATION_THRESHOLD,
     HIDDEN_CAVE_SPAWN_CHANCE,
     CAVE_HOSTILE_SPAWN_CHANCE,
@@ -10,6 +10,7 @@ from constants import (
     TERMITE_SPAWN_CHANCE,
 )
 from entity import Entity
+from world.zones import make_zone_key
 
 # NPC types that get random starting resources on spawn
 _HUMANOID_NPC_TYPES = frozenset([
@@ -60,8 +61,8 @@ class SpawningMixin:
     def spawn_entities_for_screen(self, screen_x, screen_y, biome_name):
         """Spawn initial entities for a newly generated screen - only at zone edges.
         WARNING: This clears existing entities - use spawn_single_entity_at_entrance for runtime spawning"""
-        screen_key = f"{screen_x},{screen_y}"
-        self.screen_entities[screen_key] = []  # Clear for initial generation
+        screen_key = make_zone_key(screen_x, screen_y)
+        self.screen_entities[screen_key] = set()  # Clear for initial generation
 
         # Biome-based spawning probabilities
         spawn_tables = {
@@ -166,7 +167,7 @@ class SpawningMixin:
                 x, y, entrance = random.choice(entrance_positions)
 
                 cell = self.screens[screen_key]['grid'][y][x]
-                if not CELL_TYPES[cell]['solid']:
+                if cell not in SOLID_CELLS:
                     position_occupied = False
                     for existing_id in self.screen_entities.get(screen_key, []):
                         if existing_id in self.entities:
@@ -183,7 +184,7 @@ class SpawningMixin:
                         if entity_type in _HUMANOID_NPC_TYPES:
                             self._give_random_starting_inventory(entity)
                         self.entities[entity_id] = entity
-                        self.screen_entities[screen_key].append(entity_id)
+                        self.screen_entities[screen_key].add(entity_id)
 
                         if random.random() < 0.1:
                             print(f"{entity_type} has arrived at [{screen_key}]")
@@ -201,10 +202,10 @@ class SpawningMixin:
                 test_x = near_x + dx
                 test_y = near_y + dy
                 if 0 <= test_x < GRID_WIDTH and 0 <= test_y < GRID_HEIGHT:
-                    screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+                    screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
                     if screen_key in self.screens:
                         cell = self.screens[screen_key]['grid'][test_y][test_x]
-                        if not CELL_TYPES[cell].get('solid', False):
+                        if cell not in SOLID_CELLS:
                             skeleton = Entity('SKELETON', test_x, test_y,
                                               self.player['screen_x'],
                                               self.player['screen_y'], 1)
@@ -214,8 +215,8 @@ class SpawningMixin:
                             self.entities[entity_id] = skeleton
 
                             if screen_key not in self.screen_entities:
-                                self.screen_entities[screen_key] = []
-                            self.screen_entities[screen_key].append(entity_id)
+                                self.screen_entities[screen_key] = set()
+                            self.screen_entities[screen_key].add(entity_id)
 
                             print(f"A skeleton rises from the bones!")
                             return entity_id
@@ -229,7 +230,7 @@ class SpawningMixin:
         Returns:
             entity_id if successful, None if failed
         """
-        screen_key = f"{screen_x},{screen_y}"
+        screen_key = make_zone_key(screen_x, screen_y)
 
         if screen_key not in self.screens:
             return None
@@ -238,7 +239,7 @@ class SpawningMixin:
             return None
 
         cell = self.screens[screen_key]['grid'][y][x]
-        if CELL_TYPES[cell].get('solid', False):
+        if cell in SOLID_CELLS:
             # Try to find nearby empty spot
             for dx in range(-2, 3):
                 for dy in range(-2, 3):
@@ -246,7 +247,7 @@ class SpawningMixin:
                     test_y = y + dy
                     if 0 <= test_x < GRID_WIDTH and 0 <= test_y < GRID_HEIGHT:
                         test_cell = self.screens[screen_key]['grid'][test_y][test_x]
-                        if not CELL_TYPES[test_cell].get('solid', False):
+                        if test_cell not in SOLID_CELLS:
                             x, y = test_x, test_y
                             break
                 else:
@@ -261,14 +262,14 @@ class SpawningMixin:
         self.entities[entity_id] = entity
 
         if screen_key not in self.screen_entities:
-            self.screen_entities[screen_key] = []
-        self.screen_entities[screen_key].append(entity_id)
+            self.screen_entities[screen_key] = set()
+        self.screen_entities[screen_key].add(entity_id)
 
         return entity_id
 
     def spawn_runestones_for_screen(self, screen_x, screen_y):
         """Spawn runestones rarely on base biome cells"""
-        screen_key = f"{screen_x},{screen_y}"
+        screen_key = make_zone_key(screen_x, screen_y)
         if screen_key not in self.screens:
             return
 
@@ -288,17 +289,8 @@ class SpawningMixin:
 
                     if cell in ['GRASS', 'DIRT', 'SAND', 'STONE']:
                         rune_type = random.choice(runestone_types)
-
-                        if screen_key not in self.dropped_items:
-                            self.dropped_items[screen_key] = {}
-
-                        drop_key = (x, y)
-                        if drop_key not in self.dropped_items[screen_key]:
-                            self.dropped_items[screen_key][drop_key] = {}
-
                         amount = random.randint(1, 3)
-                        self.dropped_items[screen_key][drop_key][rune_type] = \
-                            self.dropped_items[screen_key][drop_key].get(rune_type, 0) + amount
+                        self.add_dropped_item(screen_key, (x, y), rune_type, amount)
 
                         break
 
@@ -373,7 +365,7 @@ class SpawningMixin:
         for y in range(2, GRID_HEIGHT - 2):
             for x in range(2, GRID_WIDTH - 2):
                 cell = grid[y][x]
-                if not CELL_TYPES[cell].get('solid', False) and cell != 'WALL':
+                if cell not in SOLID_CELLS and cell != 'WALL':
                     valid_positions.append((x, y))
 
         if not valid_positions:
@@ -416,7 +408,7 @@ class SpawningMixin:
                 continue
 
             cell = self.screens[screen_key]['grid'][spawn_y][spawn_x]
-            if CELL_TYPES[cell].get('solid', False):
+            if cell in SOLID_CELLS:
                 continue
 
             if self.is_entity_at_position(spawn_x, spawn_y, screen_key):
@@ -428,8 +420,8 @@ class SpawningMixin:
             self.entities[entity_id] = entity
 
             if screen_key not in self.screen_entities:
-                self.screen_entities[screen_key] = []
-            self.screen_entities[screen_key].append(entity_id)
+                self.screen_entities[screen_key] = set()
+            self.screen_entities[screen_key].add(entity_id)
 
             spawned += 1
 
@@ -444,20 +436,20 @@ class SpawningMixin:
         if not self.zone_has_hostiles.get(screen_key, False):
             return
 
-        if screen_key not in self.screen_entities:
+        zone_entity_ids = self.screen_entities.get(screen_key)
+        if zone_entity_ids is None:
             return
 
-        has_hostiles = False
-        for entity_id in self.screen_entities[screen_key]:
-            if entity_id in self.entities:
-                entity = self.entities[entity_id]
-                if entity.props.get('hostile', False):
-                    has_hostiles = True
-                    break
+        # Stops at the first live hostile, so the common "still contested"
+        # answer costs a handful of lookups
+        get_entity = self.entities.get
+        for entity_id in zone_entity_ids:
+            entity = get_entity(entity_id)
+            if entity is not None and entity.is_hostile and entity.health > 0:
+                return
 
-        if not has_hostiles:
-            self.zone_has_hostiles[screen_key] = False
-            print(f"Zone [{screen_key}] cleared of hostiles!")
+        self.zone_has_hostiles[screen_key] = False
+        print(f"Zone [{screen_key}] cleared of hostiles!")
 
     def check_zone_threats(self, screen_key):
         """Efficiently check zone for hostiles and faction conflicts - called once per zone update"""
@@ -562,7 +554,7 @@ class SpawningMixin:
                 continue
 
             cell = screen['grid'][spawn_y][spawn_x]
-            if CELL_TYPES[cell].get('solid', False):
+            if cell in SOLID_CELLS:
                 if not is_flying or cell in fly_blocked:
                     continue
 
@@ -575,8 +567,8 @@ class SpawningMixin:
             self.entities[entity_id] = entity
 
             if screen_key not in self.screen_entities:
-                self.screen_entities[screen_key] = []
-            self.screen_entities[screen_key].append(entity_id)
+                self.screen_entities[screen_key] = set()
+            self.screen_entities[screen_key].add(entity_id)
 
             self.zone_has_hostiles[screen_key] = True
             return
@@ -636,7 +628,7 @@ class SpawningMixin:
                         test_y = drop_y + dy
                         if 0 < test_x < GRID_WIDTH - 1 and 0 < test_y < GRID_HEIGHT - 1:
                             cell = screen['grid'][test_y][test_x]
-                            if not CELL_TYPES[cell].get('solid', False):
+                            if cell not in SOLID_CELLS:
                                 if not self.is_entity_at_position(test_x, test_y, screen_key):
                                     spawn_positions.append((test_x, test_y))
 
@@ -645,7 +637,7 @@ class SpawningMixin:
                 test_x = random.randint(3, GRID_WIDTH - 4)
                 test_y = random.randint(3, GRID_HEIGHT - 4)
                 cell = screen['grid'][test_y][test_x]
-                if not CELL_TYPES[cell].get('solid', False):
+                if cell not in SOLID_CELLS:
                     if not self.is_entity_at_position(test_x, test_y, screen_key):
                         spawn_positions.append((test_x, test_y))
                         break
@@ -655,16 +647,16 @@ class SpawningMixin:
 
             skeleton = Entity('SKELETON', spawn_x, spawn_y, screen_x, screen_y, level=1)
             skeleton.props = ENTITY_TYPES['SKELETON'].copy()
-            skeleton.props['hostile'] = True
             skeleton.props['attacks_hostile'] = False
+            skeleton.set_hostile(True)
 
             entity_id = self.next_entity_id
             self.next_entity_id += 1
             self.entities[entity_id] = skeleton
 
             if screen_key not in self.screen_entities:
-                self.screen_entities[screen_key] = []
-            self.screen_entities[screen_key].append(entity_id)
+                self.screen_entities[screen_key] = set()
+            self.screen_entities[screen_key].add(entity_id)
 
             self.zone_has_hostiles[screen_key] = True
 
@@ -734,7 +726,7 @@ class SpawningMixin:
 
                         if 0 < test_x < GRID_WIDTH - 1 and 0 < test_y < GRID_HEIGHT - 1:
                             cell = screen['grid'][test_y][test_x]
-                            if not CELL_TYPES[cell].get('solid', False):
+                            if cell not in SOLID_CELLS:
                                 if not self.is_entity_at_position(test_x, test_y, screen_key):
                                     spawn_positions.append((test_x, test_y))
         else:
@@ -742,7 +734,7 @@ class SpawningMixin:
                 test_x = random.randint(3, GRID_WIDTH - 4)
                 test_y = random.randint(3, GRID_HEIGHT - 4)
                 cell = screen['grid'][test_y][test_x]
-                if not CELL_TYPES[cell].get('solid', False):
+                if cell not in SOLID_CELLS:
                     if not self.is_entity_at_position(test_x, test_y, screen_key):
                         spawn_positions.append((test_x, test_y))
                         break
@@ -758,8 +750,8 @@ class SpawningMixin:
             self.entities[entity_id] = termite
 
             if screen_key not in self.screen_entities:
-                self.screen_entities[screen_key] = []
-            self.screen_entities[screen_key].append(entity_id)
+                self.screen_entities[screen_key] = set()
+            self.screen_entities[screen_key].add(entity_id)
 
             self.zone_has_hostiles[screen_key] = True
 
@@ -773,7 +765,7 @@ class SpawningMixin:
         """Check each nearby zone and spawn entities based on population and missing types"""
         player_screen_x = self.player['screen_x']
         player_screen_y = self.player['screen_y']
-        player_zone_key = f"{player_screen_x},{player_screen_y}"
+        player_zone_key = make_zone_key(player_screen_x, player_screen_y)
 
         # Check player zone specifically
         if player_zone_key in self.screens:
@@ -794,7 +786,7 @@ class SpawningMixin:
 
                 zone_x = player_screen_x + dx
                 zone_y = player_screen_y + dy
-                screen_key = f"{zone_x},{zone_y}"
+                screen_key = make_zone_key(zone_x, zone_y)
 
                 if screen_key not in self.screens:
                     continue
@@ -872,7 +864,7 @@ class SpawningMixin:
         Args:
             force_type: If provided, spawn this specific entity type instead of choosing randomly
         """
-        screen_key = f"{screen_x},{screen_y}"
+        screen_key = make_zone_key(screen_x, screen_y)
 
         spawn_tables = {
             'FOREST': [
@@ -938,7 +930,7 @@ class SpawningMixin:
             x, y = random.choice(entrance_positions)
             cell = screen['grid'][y][x]
 
-            if not CELL_TYPES[cell]['solid']:
+            if cell not in SOLID_CELLS:
                 entity_id = self.next_entity_id
                 self.next_entity_id += 1
 
@@ -948,8 +940,8 @@ class SpawningMixin:
                 self.entities[entity_id] = entity
 
                 if screen_key not in self.screen_entities:
-                    self.screen_entities[screen_key] = []
-                self.screen_entities[screen_key].append(entity_id)
+                    self.screen_entities[screen_key] = set()
+                self.screen_entities[screen_key].add(entity_id)
 
                 if random.random() < 0.05:
                     print(f"{entity_type} arrived at [{screen_key}]")
@@ -1013,14 +1005,14 @@ class SpawningMixin:
             entity.subscreen_key = None
 
             if parent_screen_key not in self.screen_entities:
-                self.screen_entities[parent_screen_key] = []
+                self.screen_entities[parent_screen_key] = set()
             if entity_id not in self.screen_entities[parent_screen_key]:
-                self.screen_entities[parent_screen_key].append(entity_id)
+                self.screen_entities[parent_screen_key].add(entity_id)
 
             evacuated_count += 1
 
         if subscreen_key in self.screen_entities:
-            self.screen_entities[subscreen_key] = []
+            self.screen_entities[subscreen_key] = set()
 
         if evacuated_count > 0:
             print(f"  Evacuated {evacuated_count} entities from destroyed structure")
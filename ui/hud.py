@@ -1,11 +1,12 @@
 import pygame
 
 from constants import (
-    COLORS, CELL_TYPES, ITEMS, QUEST_TYPES,
+    COLORS, CELL_TYPES, ITEMS, QUEST_TYPES, ENTERABLE_CELLS,
     CELL_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
     GRID_WIDTH, GRID_HEIGHT,
     NIGHT_OVERLAY_ALPHA,
 )
+from world.zones import make_zone_key
 
 
 class HudMixin:
@@ -19,7 +20,7 @@ class HudMixin:
         if self.current_screen:
             # Determine correct screen key for dropped items
             # Unified zone system: player screen_x/y reflects virtual coords in structure zones
-            screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+            screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
             # Ensure variant_grid exists (backfill for screens generated before variant system)
             if 'variant_grid' not in self.current_screen:
@@ -281,7 +282,7 @@ class HudMixin:
             # Draw entities on current screen or structure
             # Unified zone system: player screen_x/y reflects virtual coords in structure zones
             entities_to_draw = []
-            screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+            screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
             if screen_key in self.screen_entities:
                 entities_to_draw = self.screen_entities[screen_key]
 
@@ -301,7 +302,7 @@ class HudMixin:
                     # Skip entities that are in a different zone than the player.
                     # Can occur during transition ticks when screen_entities hasn't
                     # been fully reconciled. Still run movement/animation for coherence.
-                    entity_zone = f"{entity.screen_x},{entity.screen_y}"
+                    entity_zone = make_zone_key(entity.screen_x, entity.screen_y)
                     if entity_zone != screen_key:
                         entity.update_smooth_movement()
                         entity.update_animation()
@@ -475,7 +476,7 @@ class HudMixin:
 
             # Debug: Draw memory lanes for traders
             if self.debug_memory_lanes:
-                screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+                screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
                 if screen_key in self.screen_entities:
                     for entity_id in self.screen_entities[screen_key]:
                         if entity_id in self.entities:
@@ -522,7 +523,7 @@ class HudMixin:
                 PLAYER_TICKS_PER_FRAME = 10
 
                 is_moving = self.player.get('is_moving', False)
-                keys_held = pygame.key.get_pressed()
+                keys_held = self._keys_this_tick
                 movement_key_held = (keys_held[pygame.K_UP] or keys_held[pygame.K_w] or
                                      keys_held[pygame.K_DOWN] or keys_held[pygame.K_s] or
                                      keys_held[pygame.K_LEFT] or keys_held[pygame.K_a] or
@@ -656,7 +657,7 @@ class HudMixin:
 
             # Enchantment count (shows how many things are enchanted, consuming max_energy)
             enchant_count = len(self.enchanted_cells.get(
-                f"{self.player['screen_x']},{self.player['screen_y']}", {})) + len(self.enchanted_entities)
+                make_zone_key(self.player['screen_x'], self.player['screen_y']), {})) + len(self.enchanted_entities)
             if enchant_count > 0:
                 enc_x = nrg_x + 28 + BAR_W + 4 + 50 + 14
                 enc_lbl = self.tiny_font.render(
@@ -690,7 +691,7 @@ class HudMixin:
             else:
                 info_text += f"Screen: ({self.player['screen_x']}, {self.player['screen_y']}) | "
                 info_text += f"Biome: {self.current_screen['biome'] if self.current_screen else 'Unknown'}"
-                screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+                screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
                 controlling_faction = self.get_zone_controlling_faction(screen_key)
                 if controlling_faction:
                     info_text += f" | {controlling_faction}"
@@ -752,7 +753,7 @@ class HudMixin:
                     hint_text = "SPACE: Descend"
                 elif cell == 'CHEST':
                     hint_text = "SPACE: Open Chest"
-                elif CELL_TYPES.get(cell, {}).get('enterable'):
+                elif cell in ENTERABLE_CELLS:
                     hint_text = "SPACE: Enter"
 
             controls = f"{hint_text} | B: Block | C: Craft | X: Combine | L: Cast | E: Pickup"
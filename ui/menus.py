@@ -5,6 +5,7 @@ from constants import (
     CELL_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
     GRID_WIDTH, GRID_HEIGHT,
 )
+from world.zones import make_zone_key
 
 
 class MenusMixin:
@@ -336,7 +337,7 @@ class MenusMixin:
             return
 
         tx, ty = target
-        screen_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        screen_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         info_lines = []
 
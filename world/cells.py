@@ -2,7 +2,7 @@ import random
 
 from constants import (
     GRID_WIDTH, GRID_HEIGHT,
-    CELL_TYPES, BIOMES,
+    CELL_TYPES, BIOMES, TREE_CELLS,
     # Cellular automata rates
     DIRT_TO_GRASS_RATE, GRASS_TO_DIRT_RATE, DIRT_TO_SAND_RATE,
     TREE_GROWTH_RATE, TREE_DECAY_RATE, TREE_CROWD_DECAY_RATE,
@@ -20,6 +20,40 @@ from constants import (
     # Day/night
     DAY_LENGTH, NIGHT_LENGTH,
 )
+from world.zones import make_zone_key
+
+# Cell types with at least one cellular automata rule.  A zone holding none of
+# these can only change through its exit cells.
+CA_ACTIVE_CELLS = frozenset(
+    {'GRASS', 'DIRT', 'SAND', 'WATER', 'DEEP_WATER', 'FLOWER',
+     'WOOD', 'PLANKS', 'CARROT1', 'CARROT2', 'CARROT3'}
+    | TREE_CELLS
+)
+
+# Exit cells are seeded with the adjacent zone's primary biome cell
+EXIT_PRIMARY_CELLS = {'FOREST': 'GRASS', 'PLAINS': 'GRASS', 'DESERT': 'SAND',
+                      'MOUNTAINS': 'DIRT', 'LAKE': 'WATER'}
+EXIT_OFFSETS = {'top': (0, -1), 'bottom': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
+
+# Neighbour-count categories, in the order apply_cellular_automata unpacks
+# them.  A cell belongs to the category it equals or starts with (TREE1 → TREE),
+# as in count_cell_type; index len(CA_NEIGHBOR_CATEGORIES) means "none".
+CA_NEIGHBOR_CATEGORIES = ('WATER', 'DEEP_WATER', 'DIRT', 'GRASS',
+                          'TREE', 'SAND', 'FLOWER', 'COBBLESTONE')
+_CA_CATEGORY_INDEX = {}
+
+
+def _ca_category(cell):
+    """Return cell's index in CA_NEIGHBOR_CATEGORIES (memoised per cell type)."""
+    index = _CA_CATEGORY_INDEX.get(cell)
+    if index is None:
+        index = len(CA_NEIGHBOR_CATEGORIES)
+        for i, category in enumerate(CA_NEIGHBOR_CATEGORIES):
+            if cell == category or (isinstance(cell, str) and cell.startswith(category)):
+                index = i
+                break
+        _CA_CATEGORY_INDEX[cell] = index
+    return index
 
 
 class CellsMixin:
@@ -76,7 +110,7 @@ class CellsMixin:
         elif direction == 'right':
             adj_x += 1
 
-        adj_key = f"{adj_x},{adj_y}"
+        adj_key = make_zone_key(adj_x, adj_y)
         if adj_key in self.screens:
             return self.screens[adj_key]['biome']
 
@@ -95,14 +129,30 @@ class CellsMixin:
         cell_coverage: fraction of cells to process this cycle (0.0–1.0).
         1.0 = all cells, 0.5 = half skipped at random (player zone default), etc.
         """
-        key = f"{screen_x},{screen_y}"
+        key = make_zone_key(screen_x, screen_y)
         if key not in self.screens:
             return
 
         screen = self.screens[key]
-        new_grid = [row[:] for row in screen['grid']]  # shallow copy per row
+
+        # Zones with nothing the rules below can touch (cave and house
+        # interiors, paved areas) skip the per-cell pass entirely
+        if self.is_zone_ca_static(screen_x, screen_y, screen):
+            self.check_zone_biome_shift(screen_x, screen_y)
+            return
+
+        grid = screen['grid']
+        new_grid = [row[:] for row in grid]  # shallow copy per row
         biome = screen.get('biome', 'FOREST')
 
+        # Category code per cell, so each cell's eight neighbour counts are
+        # eight list increments instead of eight count_cell_type scans
+        category_grid = [[_ca_category(cell) for cell in row] for row in grid]
+        # HOUSE/CAMP positions for the wood/planks decay rule
+        structure_cells = self.find_structure_cells(grid)
+        # Enchanted (x, y) cells are frozen; bound once rather than per cell
+        enchanted = self.enchanted_cells.get(key)
+
         _tp = getattr(self, 'time_pass_speed', 1.0)
 
         # Drought modifier: growth slows and decay accelerates the longer it hasn't rained.
@@ -118,12 +168,12 @@ class CellsMixin:
                 if random.random() > cell_coverage:
                     continue
 
-                cell = screen['grid'][y][x]
+                cell = grid[y][x]
 
-                if cell in ['WALL', 'HOUSE', 'CAVE', 'CLIFF']:
+                if cell in ('WALL', 'HOUSE', 'CAVE', 'CLIFF'):
                     continue
 
-                if self.is_cell_enchanted(x, y, key):
+                if enchanted and (x, y) in enchanted:
                     continue
 
                 # Zone entrance cells are seeded with the adjacent zone's primary biome cell.
@@ -131,14 +181,11 @@ class CellsMixin:
                 # untouched so normal probabilistic rules govern it from there.
                 at_exit, direction = self.is_at_exit(x, y)
                 if at_exit:
-                    offsets = {'top': (0, -1), 'bottom': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
-                    dx, dy = offsets.get(direction, (0, 0))
-                    adj_key = f"{screen_x + dx},{screen_y + dy}"
+                    dx, dy = EXIT_OFFSETS.get(direction, (0, 0))
+                    adj_key = make_zone_key(screen_x + dx, screen_y + dy)
                     if adj_key in self.screens:
                         adj_biome = self.screens[adj_key].get('biome', screen['biome'])
-                        _primary = {'FOREST': 'GRASS', 'PLAINS': 'GRASS', 'DESERT': 'SAND',
-                                    'MOUNTAINS': 'DIRT', 'LAKE': 'WATER'}
-                        target = _primary.get(adj_biome)
+                        target = EXIT_PRIMARY_CELLS.get(adj_biome)
                         if target and cell != target:
                             new_grid[y][x] = target
                     continue
@@ -146,18 +193,20 @@ class CellsMixin:
                 if x == 0 or x == GRID_WIDTH - 1 or y == 0 or y == GRID_HEIGHT - 1:
                     continue
 
-                neighbors = self.get_neighbors(x, y, key)
-                if not neighbors:
-                    continue
-
-                water_count = self.count_cell_type(neighbors, 'WATER')
-                deep_water_count = self.count_cell_type(neighbors, 'DEEP_WATER')
-                dirt_count = self.count_cell_type(neighbors, 'DIRT')
-                grass_count = self.count_cell_type(neighbors, 'GRASS')
-                tree_count = self.count_cell_type(neighbors, 'TREE')
-                sand_count = self.count_cell_type(neighbors, 'SAND')
-                flower_count = self.count_cell_type(neighbors, 'FLOWER')
-                cobblestone_count = self.count_cell_type(neighbors, 'COBBLESTONE')
+                above = category_grid[y - 1]
+                middle = category_grid[y]
+                below = category_grid[y + 1]
+                counts = [0] * (len(CA_NEIGHBOR_CATEGORIES) + 1)
+                counts[above[x - 1]] += 1
+                counts[above[x]] += 1
+                counts[above[x + 1]] += 1
+                counts[middle[x - 1]] += 1
+                counts[middle[x + 1]] += 1
+                counts[below[x - 1]] += 1
+                counts[below[x]] += 1
+                counts[below[x + 1]] += 1
+                (water_count, deep_water_count, dirt_count, grass_count,
+                 tree_count, sand_count, flower_count, cobblestone_count, _) = counts
 
                 total_water = water_count + deep_water_count
 
@@ -240,23 +289,23 @@ class CellsMixin:
 
                 # Tree → Cobblestone (tree stranded inside a cobblestone road — 5+ of 8 neighbors cobblestone)
                 # High threshold prevents cascade: edge trees are untouched, only truly embedded ones convert
-                elif cell.startswith('TREE') and cobblestone_count >= 5:
+                elif cell in TREE_CELLS and cobblestone_count >= 5:
                     if random.random() < min(1.0, TREE_DECAY_RATE * _decay):
                         new_grid[y][x] = 'COBBLESTONE'
 
                 # Tree → Grass (near cobblestone road but not embedded — clears treeline)
-                elif cell.startswith('TREE') and cobblestone_count > 0:
+                elif cell in TREE_CELLS and cobblestone_count > 0:
                     if random.random() < min(1.0, TREE_CROWD_DECAY_RATE * _decay):
                         new_grid[y][x] = 'GRASS'
 
                 # Trees on/near sand decay fast to SAND (desert kills trees)
-                elif cell.startswith('TREE') and sand_count >= 1:
+                elif cell in TREE_CELLS and sand_count >= 1:
                     if random.random() < min(1.0, 0.15 * _decay):
                         new_grid[y][x] = 'SAND'
 
                 # Tree crowding decay — any adjacent tree triggers decay chance
                 # Naturally produces checkerboard spacing as isolated trees survive
-                elif cell.startswith('TREE') and tree_count >= 1:
+                elif cell in TREE_CELLS and tree_count >= 1:
                     if random.random() < min(1.0, TREE_CROWD_DECAY_RATE * _decay):
                         new_grid[y][x] = 'GRASS'
 
@@ -270,12 +319,12 @@ class CellsMixin:
                                 new_grid[y][x] = neighbor
 
                 # Wood decay to dirt (outside structures)
-                elif cell == 'WOOD' and not self.is_near_structure(x, y, key):
+                elif cell == 'WOOD' and not self.near_structure_cells(structure_cells, x, y):
                     if random.random() < min(1.0, 0.05 * _tp):
                         new_grid[y][x] = 'DIRT'
 
                 # Planks decay to dirt (outside structures)
-                elif cell == 'PLANKS' and not self.is_near_structure(x, y, key):
+                elif cell == 'PLANKS' and not self.near_structure_cells(structure_cells, x, y):
                     if random.random() < min(1.0, 0.03 * _tp):
                         new_grid[y][x] = 'DIRT'
 
@@ -312,13 +361,29 @@ class CellsMixin:
 
         self.check_zone_biome_shift(screen_x, screen_y)
 
+    def is_zone_ca_static(self, screen_x, screen_y, screen):
+        """True when no cellular automata rule can change any cell in screen.
+
+        That holds when the grid has no CA_ACTIVE_CELLS and no adjacent zone
+        would reseed the exit cells with its primary biome cell.
+        """
+        isdisjoint = CA_ACTIVE_CELLS.isdisjoint
+        for row in screen['grid']:
+            if not isdisjoint(row):
+                return False
+        for dx, dy in EXIT_OFFSETS.values():
+            adj_screen = self.screens.get(make_zone_key(screen_x + dx, screen_y + dy))
+            if adj_screen is not None and adj_screen.get('biome', screen['biome']) in EXIT_PRIMARY_CELLS:
+                return False
+        return True
+
     # -------------------------------------------------------------------------
     # Rain
     # -------------------------------------------------------------------------
 
     def apply_rain(self, screen_x, screen_y):
         """Apply rain effects — convert some cells to water, dirt to grass (biome-specific)"""
-        key = f"{screen_x},{screen_y}"
+        key = make_zone_key(screen_x, screen_y)
         if key not in self.screens:
             return
 
@@ -410,7 +475,7 @@ class CellsMixin:
 
         for dx in range(-2, 3):
             for dy in range(-2, 3):
-                zone_key = f"{player_x + dx},{player_y + dy}"
+                zone_key = make_zone_key(player_x + dx, player_y + dy)
 
                 if zone_key not in self.dropped_items or zone_key not in self.screens:
                     continue
@@ -2,10 +2,11 @@ import random
 
 from constants import (
     GRID_WIDTH, GRID_HEIGHT,
-    CELL_TYPES, BIOMES,
+    CELL_TYPES, SOLID_CELLS, BIOMES,
     NATURAL_CAVE_ZONE_CHANCE,
 )
 from entity import Entity
+from world.zones import make_zone_key, HEAL_BOOST_CELLS
 
 
 class WorldGenerationMixin:
@@ -18,7 +19,7 @@ class WorldGenerationMixin:
 
     def generate_screen(self, sx, sy):
         """Generate a procedural screen"""
-        key = f"{sx},{sy}"
+        key = make_zone_key(sx, sy)
         if key in self.screens:
             return self.screens[key]
 
@@ -35,19 +36,19 @@ class WorldGenerationMixin:
         }
 
         # Force exits to match neighboring screens (bidirectional)
-        top_neighbor_key = f"{sx},{sy-1}"
+        top_neighbor_key = make_zone_key(sx, sy-1)
         if top_neighbor_key in self.screens:
             exits['top'] = self.screens[top_neighbor_key]['exits']['bottom']
 
-        bottom_neighbor_key = f"{sx},{sy+1}"
+        bottom_neighbor_key = make_zone_key(sx, sy+1)
         if bottom_neighbor_key in self.screens:
             exits['bottom'] = self.screens[bottom_neighbor_key]['exits']['top']
 
-        left_neighbor_key = f"{sx-1},{sy}"
+        left_neighbor_key = make_zone_key(sx-1, sy)
         if left_neighbor_key in self.screens:
             exits['left'] = self.screens[left_neighbor_key]['exits']['right']
 
-        right_neighbor_key = f"{sx+1},{sy}"
+        right_neighbor_key = make_zone_key(sx+1, sy)
         if right_neighbor_key in self.screens:
             exits['right'] = self.screens[right_neighbor_key]['exits']['left']
 
@@ -179,14 +180,15 @@ class WorldGenerationMixin:
             well_y = GRID_HEIGHT // 2 + random.randint(-3, 3)
             well_x = max(2, min(GRID_WIDTH - 3,  well_x))
             well_y = max(2, min(GRID_HEIGHT - 3, well_y))
-            if not CELL_TYPES.get(grid[well_y][well_x], {}).get('solid', False):
+            if grid[well_y][well_x] not in SOLID_CELLS:
                 grid[well_y][well_x] = 'WELL'
 
         screen_data = {
             'grid': grid,
             'variant_grid': variant_grid,
             'exits': exits,
-            'biome': biome_name
+            'biome': biome_name,
+            'is_overworld': self.is_overworld_zone(key),
         }
 
         self.screens[key] = screen_data
@@ -210,7 +212,7 @@ class WorldGenerationMixin:
         if random.random() < cave_chance:
             valid = [(x, y) for y in range(2, GRID_HEIGHT - 2)
                      for x in range(2, GRID_WIDTH - 2)
-                     if CELL_TYPES.get(grid[y][x], {}).get('solid', False)
+                     if grid[y][x] in SOLID_CELLS
                      and grid[y][x] != 'WALL']
             if valid:
                 cx, cy = random.choice(valid)
@@ -240,13 +242,16 @@ class WorldGenerationMixin:
 
     def set_grid_cell(self, screen, x, y, new_cell):
         """Set a grid cell and update its variant. Use instead of direct grid assignment."""
-        screen['grid'][y][x] = new_cell
+        grid = screen['grid']
+        if new_cell in HEAL_BOOST_CELLS or grid[y][x] in HEAL_BOOST_CELLS:
+            self.invalidate_heal_boost_field(screen)
+        grid[y][x] = new_cell
         if 'variant_grid' in screen:
             screen['variant_grid'][y][x] = self.roll_cell_variant(new_cell)
 
     def update_screen_exits(self, sx, sy):
         """Update a screen's grid walls to match its current exits"""
-        key = f"{sx},{sy}"
+        key = make_zone_key(sx, sy)
         if key not in self.screens:
             return
 
@@ -260,7 +265,7 @@ class WorldGenerationMixin:
         # Update top edge
         for x in range(GRID_WIDTH):
             if exits['top'] and GRID_WIDTH // 2 - 1 <= x <= GRID_WIDTH // 2:
-                top_neighbor_key = f"{sx},{sy - 1}"
+                top_neighbor_key = make_zone_key(sx, sy - 1)
                 if top_neighbor_key in self.screens:
                     adj_biome = self.screens[top_neighbor_key].get('biome', biome)
                     adj_cell = self.get_common_cell_for_biome(adj_biome)
@@ -273,7 +278,7 @@ class WorldGenerationMixin:
         # Update bottom edge
         for x in range(GRID_WIDTH):
             if exits['bottom'] and GRID_WIDTH // 2 - 1 <= x <= GRID_WIDTH // 2:
-                bottom_neighbor_key = f"{sx},{sy + 1}"
+                bottom_neighbor_key = make_zone_key(sx, sy + 1)
                 if bottom_neighbor_key in self.screens:
                     adj_biome = self.screens[bottom_neighbor_key].get('biome', biome)
                     adj_cell = self.get_common_cell_for_biome(adj_biome)
@@ -286,7 +291,7 @@ class WorldGenerationMixin:
         # Update left edge
         for y in range(GRID_HEIGHT):
             if exits['left'] and GRID_HEIGHT // 2 - 1 <= y <= GRID_HEIGHT // 2:
-                left_neighbor_key = f"{sx - 1},{sy}"
+                left_neighbor_key = make_zone_key(sx - 1, sy)
                 if left_neighbor_key in self.screens:
                     adj_biome = self.screens[left_neighbor_key].get('biome', biome)
                     adj_cell = self.get_common_cell_for_biome(adj_biome)
@@ -299,7 +304,7 @@ class WorldGenerationMixin:
         # Update right edge
         for y in range(GRID_HEIGHT):
             if exits['right'] and GRID_HEIGHT // 2 - 1 <= y <= GRID_HEIGHT // 2:
-                right_neighbor_key = f"{sx + 1},{sy}"
+                right_neighbor_key = make_zone_key(sx + 1, sy)
                 if right_neighbor_key in self.screens:
                     adj_biome = self.screens[right_neighbor_key].get('biome', biome)
                     adj_cell = self.get_common_cell_for_biome(adj_biome)
@@ -349,6 +354,25 @@ class WorldGenerationMixin:
     # Subscreen (interior) generation
     # -------------------------------------------------------------------------
 
+    def index_structure(self, structure_key, structure):
+        """Register a structure under its parent screen and entrance cell for find_structure."""
+        parent = (tuple(structure['parent_screen']), tuple(structure['parent_cell']))
+        self.structure_index.setdefault(parent, []).append(structure_key)
+
+    def find_structure(self, parent_screen, parent_cell, structure_type=None, depth=None):
+        """Return the first structure key entered from parent_cell of parent_screen.
+
+        Optionally restricted to one structure type and/or cave depth; None
+        when nothing matches. Structures are listed in creation order."""
+        for key in self.structure_index.get((parent_screen, parent_cell), ()):
+            structure = self.structures[key]
+            if structure_type is not None and structure.get('type') != structure_type:
+                continue
+            if depth is not None and structure.get('depth') != depth:
+                continue
+            return key
+        return None
+
     def generate_structure_zone(self, parent_screen_x, parent_screen_y, cell_x, cell_y, structure_type, depth=1):
         """Generate interior for house/cave as a real zone at virtual coordinates.
 
@@ -357,7 +381,7 @@ class WorldGenerationMixin:
         zones but are unreachable by normal walking.  A door_map entry links
         the overworld entrance cell to the structure entrance and back.
         """
-        parent_key = f"{parent_screen_x},{parent_screen_y}"
+        parent_key = make_zone_key(parent_screen_x, parent_screen_y)
 
         # For CAVE at depth 1, reuse the existing cave zone for this parent zone
         if structure_type == 'CAVE' and depth == 1:
@@ -369,7 +393,7 @@ class WorldGenerationMixin:
         self.next_structure_id += 1
         vx = -(1000 + structure_id * 10)
         vy = 0
-        zone_key = f"{vx},{vy}"
+        zone_key = make_zone_key(vx, vy)
 
         if zone_key in self.structures:
             return zone_key
@@ -390,6 +414,7 @@ class WorldGenerationMixin:
             'parent_cell': (cell_x, cell_y),
             'grid': grid,
             'biome': structure_type,
+            'is_overworld': False,
             'depth': depth,
             'entrance': entrance_pos,
             'exit': entrance_pos,
@@ -402,9 +427,10 @@ class WorldGenerationMixin:
         # Register as a full zone (in both dicts for backward-compat metadata lookups)
         self.structures[zone_key] = structure_data
         self.screens[zone_key] = structure_data
+        self.index_structure(zone_key, structure_data)
         self.screen_last_update[zone_key] = self.tick
         if zone_key not in self.screen_entities:
-            self.screen_entities[zone_key] = []
+            self.screen_entities[zone_key] = set()
 
         # Door mapping: parent entrance cell ↔ structure zone entrance (bidirectional)
         entrance_x, entrance_y = entrance_pos
@@ -440,7 +466,7 @@ class WorldGenerationMixin:
         # and register them in screen_entities
         for eid in structure_data.get('entities', []):
             if eid not in self.screen_entities[zone_key]:
-                self.screen_entities[zone_key].append(eid)
+                self.screen_entities[zone_key].add(eid)
             if eid in self.entities:
                 e = self.entities[eid]
                 e.screen_x = vx
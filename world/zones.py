@@ -1,8 +1,9 @@
+import heapq
 import random
 
 from constants import (
     GRID_WIDTH, GRID_HEIGHT,
-    CELL_TYPES, ENTITY_TYPES,
+    CELL_GROWTH_RULES, SOLID_CELLS, TREE_CELLS, CARROT_CELLS,
     MAX_CATCHUP_PER_FRAME, MAX_CYCLES_TO_SIMULATE,
     UPDATE_FREQUENCY, MAX_ZONES_PER_UPDATE,
     NEW_ZONE_INSTANTIATE_CHANCE,
@@ -15,6 +16,42 @@ from constants import (
 from entity import Entity
 
 
+_ZONE_KEYS = {}  # {(sx, sy): "sx,sy"} — one shared key string per zone
+_ZONE_COORDS = {}  # {"sx,sy": (sx, sy)} — the reverse mapping
+
+# Cells that keep an orthogonally adjacent COBBLESTONE from decaying
+COBBLESTONE_ANCHOR_CELLS = frozenset(('HOUSE', 'CAMP', 'CAVE', 'MINESHAFT'))
+
+# Cells that boost healing nearby; placing or removing one invalidates the
+# zone's cached heal boost field
+HEAL_BOOST_CELLS = frozenset(('CAMP', 'HOUSE'))
+
+
+def make_zone_key(sx, sy):
+    """Return the "sx,sy" key string for a zone.
+
+    Zone keys are built in every hot loop; reusing one string per zone skips
+    the int formatting and lets dict lookups use its cached hash."""
+    key = _ZONE_KEYS.get((sx, sy))
+    if key is None:
+        key = _ZONE_KEYS[(sx, sy)] = f"{sx},{sy}"
+        _ZONE_COORDS[key] = (sx, sy)
+    return key
+
+
+def zone_coords(key):
+    """Return (sx, sy) for an "sx,sy" zone key.
+
+    The inverse of make_zone_key, cached the same way so scans over every
+    zone don't re-split and re-parse the key each pass.  Raises ValueError
+    for keys that are not plain coordinates (structure/subscreen keys)."""
+    coords = _ZONE_COORDS.get(key)
+    if coords is None:
+        sx, sy = map(int, key.split(','))
+        coords = _ZONE_COORDS[key] = (sx, sy)
+    return coords
+
+
 class ZonesMixin:
     """Handles zone update loop, priority queue, catch-up simulation,
     biome shifts, and entity lifecycle across zones."""
@@ -37,7 +74,7 @@ class ZonesMixin:
         if random.random() < NEW_ZONE_INSTANTIATE_CHANCE:
             range_x = random.randint(-20, 20)
             range_y = random.randint(-20, 20)
-            new_zone_key = f"{range_x},{range_y}"
+            new_zone_key = make_zone_key(range_x, range_y)
             if new_zone_key not in self.screens:
                 self.generate_screen(range_x, range_y)
                 self.instantiated_zones.add(new_zone_key)
@@ -55,13 +92,13 @@ class ZonesMixin:
 
         # Always update the player's zone first at full coverage
         # player screen_x/y reflects virtual coords when in structure zone — no special case needed
-        player_zone_key = f"{self.player['screen_x']},{self.player['screen_y']}"
+        player_zone_key = make_zone_key(self.player['screen_x'], self.player['screen_y'])
 
         # Build set of mandatory zones: player + 4 cardinal neighbors
         psx, psy = self.player['screen_x'], self.player['screen_y']
         mandatory_zones = {player_zone_key}
         for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-            nk = f"{psx + dx},{psy + dy}"
+            nk = make_zone_key(psx + dx, psy + dy)
             if nk in self.screens:
                 mandatory_zones.add(nk)
         # Include structure zones connected to player zone
@@ -133,7 +170,7 @@ class ZonesMixin:
 
     def update_zone_with_coverage(self, zone_x, zone_y, cell_coverage, entity_coverage):
         """Update a zone — when selected, update ALL its features."""
-        zone_key = f"{zone_x},{zone_y}"
+        zone_key = make_zone_key(zone_x, zone_y)
 
         if zone_key not in self.screens:
             return
@@ -160,38 +197,34 @@ class ZonesMixin:
         self.apply_cellular_automata(zone_x, zone_y, cell_coverage)
 
         _tp = getattr(self, 'time_pass_speed', 1.0)
-
-        for y in range(1, GRID_HEIGHT - 1):
-            for x in range(1, GRID_WIDTH - 1):
-                if self.is_cell_enchanted(x, y, zone_key):
+        enchanted = self.enchanted_cells.get(zone_key)
+        grid = screen['grid']
+        growth_rules = CELL_GROWTH_RULES
+        # Hot names bound once as locals for the per-cell loops below
+        rand = random.random
+        set_cell = self.set_grid_cell
+        ys = range(1, GRID_HEIGHT - 1)
+        xs = range(1, GRID_WIDTH - 1)
+
+        for y in ys:
+            for x in xs:
+                if enchanted and (x, y) in enchanted:
                     continue
 
-                cell = screen['grid'][y][x]
-                if cell in CELL_TYPES:
-                    cell_info = CELL_TYPES[cell]
-
-                    if 'grows_to' in cell_info and random.random() < min(1.0, cell_info.get('growth_rate', 0) * _tp):
-                        self.set_grid_cell(screen, x, y, cell_info['grows_to'])
-                    elif 'degrades_to' in cell_info and random.random() < min(1.0, cell_info.get('degrade_rate', 0) * _tp):
-                        if cell == 'COBBLESTONE':
-                            center_x = GRID_WIDTH // 2
-                            center_y = GRID_HEIGHT // 2
-                            on_horizontal_center = abs(y - center_y) <= 2
-                            on_vertical_center = abs(x - center_x) <= 2
-                            if on_horizontal_center or on_vertical_center:
-                                continue
-                            has_structure_neighbor = False
-                            for nx, ny in [(x-1, y), (x+1, y), (x, y-1), (x, y+1)]:
-                                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-                                    neighbor_cell = screen['grid'][ny][nx]
-                                    if neighbor_cell in ['HOUSE', 'CAMP', 'CAVE', 'MINESHAFT']:
-                                        has_structure_neighbor = True
-                                        break
-                            if has_structure_neighbor:
-                                continue
+                cell = grid[y][x]
+                rule = growth_rules.get(cell)
+                if rule is not None:
+                    grows_to, growth_rate, degrades_to, degrade_rate = rule
+
+                    if grows_to is not None and rand() < min(1.0, growth_rate * _tp):
+                        set_cell(screen, x, y, grows_to)
+                    elif degrades_to is not None and rand() < min(1.0, degrade_rate * _tp):
+                        # Cobblestone only decays off the main roads and away from structures
+                        if cell == 'COBBLESTONE' and self.is_cobblestone_protected(grid, x, y):
+                            continue
 
                         old_cell = cell
-                        self.set_grid_cell(screen, x, y, cell_info['degrades_to'])
+                        set_cell(screen, x, y, degrades_to)
 
                         if old_cell == 'HOUSE':
                             self.process_house_destruction(x, y, zone_key)
@@ -199,13 +232,13 @@ class ZonesMixin:
         # Desert rock/ore formation — SAND slowly solidifies into STONE;
         # existing STONE rarely yields IRON_ORE
         if screen.get('biome') == 'DESERT':
-            for y in range(1, GRID_HEIGHT - 1):
-                for x in range(1, GRID_WIDTH - 1):
-                    cell = screen['grid'][y][x]
-                    if cell == 'SAND' and random.random() < min(1.0, DESERT_ROCK_FORMATION_RATE * _tp):
-                        self.set_grid_cell(screen, x, y, 'STONE')
-                    elif cell == 'STONE' and random.random() < min(1.0, DESERT_ORE_FORMATION_RATE * _tp):
-                        self.set_grid_cell(screen, x, y, 'IRON_ORE')
+            for y in ys:
+                for x in xs:
+                    cell = grid[y][x]
+                    if cell == 'SAND' and rand() < min(1.0, DESERT_ROCK_FORMATION_RATE * _tp):
+                        set_cell(screen, x, y, 'STONE')
+                    elif cell == 'STONE' and rand() < min(1.0, DESERT_ORE_FORMATION_RATE * _tp):
+                        set_cell(screen, x, y, 'IRON_ORE')
 
         # === BIOME REVERSION & SPREADING ===
         biome = screen.get('biome', 'FOREST')
@@ -275,6 +308,7 @@ class ZonesMixin:
 
         if zone_key in self.screen_entities:
             entities_to_remove = []
+            heal_field = None  # built on first peaceful entity
 
             for entity_id in list(self.screen_entities[zone_key]):
                 if entity_id not in self.entities:
@@ -324,21 +358,10 @@ class ZonesMixin:
 
                 # Healing boost near camp/house
                 heal_boost = 1.0
-                if not entity.props.get('hostile', False):
-                    for dx in range(-3, 4):
-                        for dy in range(-3, 4):
-                            check_x = entity.x + dx
-                            check_y = entity.y + dy
-                            if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                                cell = screen['grid'][check_y][check_x]
-                                if cell == 'CAMP':
-                                    heal_boost = CAMP_HEALING_MULTIPLIER
-                                    break
-                                elif cell == 'HOUSE':
-                                    heal_boost = HOUSE_HEALING_MULTIPLIER
-                                    break
-                        if heal_boost > 1.0:
-                            break
+                if not entity.is_hostile:
+                    if heal_field is None:
+                        heal_field = self.get_heal_boost_field(screen)
+                    heal_boost = heal_field[entity.y * GRID_WIDTH + entity.x]
 
                 entity.regenerate_health(heal_boost)
 
@@ -430,7 +453,7 @@ class ZonesMixin:
                         remove_id = singles.pop(0)
                         keeper = self.entities[keep_id]
                         removed = self.entities[remove_id]
-                        keeper.type = f"{base_type}_double"
+                        keeper.set_type(f"{base_type}_double")
                         keeper.max_health = int(keeper.max_health * 1.5)
                         keeper.health = min(keeper.health + removed.health, keeper.max_health)
                         keeper.strength = int(keeper.strength * 1.3)
@@ -480,7 +503,7 @@ class ZonesMixin:
                         spawn_y = random.randint(3, GRID_HEIGHT - 4)
 
                         if zone_key in self.screens:
-                            if not CELL_TYPES[screen['grid'][spawn_y][spawn_x]].get('solid', False):
+                            if screen['grid'][spawn_y][spawn_x] not in SOLID_CELLS:
                                 warrior = Entity('WARRIOR', spawn_x, spawn_y, zone_x, zone_y,
                                                  level=random.randint(2, 4))
                                 warrior.faction = raiding_faction
@@ -489,7 +512,7 @@ class ZonesMixin:
                                 warrior_id = self.next_entity_id
                                 self.next_entity_id += 1
                                 self.entities[warrior_id] = warrior
-                                self.screen_entities[zone_key].append(warrior_id)
+                                self.screen_entities[zone_key].add(warrior_id)
 
                                 if raiding_faction not in self.factions:
                                     self.factions[raiding_faction] = {'warriors': [], 'zones': set()}
@@ -589,31 +612,26 @@ class ZonesMixin:
                         trader_id, trader = random.choice(traders)
                         if not has_farmer and random.random() < 0.5:
                             old_name = trader.name
-                            trader.type = 'FARMER'
-                            trader.props = ENTITY_TYPES['FARMER']
+                            trader.set_type('FARMER')
                             print(f"{old_name} (Trader) settled as a farmer at [{zone_key}]")
                         elif not has_lumberjack and random.random() < 0.5:
                             old_name = trader.name
-                            trader.type = 'LUMBERJACK'
-                            trader.props = ENTITY_TYPES['LUMBERJACK']
+                            trader.set_type('LUMBERJACK')
                             print(f"{old_name} (Trader) settled as a lumberjack at [{zone_key}]")
                         elif not has_miner:
                             old_name = trader.name
-                            trader.type = 'MINER'
-                            trader.props = ENTITY_TYPES['MINER']
+                            trader.set_type('MINER')
                             print(f"{old_name} (Trader) settled as a miner at [{zone_key}]")
 
                     if guards:
                         guard_id, guard = random.choice(guards)
                         if not has_farmer and random.random() < 0.5:
                             old_name = guard.name
-                            guard.type = 'FARMER'
-                            guard.props = ENTITY_TYPES['FARMER']
+                            guard.set_type('FARMER')
                             print(f"{old_name} (Guard) settled as a farmer at [{zone_key}]")
                         elif not has_miner and random.random() < 0.5:
                             old_name = guard.name
-                            guard.type = 'MINER'
-                            guard.props = ENTITY_TYPES['MINER']
+                            guard.set_type('MINER')
                             print(f"{old_name} (Guard) settled as a miner at [{zone_key}]")
 
             if self.tick % 600 == 0:
@@ -628,18 +646,21 @@ class ZonesMixin:
 
         screen = self.screens[struct_zone_key]
         self.screen_last_update[struct_zone_key] = self.tick
+        enchanted = self.enchanted_cells.get(struct_zone_key)
+        grid = screen['grid']
+        growth_rules = CELL_GROWTH_RULES
 
         for y in range(1, GRID_HEIGHT - 1):
             for x in range(1, GRID_WIDTH - 1):
-                if self.is_cell_enchanted(x, y, struct_zone_key):
+                if enchanted and (x, y) in enchanted:
                     continue
-                cell = screen['grid'][y][x]
-                if cell in CELL_TYPES:
-                    cell_info = CELL_TYPES[cell]
-                    if 'grows_to' in cell_info and random.random() < cell_info.get('growth_rate', 0):
-                        self.set_grid_cell(screen, x, y, cell_info['grows_to'])
-                    elif 'degrades_to' in cell_info and random.random() < cell_info.get('degrade_rate', 0):
-                        self.set_grid_cell(screen, x, y, cell_info['degrades_to'])
+                rule = growth_rules.get(grid[y][x])
+                if rule is not None:
+                    grows_to, growth_rate, degrades_to, degrade_rate = rule
+                    if grows_to is not None and random.random() < growth_rate:
+                        self.set_grid_cell(screen, x, y, grows_to)
+                    elif degrades_to is not None and random.random() < degrade_rate:
+                        self.set_grid_cell(screen, x, y, degrades_to)
 
         entity_list = self.screen_entities.get(struct_zone_key, [])
         if not entity_list:
@@ -679,7 +700,7 @@ class ZonesMixin:
 
     def catch_up_entities(self, screen_x, screen_y, cycles):
         """Simplified entity simulation for catch-up with eating, drinking, and healing"""
-        screen_key = f"{screen_x},{screen_y}"
+        screen_key = make_zone_key(screen_x, screen_y)
         if screen_key not in self.screen_entities or screen_key not in self.screens:
             return
 
@@ -707,12 +728,12 @@ class ZonesMixin:
                     for _ in range(hostile_count):
                         spawn_x = random.randint(3, GRID_WIDTH - 4)
                         spawn_y = random.randint(3, GRID_HEIGHT - 4)
-                        if not CELL_TYPES[screen['grid'][spawn_y][spawn_x]].get('solid', False):
+                        if screen['grid'][spawn_y][spawn_x] not in SOLID_CELLS:
                             entity = Entity(hostile_type, spawn_x, spawn_y, screen_x, screen_y, level=1)
                             entity_id = self.next_entity_id
                             self.next_entity_id += 1
                             self.entities[entity_id] = entity
-                            self.screen_entities[screen_key].append(entity_id)
+                            self.screen_entities[screen_key].add(entity_id)
 
                     # Kill a low-level NPC (simulate raid casualty)
                     lowest_entity = None
@@ -764,8 +785,9 @@ class ZonesMixin:
 
         entities_to_remove = []
         entities_to_transition = []
+        heal_field = None  # built on first peaceful entity
 
-        for entity_id in self.screen_entities[screen_key][:]:
+        for entity_id in list(self.screen_entities[screen_key]):
             if entity_id not in self.entities:
                 continue
 
@@ -824,7 +846,7 @@ class ZonesMixin:
                     if random.random() < 0.6:
                         food_value = 30
                         for food in food_sources:
-                            if food.startswith('CARROT'):
+                            if food in CARROT_CELLS:
                                 food_value = 40
                                 break
                             elif food == 'GRASS':
@@ -836,21 +858,10 @@ class ZonesMixin:
                         entity.drink(40)
 
                 heal_boost = 1.0
-                if not entity.props.get('hostile', False):
-                    for dx in range(-3, 4):
-                        for dy in range(-3, 4):
-                            check_x = entity.x + dx
-                            check_y = entity.y + dy
-                            if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                                cell = screen['grid'][check_y][check_x]
-                                if cell == 'CAMP':
-                                    heal_boost = 2.0
-                                    break
-                                elif cell == 'HOUSE':
-                                    heal_boost = 3.0
-                                    break
-                        if heal_boost > 1.0:
-                            break
+                if not entity.is_hostile:
+                    if heal_field is None:
+                        heal_field = self.get_heal_boost_field(screen)
+                    heal_boost = heal_field[entity.y * GRID_WIDTH + entity.x]
 
                 entity.regenerate_health(heal_boost)
 
@@ -871,7 +882,7 @@ class ZonesMixin:
 
                 new_screen_x = screen_x + dx
                 new_screen_y = screen_y + dy
-                new_screen_key = f"{new_screen_x},{new_screen_y}"
+                new_screen_key = make_zone_key(new_screen_x, new_screen_y)
 
                 if new_screen_key not in self.screens:
                     self.generate_screen(new_screen_x, new_screen_y)
@@ -891,7 +902,7 @@ class ZonesMixin:
 
                 if new_screen_key in self.screens:
                     target_screen = self.screens[new_screen_key]
-                    if not CELL_TYPES[target_screen['grid'][new_y][new_x]].get('solid', False):
+                    if target_screen['grid'][new_y][new_x] not in SOLID_CELLS:
                         if screen_key in self.screen_entities and entity_id in self.screen_entities[screen_key]:
                             self.screen_entities[screen_key].remove(entity_id)
 
@@ -901,15 +912,15 @@ class ZonesMixin:
                         entity.y = new_y
 
                         if new_screen_key not in self.screen_entities:
-                            self.screen_entities[new_screen_key] = []
-                        self.screen_entities[new_screen_key].append(entity_id)
+                            self.screen_entities[new_screen_key] = set()
+                        self.screen_entities[new_screen_key].add(entity_id)
 
         for entity_id in entities_to_remove:
             self.remove_entity(entity_id)
 
     def catch_up_screen(self, screen_x, screen_y, cycles_missed):
         """Apply catch-up updates efficiently"""
-        key = f"{screen_x},{screen_y}"
+        key = make_zone_key(screen_x, screen_y)
         if key not in self.screens:
             return
 
@@ -980,7 +991,7 @@ class ZonesMixin:
 
     def on_zone_transition(self, new_screen_x, new_screen_y):
         """When player enters new zone, catch up nearby zones"""
-        new_key = f"{new_screen_x},{new_screen_y}"
+        new_key = make_zone_key(new_screen_x, new_screen_y)
         if new_key in self.screen_last_update:
             cycles = (self.tick - self.screen_last_update[new_key]) // 60
             if cycles > 0:
@@ -988,23 +999,21 @@ class ZonesMixin:
 
         for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
             adj_x, adj_y = new_screen_x + dx, new_screen_y + dy
-            adj_key = f"{adj_x},{adj_y}"
+            adj_key = make_zone_key(adj_x, adj_y)
             if adj_key in self.screens and adj_key in self.screen_last_update:
                 cycles = (self.tick - self.screen_last_update[adj_key]) // 60
                 if cycles >= 5:
                     distance = abs(dx) + abs(dy)
-                    self.catchup_queue.append((distance, adj_x, adj_y, cycles))
+                    heapq.heappush(self.catchup_queue, (distance, adj_x, adj_y, cycles))
 
     def process_catchup_queue(self):
         """Process catch-up queue during idle or safe moments"""
         if not self.catchup_queue:
             return
 
-        self.catchup_queue.sort()
-
         processed = 0
         while self.catchup_queue and processed < MAX_CATCHUP_PER_FRAME:
-            priority, sx, sy, cycles = self.catchup_queue.pop(0)
+            priority, sx, sy, cycles = heapq.heappop(self.catchup_queue)
             self.catch_up_screen(sx, sy, min(cycles, MAX_CYCLES_TO_SIMULATE))
             processed += 1
 
@@ -1016,7 +1025,7 @@ class ZonesMixin:
         """Calculate priority score for a zone. Higher = update sooner."""
         player_x = self.player['screen_x']
         player_y = self.player['screen_y']
-        player_zone = f"{player_x},{player_y}"
+        player_zone = make_zone_key(player_x, player_y)
 
         # player screen_x/y already reflects virtual coords in structure zones — no special case needed
 
@@ -1118,10 +1127,10 @@ class ZonesMixin:
         """Remove None and invalid entity_ids from screen_entities"""
         for screen_key in list(self.screen_entities.keys()):
             if screen_key in self.screen_entities:
-                self.screen_entities[screen_key] = [
+                self.screen_entities[screen_key] = {
                     eid for eid in self.screen_entities[screen_key]
                     if eid is not None and eid in self.entities
-                ]
+                }
                 if not self.screen_entities[screen_key]:
                     del self.screen_entities[screen_key]
 
@@ -1138,7 +1147,7 @@ class ZonesMixin:
             for dy in range(-4, 4):
                 zone_x = player_x + dx
                 zone_y = player_y + dy
-                zone_key = f"{zone_x},{zone_y}"
+                zone_key = make_zone_key(zone_x, zone_y)
 
                 if zone_key not in self.screens:
                     self.generate_screen(zone_x, zone_y)
@@ -1147,7 +1156,7 @@ class ZonesMixin:
 
     def check_zone_biome_shift(self, screen_x, screen_y):
         """Check if zone biome should change based on dominant cell types"""
-        key = f"{screen_x},{screen_y}"
+        key = make_zone_key(screen_x, screen_y)
         if key not in self.screens:
             return
 
@@ -1172,7 +1181,7 @@ class ZonesMixin:
                     cell_counts['DIRT'] += 1
                 elif cell in ['WATER', 'DEEP_WATER']:
                     cell_counts['WATER'] += 1
-                elif cell.startswith('TREE'):
+                elif cell in TREE_CELLS:
                     cell_counts['TREE'] += 1
 
         grass_pct = cell_counts['GRASS'] / total_cells
@@ -1197,21 +1206,87 @@ class ZonesMixin:
             screen['biome'] = new_biome
             print(f"Zone [{screen_x},{screen_y}] biome shifted: {current_biome} → {new_biome}")
 
-    def is_near_structure(self, x, y, screen_key):
-        """Check if cell is near HOUSE/CAMP (within 2 cells)"""
-        if screen_key not in self.screens:
-            return False
+    @staticmethod
+    def find_structure_cells(grid):
+        """Return [(x, y)] for every HOUSE/CAMP cell in grid.
+
+        Zones hold a handful of these, so checking a cell against this list
+        is cheaper than probing its neighbourhood in the grid."""
+        cells = []
+        for y, row in enumerate(grid):
+            if 'HOUSE' not in row and 'CAMP' not in row:
+                continue
+            for x, cell in enumerate(row):
+                if cell == 'HOUSE' or cell == 'CAMP':
+                    cells.append((x, y))
+        return cells
 
-        grid = self.screens[screen_key]['grid']
-        for dy in range(-2, 3):
-            for dx in range(-2, 3):
-                check_x = x + dx
-                check_y = y + dy
-                if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                    if grid[check_y][check_x] in ['HOUSE', 'CAMP']:
-                        return True
+    @staticmethod
+    def near_structure_cells(structure_cells, x, y):
+        """True if (x, y) is within 2 cells (Chebyshev) of any HOUSE/CAMP in a
+        find_structure_cells list."""
+        for sx, sy in structure_cells:
+            if -2 <= sx - x <= 2 and -2 <= sy - y <= 2:
+                return True
         return False
 
+    @staticmethod
+    def is_cobblestone_protected(grid, x, y):
+        """True if COBBLESTONE at interior cell (x, y) must not decay: it lies
+        on a main road (within 2 of either centre line) or touches a structure."""
+        if abs(y - GRID_HEIGHT // 2) <= 2 or abs(x - GRID_WIDTH // 2) <= 2:
+            return True
+        # Interior cells always have all four neighbours in bounds
+        row = grid[y]
+        return (row[x - 1] in COBBLESTONE_ANCHOR_CELLS
+                or row[x + 1] in COBBLESTONE_ANCHOR_CELLS
+                or grid[y - 1][x] in COBBLESTONE_ANCHOR_CELLS
+                or grid[y + 1][x] in COBBLESTONE_ANCHOR_CELLS)
+
+    @staticmethod
+    def build_heal_boost_field(grid):
+        """Return a flat row-major list giving the heal multiplier for every
+        cell of grid. A cell within 3 (Chebyshev) of a CAMP or HOUSE gets
+        CAMP_HEALING_MULTIPLIER or HOUSE_HEALING_MULTIPLIER from the first one
+        a 7×7 probe around it meets, scanning column by column (left to right,
+        each top to bottom); every other cell gets 1.0."""
+        structures = []
+        for y, row in enumerate(grid):
+            if 'CAMP' not in row and 'HOUSE' not in row:
+                continue
+            for x, cell in enumerate(row):
+                if cell == 'HOUSE':
+                    structures.append((x, y, HOUSE_HEALING_MULTIPLIER))
+                elif cell == 'CAMP':
+                    structures.append((x, y, CAMP_HEALING_MULTIPLIER))
+        # Paint in reverse probe order so the first structure met is written last
+        structures.sort(reverse=True)
+        field = [1.0] * (GRID_WIDTH * GRID_HEIGHT)
+        for x, y, boost in structures:
+            x0, x1 = max(0, x - 3), min(GRID_WIDTH, x + 4)
+            fill = [boost] * (x1 - x0)
+            for fy in range(max(0, y - 3), min(GRID_HEIGHT, y + 4)):
+                base = fy * GRID_WIDTH
+                field[base + x0:base + x1] = fill
+        return field
+
+    def get_heal_boost_field(self, screen):
+        """Return screen's heal boost field, building it on first use.
+
+        The field is kept on the screen so peaceful entities do a single
+        lookup instead of probing their 7×7 neighbourhood each pass; it is
+        dropped whenever a CAMP or HOUSE there is placed or removed."""
+        field = screen.get('heal_boost_field')
+        if field is None:
+            field = screen['heal_boost_field'] = self.build_heal_boost_field(screen['grid'])
+        return field
+
+    @staticmethod
+    def invalidate_heal_boost_field(screen):
+        """Forget screen's cached heal boost field (call after a CAMP or HOUSE
+        cell is written directly instead of through set_grid_cell)"""
+        screen.pop('heal_boost_field', None)
+
     def update_single_cell(self, screen_x, screen_y, x, y):
         """Apply cellular automata rules to a single cell"""
         from constants import (
@@ -1222,7 +1297,7 @@ class ZonesMixin:
             BIOME_SPREAD_RATE,
         )
 
-        key = f"{screen_x},{screen_y}"
+        key = make_zone_key(screen_x, screen_y)
         if key not in self.screens:
             return
 
@@ -1287,7 +1362,7 @@ class ZonesMixin:
         elif cell == 'FLOWER' and (flower_count >= 4 or total_water == 0):
             if random.random() < FLOWER_DECAY_RATE:
                 new_cell = 'GRASS'
-        elif cell.startswith('TREE') and tree_count >= 4:
+        elif cell in TREE_CELLS and tree_count >= 4:
             if random.random() < TREE_DECAY_RATE:
                 new_cell = 'GRASS'
 